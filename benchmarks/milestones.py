@@ -0,0 +1,381 @@
+"""
+Cross-milestone performance comparison harness.
+
+Loads the engine of every frozen milestone (milestones/ml1, ml2, ml3) and
+of the current tree (src) in isolation, runs the same workload against each
+and prints a comparison table. Every engine is compared with the one before
+it; a throughput loss above the threshold is a regression and makes the
+harness exit non-zero.
+
+Timings are noisy, so every workload is first run a few times untimed,
+then timed repeatedly with the engines alternating between runs (in
+reverse order every other round), so slow phases of the machine hit every
+engine alike. Throughput is the median of the runs and the spread is their
+relative interquartile range; a loss above the threshold that is still
+within the combined spread of the two engines is reported as NOISE and
+does not fail the run.
+
+The engines use bare imports (``from modes import ...``) and share module
+names, so each one is imported with its own directory at the front of
+sys.path and a clean slate of those module names in sys.modules. Modules a
+milestone never shipped (ml1 and ml2 have no utils.py or csprng.py) are
+borrowed from the nearest later milestone that has them; the table lists
+what was borrowed. The current tree is the cryptocore package, so its
+modules are imported by their package names.
+
+Usage:
+    python -m benchmarks.milestones [--engines ml1,ml2,ml3,src] [--size 64K] [--threshold 0.1]
+                                    [--repeat 9] [--warmup 2]
+"""
+import argparse
+import importlib
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from functools import partial
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+MILESTONES_DIR = os.path.join(ROOT, 'milestones')
+SRC_DIR = os.path.join(ROOT, 'src')
+
+MODES = ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']
+KEY = b'\x00' * 16
+IV = b'\x00' * 16
+
+# Untimed runs of every workload before timing starts
+WARMUP = 2
+
+def discover_engines():
+    """Return (name, directory) for every milestone in order, then src"""
+    engines = []
+    if os.path.isdir(MILESTONES_DIR):
+        for name in sorted(os.listdir(MILESTONES_DIR)):
+            directory = os.path.join(MILESTONES_DIR, name)
+            if os.path.isfile(os.path.join(directory, 'modes.py')):
+                engines.append((name, directory))
+    engines.append(('src', SRC_DIR))
+    return engines
+
+def engine_modules(directories):
+    """Names of all top-level modules shipped by any engine directory"""
+    names = set()
+    for directory in directories:
+        for filename in os.listdir(directory):
+            if filename.endswith('.py'):
+                names.add(filename[:-3])
+    return names
+
+def engine_prefix(directory):
+    """Module name prefix of an engine: the package name for src, none for the flat milestones"""
+    return 'cryptocore.' if os.path.isfile(os.path.join(directory, 'cryptocore', '__init__.py')) else ''
+
+def is_engine_dir(path):
+    """Check whether a sys.path entry holds an engine (and must be hidden)"""
+    return os.path.isfile(os.path.join(path or '.', 'modes.py'))
+
+@contextmanager
+def isolated_imports(search_path, module_names, loaded=None):
+    """
+    Import engine modules from search_path only
+    
+    While the context is active, module_names are removed from sys.modules
+    and every other engine directory is removed from sys.path. Both are
+    restored on exit, so engines never see each other's modules. Modules
+    in the loaded dict are installed on entry and the dict is updated on
+    exit, so an engine can be entered again without re-importing it.
+    """
+    saved_path = list(sys.path)
+    saved_modules = {name: sys.modules.pop(name) for name in module_names if name in sys.modules}
+    sys.path[:] = list(search_path) + [path for path in saved_path if not is_engine_dir(path)]
+    if loaded:
+        sys.modules.update(loaded)
+    try:
+        yield
+    finally:
+        if loaded is not None:
+            loaded.update({name: sys.modules[name] for name in module_names if name in sys.modules})
+        for name in module_names:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved_modules)
+        sys.path[:] = saved_path
+
+def load_engine(name, directory, fallbacks, module_names):
+    """
+    Import one engine's modes and crypto modules in isolation
+    
+    Returns:
+        dict: name, search_path, modules (the engine's loaded modules),
+            borrowed (module -> engine) and error (None on success)
+    """
+    engine = {'name': name, 'search_path': [directory] + [path for _, path in fallbacks],
+              'prefix': engine_prefix(directory), 'modules': {}, 'borrowed': {}, 'error': None}
+    
+    with isolated_imports(engine['search_path'], module_names, engine['modules']):
+        try:
+            importlib.import_module(engine['prefix'] + 'modes')
+            importlib.import_module(engine['prefix'] + 'crypto')
+        except Exception as e:
+            engine['error'] = f"{type(e).__name__}: {e}"
+        
+        # Record which modules did not come from the engine's own directory
+        for module_name in module_names:
+            module = sys.modules.get(module_name)
+            module_file = getattr(module, '__file__', None)
+            if module_file and os.path.dirname(os.path.abspath(module_file)) != os.path.abspath(directory):
+                for fallback_name, path in fallbacks:
+                    if os.path.dirname(os.path.abspath(module_file)) == os.path.abspath(path):
+                        engine['borrowed'][module_name] = fallback_name
+    
+    return engine
+
+def build_workloads(modes_module, crypto_module, data, workdir):
+    """
+    Prepare the shared workload for one engine
+    
+    Returns:
+        tuple: (workload name -> callable, function raising ValueError
+            unless the last file round trip reproduced data)
+    """
+    workloads = {}
+    for mode in MODES:
+        encrypt = getattr(modes_module, f'{mode}_encrypt')
+        decrypt = getattr(modes_module, f'{mode}_decrypt')
+        args = (KEY,) if mode == 'ecb' else (KEY, IV)
+        ciphertext = encrypt(data, *args)
+        workloads[f'{mode} encrypt'] = partial(encrypt, data, *args)
+        workloads[f'{mode} decrypt'] = partial(decrypt, ciphertext, *args)
+    
+    # File round trip through the engine's own file pipeline; the IV is
+    # prepended to the file, so decryption reads it back from the head
+    plain_file = os.path.join(workdir, 'plain.bin')
+    cipher_file = os.path.join(workdir, 'cipher.bin')
+    output_file = os.path.join(workdir, 'output.bin')
+    with open(plain_file, 'wb') as f:
+        f.write(data)
+    key_hex = KEY.hex()
+    workloads['file encrypt'] = partial(crypto_module.encrypt_file, 'aes', 'cbc', key_hex,
+                                        plain_file, cipher_file, IV.hex())
+    workloads['file decrypt'] = partial(crypto_module.decrypt_file, 'aes', 'cbc', key_hex,
+                                        cipher_file, output_file, None)
+    
+    def check_roundtrip():
+        with open(output_file, 'rb') as f:
+            if f.read() != data:
+                raise ValueError("File round trip does not reproduce the input")
+    
+    return workloads, check_roundtrip
+
+def summarize(timings, size):
+    """MB/s of the median run and the relative interquartile range of the runs"""
+    median = statistics.median(timings)
+    spread = 0.0
+    if len(timings) >= 2:
+        lower, _, upper = statistics.quantiles(timings, n=4)
+        spread = (upper - lower) / median
+    return size / median / (1024 * 1024), spread
+
+def measure_engines(engines, module_names, size, repeat, warmup=WARMUP):
+    """
+    Load engines in isolation and run the workload against them in turn
+    
+    Every round runs each workload once per engine, with the engine order
+    reversed every other round; the first warmup rounds are not timed.
+    
+    Args:
+        engines (list): (name, directory, fallbacks) per engine
+        module_names (set): Module names any engine may ship
+        size (int): Workload input size
+        repeat (int): Timed rounds
+        warmup (int): Untimed rounds before them
+    
+    Returns:
+        list: Per engine dicts with name, throughput (workload -> MB/s),
+            spread (workload -> relative IQR), borrowed and error
+    """
+    data = bytes(size)
+    loaded = [load_engine(name, directory, fallbacks, module_names) for name, directory, fallbacks in engines]
+    workloads, checks, timings = {}, {}, {}
+    workdir = tempfile.mkdtemp(prefix='cryptocore-milestones-')
+    try:
+        for engine in loaded:
+            if engine['error']:
+                continue
+            name = engine['name']
+            with isolated_imports(engine['search_path'], module_names, engine['modules']):
+                try:
+                    engine_dir = os.path.join(workdir, name)
+                    os.mkdir(engine_dir)
+                    prefix = engine['prefix']
+                    workloads[name], checks[name] = build_workloads(sys.modules[prefix + 'modes'],
+                                                                    sys.modules[prefix + 'crypto'],
+                                                                    data, engine_dir)
+                except Exception as e:
+                    engine['error'] = f"{type(e).__name__}: {e}"
+            timings[name] = {workload: [] for workload in workloads.get(name, {})}
+        
+        names = list(next(iter(workloads.values()), {}))
+        for round_number in range(warmup + repeat):
+            order = loaded if round_number % 2 == 0 else loaded[::-1]
+            for workload in names:
+                for engine in order:
+                    if engine['error']:
+                        continue
+                    name = engine['name']
+                    with isolated_imports(engine['search_path'], module_names, engine['modules']):
+                        try:
+                            start = time.perf_counter()
+                            workloads[name][workload]()
+                            elapsed = time.perf_counter() - start
+                            if workload == 'file decrypt':
+                                checks[name]()
+                        except Exception as e:
+                            engine['error'] = f"{type(e).__name__}: {e}"
+                            continue
+                    if round_number >= warmup:
+                        timings[name][workload].append(elapsed)
+    finally:
+        shutil.rmtree(workdir)
+    
+    results = []
+    for engine in loaded:
+        result = {'name': engine['name'], 'throughput': {}, 'spread': {},
+                  'borrowed': engine['borrowed'], 'error': engine['error']}
+        if not engine['error']:
+            for workload, samples in timings[engine['name']].items():
+                result['throughput'][workload], result['spread'][workload] = summarize(samples, size)
+        results.append(result)
+    return results
+
+def measure_engine(name, directory, fallbacks, module_names, size, repeat, warmup=WARMUP):
+    """Load one engine in isolation and run the workload against it (see measure_engines)"""
+    return measure_engines([(name, directory, fallbacks)], module_names, size, repeat, warmup)[0]
+
+def compare_engines(results, threshold):
+    """
+    Build comparison rows, each engine against the previous successful one
+    
+    A loss above threshold only fails when it is also larger than the
+    spread of the two engines' runs; otherwise it is reported as NOISE.
+    
+    Returns:
+        tuple: (rows, passed) where rows are (workload, [MB/s per engine],
+            [change vs previous engine], [status per engine])
+    """
+    workloads = []
+    for result in results:
+        for workload in result['throughput']:
+            if workload not in workloads:
+                workloads.append(workload)
+    
+    rows = []
+    passed = True
+    for workload in workloads:
+        speeds, changes, statuses = [], [], []
+        previous = None
+        previous_spread = 0.0
+        for result in results:
+            speed = result['throughput'].get(workload)
+            spread = result.get('spread', {}).get(workload, 0.0)
+            speeds.append(speed)
+            if speed is None or previous is None:
+                changes.append(None)
+                statuses.append('-' if speed is None else 'base')
+            else:
+                change = (speed - previous) / previous
+                changes.append(change)
+                if change >= -threshold:
+                    statuses.append('PASS')
+                elif -change <= spread + previous_spread:
+                    statuses.append('NOISE')
+                else:
+                    statuses.append('FAIL')
+                    passed = False
+            if speed is not None:
+                previous, previous_spread = speed, spread
+        rows.append((workload, speeds, changes, statuses))
+    
+    return rows, passed
+
+def print_table(results, rows, threshold):
+    names = [result['name'] for result in results]
+    header = f"{'workload':<14}" + ''.join(f"{name:>32}" for name in names)
+    print(header)
+    print('-' * len(header))
+    
+    for workload, speeds, changes, statuses in rows:
+        cells = []
+        for result, speed, change, status in zip(results, speeds, changes, statuses):
+            spread = result.get('spread', {}).get(workload, 0.0)
+            if speed is None:
+                cells.append(f"{'n/a':>32}")
+            elif change is None:
+                cells.append(f"{speed:>10.2f} MB/s \u00b1{spread:<4.0%} {status:>8}")
+            else:
+                cells.append(f"{speed:>10.2f} MB/s \u00b1{spread:<4.0%} {change:>+5.0%} {status}")
+        print(f"{workload:<14}" + ''.join(f"{cell:>32}" for cell in cells))
+    
+    print()
+    print(f"Regression threshold: {threshold:.0%} throughput loss against the previous engine, "
+          f"beyond the spread (interquartile range) of both engines' runs")
+    for result in results:
+        if result['error']:
+            print(f"[{result['name']}] unavailable: {result['error']}")
+        if result['borrowed']:
+            borrowed = ', '.join(f"{module} from {source}" for module, source in sorted(result['borrowed'].items()))
+            print(f"[{result['name']}] borrowed modules: {borrowed}")
+
+def parse_size(text):
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(text[:-1]) * units[text[-1]]
+    return int(text)
+
+def main():
+    parser = argparse.ArgumentParser(description='CryptoCore cross-milestone comparison')
+    parser.add_argument('--engines', help='Comma-separated engines in order (default: all milestones, then src)')
+    parser.add_argument('--size', default='64K',
+                        help='Workload input size (default: 64K; the early engines are quadratic)')
+    parser.add_argument('--repeat', type=int, default=9, help='Timed runs per workload (median is kept)')
+    parser.add_argument('--warmup', type=int, default=WARMUP, help='Untimed runs per workload first')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed throughput loss (0.1 = 10%%)')
+    args = parser.parse_args()
+    
+    available = discover_engines()
+    if args.engines:
+        by_name = dict(available)
+        names = [name.strip() for name in args.engines.split(',') if name.strip()]
+        for name in names:
+            if name not in by_name:
+                parser.error(f"Unknown engine: {name}")
+        engines = [(name, by_name[name]) for name in names]
+    else:
+        engines = available
+    
+    module_names = engine_modules([directory for _, directory in available])
+    milestones = [(name, directory) for name, directory in available if name != 'src']
+    size = parse_size(args.size)
+    
+    if args.repeat < 1 or args.warmup < 0:
+        parser.error("--repeat must be positive and --warmup must not be negative")
+    
+    plan = []
+    for name, directory in engines:
+        # Missing modules come from the nearest later milestone
+        later = milestones[[n for n, _ in milestones].index(name) + 1:] if name in dict(milestones) else []
+        plan.append((name, directory, later))
+    print(f"[INFO] Measuring {', '.join(name for name, _ in engines)} "
+          f"({args.warmup} warmup + {args.repeat} timed rounds)...", file=sys.stderr)
+    results = measure_engines(plan, module_names, size, args.repeat, args.warmup)
+    
+    rows, passed = compare_engines(results, args.threshold)
+    print_table(results, rows, args.threshold)
+    print("RESULT: PASS" if passed else "RESULT: FAIL")
+    return 0 if passed else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
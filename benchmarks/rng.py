@@ -0,0 +1,80 @@
+"""
+Random generator benchmark.
+
+Compares the throughput of the OS-backed generate_random_bytes() with the
+AES CTR_DRBG (shared generate_drbg_bytes() and a dedicated CtrDrbg filling
+a reused buffer) across request sizes.
+
+Usage:
+    python -m benchmarks.rng [--sizes 16,4K,1M,64M] [--repeat 3] [--output rng.json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from benchmarks.scaling import parse_size
+from cryptocore.csprng import generate_random_bytes, generate_drbg_bytes, CtrDrbg
+
+SIZE_CLASSES = ['16', '4K', '64K', '1M', '64M']
+
+# Small requests are repeated until roughly this many bytes were produced
+TARGET_BYTES = 16 * 1024 * 1024
+
+def generators():
+    """Return name -> callable(size) for every generator under test"""
+    drbg = CtrDrbg()
+    buffers = {}
+    
+    def drbg_into(size):
+        buffer = buffers.setdefault(size, bytearray(size))
+        drbg.generate_into(buffer)
+    
+    return {
+        'urandom': generate_random_bytes,
+        'drbg': generate_drbg_bytes,
+        'drbg_into': drbg_into,
+    }
+
+def measure(generate, size, repeat=3):
+    """Best MB/s of generating size-byte requests"""
+    calls = max(1, TARGET_BYTES // size)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            generate(size)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return calls * size / best / (1024 * 1024)
+
+def run(sizes, repeat):
+    """Measure every generator at every size; returns a list of result dicts"""
+    results = []
+    for name, generate in generators().items():
+        for size in sizes:
+            mb_per_s = measure(generate, size, repeat)
+            results.append({'generator': name, 'size': size, 'mb_per_s': mb_per_s})
+            print(f"{name:<10} {size:>10} B  {mb_per_s:10.2f} MB/s", file=sys.stderr)
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description='CryptoCore random generator benchmark')
+    parser.add_argument('--sizes', default=','.join(SIZE_CLASSES), help='Comma-separated request sizes')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (best is kept)')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    args = parser.parse_args()
+    
+    sizes = [parse_size(size) for size in args.sizes.split(',') if size.strip()]
+    results = run(sizes, args.repeat)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'results': results}, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
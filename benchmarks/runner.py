@@ -0,0 +1,262 @@
+"""
+Benchmark runner for the CryptoCore engine.
+
+Measures throughput (MB/s), per-block latency and peak RSS for every mode,
+for encryption and decryption, across size classes from 16 B to multi-GB.
+Covers the in-memory mode functions and encrypt_file/decrypt_file on both
+I/O paths. Every case runs in its own subprocess so peak RSS is per case.
+Results are emitted as JSON so runs can be compared.
+
+Usage:
+    python -m benchmarks.runner [--max-size 64M] [--output results.json]
+    python -m benchmarks.runner --baseline old.json --output new.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from benchmarks.scaling import parse_size
+
+MODES = ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']
+OPERATIONS = ['encrypt', 'decrypt']
+TARGETS = ['memory', 'file']
+IO_MODES = ['buffered', 'mmap']
+SIZE_CLASSES = ['16', '1K', '64K', '1M', '16M', '256M', '1G', '4G']
+
+KEY = b'\x00' * 16
+KEY_HEX = KEY.hex()
+IV = b'\x00' * 16
+
+# Write large benchmark inputs in pieces so generating them stays cheap
+FILL_CHUNK_SIZE = 16 * 1024 * 1024
+
+def peak_rss_kb():
+    """Peak resident set size of this process in KB (None where unsupported)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def mode_functions(mode):
+    """Return (encrypt, decrypt) callables taking only the data"""
+    from cryptocore import modes
+    encrypt = getattr(modes, f'{mode}_encrypt')
+    decrypt = getattr(modes, f'{mode}_decrypt')
+    if mode == 'ecb':
+        return (lambda data: encrypt(data, KEY)), (lambda data: decrypt(data, KEY))
+    return (lambda data: encrypt(data, KEY, IV)), (lambda data: decrypt(data, KEY, IV))
+
+def best_time(function, repeat):
+    """Return the best wall-clock time of calling function repeat times"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def fill_file(filename, size):
+    """Write size zero bytes to filename"""
+    chunk = bytes(min(size, FILL_CHUNK_SIZE))
+    with open(filename, 'wb') as f:
+        remaining = size
+        while remaining > 0:
+            f.write(chunk[:remaining])
+            remaining -= len(chunk)
+
+def run_memory_case(mode, operation, size, repeat):
+    """Time a one-shot mode function on size bytes"""
+    encrypt, decrypt = mode_functions(mode)
+    data = bytes(size)
+    if operation == 'decrypt':
+        data = encrypt(data)
+        return best_time(lambda: decrypt(data), repeat)
+    return best_time(lambda: encrypt(data), repeat)
+
+def run_file_case(mode, operation, size, io_mode, repeat):
+    """Time encrypt_file or decrypt_file on a size-byte file"""
+    from cryptocore.crypto import encrypt_file, decrypt_file
+    
+    workdir = tempfile.mkdtemp(prefix='cryptocore-bench-')
+    plain_file = os.path.join(workdir, 'plain.bin')
+    cipher_file = os.path.join(workdir, 'cipher.bin')
+    output_file = os.path.join(workdir, 'output.bin')
+    iv_hex = None if mode == 'ecb' else IV.hex()
+    try:
+        fill_file(plain_file, size)
+        if operation == 'encrypt':
+            run = lambda: encrypt_file('aes', mode, KEY_HEX, plain_file, output_file, iv_hex, io_mode=io_mode)
+        else:
+            encrypt_file('aes', mode, KEY_HEX, plain_file, cipher_file, iv_hex, io_mode=io_mode)
+            run = lambda: decrypt_file('aes', mode, KEY_HEX, cipher_file, output_file, io_mode=io_mode)
+        return best_time(run, repeat)
+    finally:
+        for filename in [plain_file, cipher_file, output_file]:
+            if os.path.exists(filename):
+                os.unlink(filename)
+        os.rmdir(workdir)
+
+def run_case(case):
+    """
+    Run one benchmark case in this process
+    
+    Args:
+        case (dict): target, mode, operation, size, io and repeat
+        
+    Returns:
+        dict: The case extended with seconds, mb_per_s, block_latency_us
+            and peak_rss_kb
+    """
+    size = case['size']
+    if case['target'] == 'memory':
+        seconds = run_memory_case(case['mode'], case['operation'], size, case['repeat'])
+    else:
+        seconds = run_file_case(case['mode'], case['operation'], size, case['io'], case['repeat'])
+    
+    num_blocks = max(1, (size + 15) // 16)
+    result = dict(case)
+    result['seconds'] = seconds
+    result['mb_per_s'] = size / seconds / (1024 * 1024) if seconds else None
+    result['block_latency_us'] = seconds / num_blocks * 1e6
+    result['peak_rss_kb'] = peak_rss_kb()
+    return result
+
+def run_case_isolated(case):
+    """Run one case in a fresh interpreter so peak RSS is measured per case"""
+    completed = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.runner', '--case', json.dumps(case)],
+        cwd=os.path.join(os.path.dirname(__file__), '..'),
+        capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        result = dict(case)
+        result['error'] = completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else 'failed'
+        return result
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def build_cases(modes, operations, targets, sizes, repeat):
+    """Expand the benchmark matrix into a list of cases"""
+    cases = []
+    for target in targets:
+        io_modes = IO_MODES if target == 'file' else [None]
+        for io_mode in io_modes:
+            for mode in modes:
+                for operation in operations:
+                    for size in sizes:
+                        # Large inputs take long enough that one run is representative
+                        runs = repeat if size <= 16 * 1024 * 1024 else 1
+                        cases.append({'target': target, 'io': io_mode, 'mode': mode,
+                                      'operation': operation, 'size': size, 'repeat': runs})
+    return cases
+
+def case_key(result):
+    """Key that identifies the same case across runs"""
+    return (result['target'], result.get('io'), result['mode'], result['operation'], result['size'])
+
+def compare_results(baseline, current, threshold):
+    """
+    Compare two result lists by throughput
+    
+    Args:
+        baseline (list): Results of the reference run
+        current (list): Results of the new run
+        threshold (float): Allowed relative throughput loss (0.1 = 10%)
+        
+    Returns:
+        list: (key, baseline MB/s, current MB/s, change, passed) tuples for
+            every case present in both runs
+    """
+    reference = {case_key(result): result for result in baseline if result.get('mb_per_s')}
+    rows = []
+    for result in current:
+        key = case_key(result)
+        if key not in reference or not result.get('mb_per_s'):
+            continue
+        old = reference[key]['mb_per_s']
+        new = result['mb_per_s']
+        change = (new - old) / old
+        rows.append((key, old, new, change, change >= -threshold))
+    return rows
+
+def describe(result):
+    target = result['target'] if not result.get('io') else f"{result['target']}/{result['io']}"
+    return f"{target:<13} {result['mode']:<4} {result['operation']:<8} {result['size']:>12}"
+
+def main():
+    parser = argparse.ArgumentParser(description='CryptoCore benchmark suite')
+    parser.add_argument('--modes', default=','.join(MODES), help='Comma-separated modes')
+    parser.add_argument('--operations', default=','.join(OPERATIONS), help='Comma-separated operations')
+    parser.add_argument('--targets', default=','.join(TARGETS), help='Comma-separated targets (memory, file)')
+    parser.add_argument('--sizes', default=','.join(SIZE_CLASSES), help='Comma-separated size classes')
+    parser.add_argument('--max-size', default='64M', help='Skip size classes above this (default: 64M)')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per case (best is kept)')
+    parser.add_argument('--output', help='Write JSON results to this file (default: stdout)')
+    parser.add_argument('--baseline', help='Compare against a previous JSON results file')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed throughput loss vs baseline')
+    parser.add_argument('--case', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.case:
+        # Child process: run a single case and report it on stdout
+        print(json.dumps(run_case(json.loads(args.case))))
+        return 0
+    
+    max_size = parse_size(args.max_size)
+    sizes = [parse_size(size) for size in args.sizes.split(',') if size.strip()]
+    sizes = [size for size in sizes if size <= max_size]
+    cases = build_cases(args.modes.split(','), args.operations.split(','),
+                        args.targets.split(','), sizes, args.repeat)
+    
+    results = []
+    for case in cases:
+        result = run_case_isolated(case)
+        results.append(result)
+        if 'error' in result:
+            print(f"{describe(result)}  ERROR: {result['error']}", file=sys.stderr)
+        else:
+            print(f"{describe(result)}  {result['mb_per_s'] or 0:10.2f} MB/s  "
+                  f"{result['block_latency_us']:8.3f} us/block  {result['peak_rss_kb']} KB",
+                  file=sys.stderr)
+    
+    report = {
+        'metadata': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+        },
+        'results': results,
+    }
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        rows = compare_results(baseline, results, args.threshold)
+        failed = [row for row in rows if not row[4]]
+        for key, old, new, change, passed in rows:
+            status = "PASS" if passed else "FAIL"
+            print(f"{status} {key}: {old:.2f} -> {new:.2f} MB/s ({change:+.1%})", file=sys.stderr)
+        return 1 if failed else 0
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Linear scaling regression benchmark for the mode engine.
+
+Encrypts inputs growing from 1 KB up to 1 GB with every mode and checks
+that the time spent per megabyte stays flat. A quadratic engine (for example
+one that grows its output with ``bytes +=``) fails this check long before
+the largest size is reached.
+
+Usage:
+    python -m benchmarks.scaling [--max-size 1G] [--modes ecb,ctr] [--tolerance 3.0]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.modes import ecb_encrypt, cbc_encrypt, cfb_encrypt, ofb_encrypt, ctr_encrypt
+
+KEY = b'\x00' * 16
+IV = b'\x00' * 16
+
+ENCRYPTORS = {
+    'ecb': lambda data: ecb_encrypt(data, KEY),
+    'cbc': lambda data: cbc_encrypt(data, KEY, IV),
+    'cfb': lambda data: cfb_encrypt(data, KEY, IV),
+    'ofb': lambda data: ofb_encrypt(data, KEY, IV),
+    'ctr': lambda data: ctr_encrypt(data, KEY, IV),
+}
+
+# Sizes below this are dominated by fixed setup cost and only reported
+MIN_MEASURED_SIZE = 256 * 1024
+
+def parse_size(text):
+    """Parse a size such as '1024', '64K', '200M' or '1G' into bytes"""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(text[:-1]) * units[text[-1]]
+    return int(text)
+
+def size_classes(min_size=1024, max_size=1024 ** 3, factor=4):
+    """Return geometrically growing input sizes from min_size to max_size"""
+    sizes = []
+    size = min_size
+    while size <= max_size:
+        sizes.append(size)
+        size *= factor
+    return sizes
+
+def time_encrypt(encrypt, size, repeat=3):
+    """Return the best wall-clock time of encrypting size bytes"""
+    data = bytes(size)
+    if repeat > 1:
+        # Untimed warm-up run so allocator and cache state do not skew the first sample
+        encrypt(data)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encrypt(data)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def check_scaling(timings, tolerance, min_size=MIN_MEASURED_SIZE):
+    """
+    Check that seconds-per-byte does not grow with input size
+    
+    Args:
+        timings (list): (size, seconds) pairs in increasing size order
+        tolerance (float): Allowed ratio between the slowest and the
+            fastest per-byte cost among the measured sizes
+        min_size (int): Smallest size taken into account
+        
+    Returns:
+        tuple: (passed, ratio)
+    """
+    per_byte = [seconds / size for size, seconds in timings if size >= min_size]
+    if len(per_byte) < 2:
+        return True, 1.0
+    ratio = max(per_byte) / min(per_byte)
+    return ratio <= tolerance, ratio
+
+def run(modes, sizes, tolerance, repeat=3):
+    """Run the scaling benchmark and return True if every mode scales linearly"""
+    all_passed = True
+    
+    for mode in modes:
+        print(f"[{mode.upper()}]")
+        timings = []
+        for size in sizes:
+            # Large inputs take long enough that one run is representative
+            runs = repeat if size <= 16 * 1024 * 1024 else 1
+            seconds = time_encrypt(ENCRYPTORS[mode], size, runs)
+            timings.append((size, seconds))
+            mb_per_s = size / seconds / (1024 * 1024) if seconds else float('inf')
+            print(f"  {size:>12} bytes  {seconds:10.4f} s  {mb_per_s:10.2f} MB/s")
+        
+        passed, ratio = check_scaling(timings, tolerance)
+        status = "PASS" if passed else "FAIL"
+        print(f"  {status}: per-byte cost ratio {ratio:.2f} (tolerance {tolerance})")
+        all_passed = all_passed and passed
+    
+    return all_passed
+
+def main():
+    parser = argparse.ArgumentParser(description='CryptoCore linear scaling benchmark')
+    parser.add_argument('--min-size', default='1K', help='Smallest input size (default: 1K)')
+    parser.add_argument('--max-size', default='1G', help='Largest input size (default: 1G)')
+    parser.add_argument('--modes', default='ecb,cbc,cfb,ofb,ctr', help='Comma-separated modes to run')
+    parser.add_argument('--tolerance', type=float, default=3.0, help='Allowed per-byte cost ratio')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per size (best is kept)')
+    args = parser.parse_args()
+    
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    for mode in modes:
+        if mode not in ENCRYPTORS:
+            parser.error(f"Unknown mode: {mode}")
+    
+    sizes = size_classes(parse_size(args.min_size), parse_size(args.max_size))
+    passed = run(modes, sizes, args.tolerance, args.repeat)
+    return 0 if passed else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
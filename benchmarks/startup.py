@@ -0,0 +1,141 @@
+"""
+CLI cold-start benchmark.
+
+Runs src/main.py in fresh interpreters under `python -X importtime` for
+commands that should stay cheap (--help, a usage error, keygen) and for a
+small encryption, and records the best wall time, total import time and
+the heaviest top-level imports of each. Results are emitted as JSON so
+runs can be compared.
+
+Usage:
+    python -m benchmarks.startup [--repeat 10] [--output startup.json]
+    python -m benchmarks.startup --baseline old.json --threshold 0.2
+"""
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+MAIN = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+
+KEY_HEX = '00' * 16
+
+# Top-level imports listed per command
+TOP_IMPORTS = 5
+
+def build_commands(workdir):
+    """Return name -> main.py arguments for every measured command"""
+    source = os.path.join(workdir, 'input.txt')
+    with open(source, 'wb') as f:
+        f.write(b'startup benchmark\n')
+    return {
+        'help': ['--help'],
+        'usage_error': [],
+        'keygen': ['keygen', '--count', '1', '--output', os.path.join(workdir, 'keys.txt')],
+        'encrypt': ['--algorithm', 'aes', '--mode', 'ctr', '--encrypt', '--key', KEY_HEX,
+                    '--input', source, '--output', os.path.join(workdir, 'input.enc')],
+    }
+
+def parse_importtime(stderr):
+    """
+    Parse -X importtime output
+    
+    Returns:
+        tuple: (total self time in us, list of (module, cumulative us) for
+            top-level imports, heaviest first)
+    """
+    total = 0
+    top = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total += int(self_us)
+        if not name.startswith('  '):
+            top.append((name.strip(), int(cumulative_us)))
+    top.sort(key=lambda item: item[1], reverse=True)
+    return total, top
+
+def measure(args, repeat):
+    """Best wall time and import time of running main.py with args"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        completed = subprocess.run([sys.executable, '-X', 'importtime', MAIN] + args,
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        wall_ms = (time.perf_counter() - start) * 1000
+        import_us, top = parse_importtime(completed.stderr)
+        result = {
+            'wall_ms': wall_ms,
+            'import_ms': import_us / 1000,
+            'modules': sum(1 for line in completed.stderr.splitlines() if line.startswith('import time:')) - 1,
+            'top_imports': [{'module': name, 'ms': us / 1000} for name, us in top[:TOP_IMPORTS]],
+            'exit_code': completed.returncode,
+        }
+        if best is None or result['wall_ms'] < best['wall_ms']:
+            best = result
+    return best
+
+def compare_results(baseline, current, threshold):
+    """
+    Compare two runs command by command
+    
+    Returns:
+        list: (command, baseline ms, current ms, change, passed) tuples on
+            import time; passed is False when it grew by more than threshold
+    """
+    reference = {result['command']: result for result in baseline}
+    rows = []
+    for result in current:
+        if result['command'] not in reference:
+            continue
+        old = reference[result['command']]['import_ms']
+        new = result['import_ms']
+        change = (new - old) / old if old else 0.0
+        rows.append((result['command'], old, new, change, change <= threshold))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description='CryptoCore CLI startup benchmark')
+    parser.add_argument('--repeat', type=int, default=10, help='Runs per command (fastest is kept)')
+    parser.add_argument('--output', help='Write JSON results to this file (default: stdout)')
+    parser.add_argument('--baseline', help='Compare against a previous JSON results file')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed import time growth vs baseline')
+    args = parser.parse_args()
+    
+    workdir = tempfile.mkdtemp()
+    try:
+        results = []
+        for name, command in build_commands(workdir).items():
+            result = measure(command, args.repeat)
+            result['command'] = name
+            results.append(result)
+            heaviest = ', '.join(f"{item['module']} {item['ms']:.1f}" for item in result['top_imports'][:3])
+            print(f"{name:<12} {result['wall_ms']:8.1f} ms wall  {result['import_ms']:8.1f} ms imports  "
+                  f"{result['modules']:4} modules  ({heaviest})", file=sys.stderr)
+    finally:
+        shutil.rmtree(workdir)
+    
+    report = {'python': sys.version.split()[0], 'results': results}
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)['results']
+        rows = compare_results(baseline, results, args.threshold)
+        for command, old, new, change, passed in rows:
+            status = "PASS" if passed else "FAIL"
+            print(f"{status} {command}: {old:.1f} -> {new:.1f} ms imports ({change:+.1%})", file=sys.stderr)
+        return 0 if all(row[4] for row in rows) else 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""CryptoCore: AES file encryption in ECB, CBC, CFB, OFB and CTR modes"""
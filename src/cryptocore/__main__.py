@@ -0,0 +1,4 @@
+# Allows `python -m cryptocore`
+from .main import main
+
+main()
@@ -0,0 +1,102 @@
+# async_stream.py
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .ciphers import new_cipher
+from .csprng import generate_random_bytes
+
+# Size of the reads taken from the stream
+ASYNC_CHUNK_SIZE = 256 * 1024
+
+# Chunks smaller than this are processed on the event loop; the executor
+# round trip would cost more than the cipher work
+INLINE_THRESHOLD = 16 * 1024
+
+# Worker threads shared by every stream (AES releases the GIL)
+ASYNC_WORKERS = os.cpu_count() or 1
+
+# Modes that store an IV in front of the ciphertext
+IV_MODES = ['cbc', 'cfb', 'ofb', 'ctr']
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def get_executor():
+    """Return the bounded thread pool shared by all streams, creating it on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=ASYNC_WORKERS, thread_name_prefix='cryptocore')
+        return _executor
+
+async def transform_stream(reader, writer, operation, mode, key, iv=None,
+                           chunk_size=ASYNC_CHUNK_SIZE, executor=None):
+    """
+    Encrypt or decrypt everything read from reader into writer
+    
+    Each stream has at most one chunk in the executor and one read ahead,
+    and waits for writer.drain() before taking more input, so a slow
+    consumer throttles the producer instead of filling memory. Chaining
+    state is carried across chunks by an incremental cipher, so the output
+    equals the one-shot mode functions. The writer is not closed.
+    
+    Args:
+        reader: asyncio.StreamReader (or anything with async read(n))
+        writer: asyncio.StreamWriter (or anything with write() and async drain())
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): 'ecb', 'cbc', 'cfb', 'ofb' or 'ctr'
+        key (bytes): AES key
+        iv (bytes): IV; when decrypting without one it is read from the stream head
+        chunk_size (int): Bytes per read
+        executor: Executor for bulk cipher work (default: the shared pool)
+    
+    Returns:
+        bytes: IV used (None for ECB)
+    
+    Raises:
+        ValueError: If the mode is unsupported, or the ciphertext is
+            truncated or has invalid padding
+    """
+    loop = asyncio.get_running_loop()
+    executor = executor or get_executor()
+    
+    if mode not in IV_MODES:
+        iv = None
+    elif operation == 'encrypt':
+        # The IV goes in front of the ciphertext, as in encrypted files
+        iv = iv or generate_random_bytes(16)
+        writer.write(iv)
+    elif iv is None:
+        try:
+            iv = await reader.readexactly(16)
+        except asyncio.IncompleteReadError:
+            raise ValueError("Ciphertext too short to contain IV")
+    cipher = new_cipher(operation, mode, key, iv)
+    
+    data = await reader.read(chunk_size)
+    while data:
+        if len(data) < INLINE_THRESHOLD:
+            out = cipher.update(data)
+            data = await reader.read(chunk_size)
+        else:
+            # Read the next chunk while the worker processes this one
+            work = loop.run_in_executor(executor, cipher.update, data)
+            try:
+                data = await reader.read(chunk_size)
+            finally:
+                out = await work
+        writer.write(out)
+        await writer.drain()
+    
+    writer.write(cipher.finalize())
+    await writer.drain()
+    return iv
+
+async def encrypt_stream(reader, writer, mode, key, iv=None, chunk_size=ASYNC_CHUNK_SIZE, executor=None):
+    """Encrypt reader into writer (IV written first); returns the IV used"""
+    return await transform_stream(reader, writer, 'encrypt', mode, key, iv, chunk_size, executor)
+
+async def decrypt_stream(reader, writer, mode, key, iv=None, chunk_size=ASYNC_CHUNK_SIZE, executor=None):
+    """Decrypt reader into writer (IV read from the stream head unless given)"""
+    return await transform_stream(reader, writer, 'decrypt', mode, key, iv, chunk_size, executor)
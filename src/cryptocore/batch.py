@@ -0,0 +1,208 @@
+# batch.py
+import os
+import sys
+import time
+from .ciphers import new_cipher
+from .csprng import generate_random_bytes, bytes_to_hex
+from .file_utils import remove_file
+from .parallel import resolve_jobs
+from .metrics import record_operation, record_error
+
+# Size of the read buffer shared by every file in a batch
+BATCH_CHUNK_SIZE = 1024 * 1024
+
+# Modes that store an IV in front of the ciphertext
+IV_MODES = ['cbc', 'cfb', 'ofb', 'ctr']
+
+class BatchSummary:
+    """Totals of a batch run"""
+    
+    def __init__(self, operation):
+        self.operation = operation
+        self.files = 0
+        self.bytes = 0
+        self.seconds = 0.0
+        self.failures = []
+    
+    def mb_per_second(self):
+        if not self.seconds:
+            return 0.0
+        return self.bytes / self.seconds / (1024 * 1024)
+
+class BatchProcessor:
+    """
+    Encrypt or decrypt many files in one process
+    
+    One incremental cipher object (and so one AES key schedule) is reset
+    for every file, and the read and output buffers are allocated once and
+    reused, so per-file overhead is a couple of open() calls.
+    """
+    
+    def __init__(self, operation, mode, key, iv=None, chunk_size=BATCH_CHUNK_SIZE):
+        self.operation = operation
+        self.mode = mode
+        self.iv = iv
+        # Placeholder IV until the first file supplies its own
+        self._cipher = new_cipher(operation, mode, key, iv or bytes(16))
+        self._read_buffer = bytearray(chunk_size)
+        # update_into may also flush up to one carried-over block
+        self._out_buffer = bytearray(chunk_size + 32)
+    
+    def process(self, input_file, output_file):
+        """
+        Encrypt or decrypt one file
+        
+        Args:
+            input_file (str): Path to input file
+            output_file (str): Path to output file
+            
+        Returns:
+            int: Number of input bytes processed
+        """
+        dir_name = os.path.dirname(output_file)
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name, exist_ok=True)
+        
+        try:
+            with open(input_file, 'rb') as src, open(output_file, 'wb') as dst:
+                return self._transform(src, dst)
+        except Exception:
+            remove_file(output_file)
+            raise
+    
+    def _transform(self, src, dst):
+        processed = 0
+        iv = self.iv
+        if self.mode in IV_MODES:
+            if self.operation == 'encrypt':
+                # Every file gets its own IV under the shared key
+                iv = generate_random_bytes(16)
+                dst.write(iv)
+            elif iv is None:
+                iv = src.read(16)
+                processed += len(iv)
+                if len(iv) < 16:
+                    raise ValueError("Ciphertext too short to contain IV")
+        self._cipher.reset(iv)
+        
+        read_view = memoryview(self._read_buffer)
+        out_view = memoryview(self._out_buffer)
+        while True:
+            count = src.readinto(self._read_buffer)
+            if not count:
+                break
+            written = self._cipher.update_into(read_view[:count], out_view)
+            dst.write(out_view[:written])
+            processed += count
+        dst.write(self._cipher.finalize())
+        return processed
+
+def output_path_for(relative_name, input_file, output_dir, operation):
+    """Output path for one batch file: next to the input, or below output_dir"""
+    suffix = '.enc' if operation == 'encrypt' else '.dec'
+    if output_dir:
+        return os.path.join(output_dir, relative_name + suffix)
+    return input_file + suffix
+
+def batch_outputs(inputs, output_dir, operation):
+    """
+    Pair every batch input with its output path
+    
+    Inputs from different directories can share a relative name, and
+    below output_dir they would overwrite each other, so the batch is
+    refused before any file is written.
+    
+    Returns:
+        list: (input_file, output_file) pairs in input order
+        
+    Raises:
+        ValueError: If two inputs map to the same output path
+    """
+    pairs = []
+    sources = {}
+    for input_file, relative_name in inputs:
+        output_file = output_path_for(relative_name, input_file, output_dir, operation)
+        target = os.path.normcase(os.path.abspath(output_file))
+        if target in sources:
+            raise ValueError(f"{sources[target]} and {input_file} would both be written to {output_file}")
+        sources[target] = input_file
+        pairs.append((input_file, output_file))
+    return pairs
+
+def run_batch(operation, mode, key, inputs, output_dir=None, iv=None):
+    """
+    Encrypt or decrypt a list of files
+    
+    Failures are recorded and do not stop the batch.
+    
+    Args:
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): Mode of operation
+        key (bytes): AES key shared by every file
+        inputs (list): (file_path, relative_name) pairs
+        output_dir (str): Output directory (default: next to each input)
+        iv (bytes): IV for decryption when it is not stored in the files
+        
+    Returns:
+        BatchSummary: Totals and failures
+        
+    Raises:
+        ValueError: If two inputs map to the same output path
+    """
+    pairs = batch_outputs(inputs, output_dir, operation)
+    summary = BatchSummary(operation)
+    processor = BatchProcessor(operation, mode, key, iv)
+    start = time.perf_counter()
+    
+    for input_file, output_file in pairs:
+        file_start = time.perf_counter()
+        try:
+            processed = processor.process(input_file, output_file)
+        except Exception as e:
+            summary.failures.append((input_file, str(e)))
+            record_error(operation, e)
+            continue
+        summary.bytes += processed
+        summary.files += 1
+        record_operation(operation, mode, processed, time.perf_counter() - file_start)
+    
+    summary.seconds = time.perf_counter() - start
+    return summary
+
+def print_summary(summary):
+    """Print one summary for the whole batch"""
+    action = 'Encrypted' if summary.operation == 'encrypt' else 'Decrypted'
+    print(f"[SUCCESS] {action} {summary.files} files "
+          f"({summary.bytes} bytes) in {summary.seconds:.2f} s ({summary.mb_per_second():.2f} MB/s)")
+    if summary.failures:
+        print(f"[ERROR] {len(summary.failures)} files failed:", file=sys.stderr)
+        for input_file, message in summary.failures:
+            print(f"  {input_file}: {message}", file=sys.stderr)
+
+def run_batch_from_args(args):
+    """
+    Run a batch described by parsed command-line arguments
+    
+    Returns:
+        int: Exit code (1 if any file failed)
+    """
+    operation = 'encrypt' if args.encrypt else 'decrypt'
+    
+    if args.key:
+        key = bytes.fromhex(args.key)
+    else:
+        key = generate_random_bytes(16)
+        print(f"[INFO] Generated random key: {bytes_to_hex(key)}")
+    iv = bytes.fromhex(args.iv) if args.iv else None
+    
+    if resolve_jobs(args.jobs) > 1:
+        # Spread the files over a worker pool, largest first
+        from .scheduler import run_scheduled
+        summary = run_scheduled(operation, args.mode, key, args.inputs, args.output, iv, args.jobs)
+    else:
+        summary = run_batch(operation, args.mode, key, args.inputs, args.output, iv)
+    print_summary(summary)
+    if operation == 'encrypt' and not args.key:
+        print(f"[IMPORTANT] Generated key: {bytes_to_hex(key)}")
+    
+    return 1 if summary.failures else 0
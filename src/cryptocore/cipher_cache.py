@@ -0,0 +1,101 @@
+# cipher_cache.py
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from Crypto.Cipher import AES
+
+# Prepared AES objects kept by the shared cache
+CIPHER_CACHE_SIZE = 64
+
+class CipherCache:
+    """
+    Bounded LRU cache of prepared AES-ECB objects, keyed by key bytes
+    
+    Building an AES object runs the key expansion, which for small
+    messages costs more than the encryption itself. ECB objects carry no
+    chaining state, so one cached object can be shared by every mode
+    function and thread using the same key.
+    
+    Raw keys are never stored: entries are looked up by a BLAKE2b digest
+    keyed with a per-cache random secret, and the expanded key schedule
+    lives only inside the AES object, which is released as soon as the
+    entry is evicted or the cache is cleared.
+    """
+    
+    def __init__(self, max_size=CIPHER_CACHE_SIZE):
+        if max_size < 1:
+            raise ValueError("Cache size must be at least 1")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._secret = os.urandom(32)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _digest(self, key):
+        return hashlib.blake2b(key, key=self._secret, digest_size=32).digest()
+    
+    def get(self, key):
+        """
+        Return a prepared AES-ECB object for key
+        
+        Args:
+            key (bytes): AES key (16, 24 or 32 bytes)
+        
+        Returns:
+            AES object in ECB mode
+        
+        Raises:
+            ValueError: If the key length is invalid
+        """
+        digest = self._digest(key)
+        with self._lock:
+            cipher = self._entries.get(digest)
+            if cipher is not None:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return cipher
+            self.misses += 1
+        
+        # Expand the key outside the lock; a concurrent miss on the same key
+        # just builds an equivalent object
+        cipher = AES.new(key, AES.MODE_ECB)
+        with self._lock:
+            self._entries[digest] = cipher
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return cipher
+    
+    def clear(self):
+        """Drop every entry (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """Return cache counters as a dict"""
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
+
+_cache = CipherCache()
+
+def get_cipher(key):
+    """Return a prepared AES-ECB object for key from the shared cache"""
+    return _cache.get(key)
+
+def cache_stats():
+    """Counters of the shared cache"""
+    return _cache.stats()
+
+def clear_cache():
+    """Empty the shared cache"""
+    _cache.clear()
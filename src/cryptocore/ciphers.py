@@ -0,0 +1,249 @@
+# ciphers.py
+from .cipher_cache import get_cipher
+from .modes import (ecb_process, cbc_encrypt_process, cbc_decrypt_process, cfb_encrypt_process,
+                   cfb_decrypt_process, ofb_process, ctr_process)
+from .utils import pkcs7_pad, pkcs7_unpad
+from .profiler import stage
+
+def _ecb_encrypt_span(cipher, data, out, state):
+    ecb_process(cipher.encrypt, data, out)
+    return state
+
+def _ecb_decrypt_span(cipher, data, out, state):
+    ecb_process(cipher.decrypt, data, out)
+    return state
+
+class ModeCipher:
+    """
+    Incremental cipher for one mode and direction
+    
+    Data is fed with update() as it arrives and the stream is closed with
+    finalize(). Partial blocks are buffered internally and the chaining
+    state (previous block, feedback register or counter) is carried across
+    calls, so the concatenated output equals the one-shot mode functions.
+    update_into() writes into a caller-supplied buffer, so a caller that
+    reuses its buffer does not allocate per call.
+    """
+    __slots__ = ('_cipher', '_state', '_pending', '_finalized')
+    
+    # Span function from modes: process(cipher, data, out, state) -> state
+    _span = None
+    # 'pad' on encryption, 'unpad' on decryption, None for stream modes
+    _padding = None
+    _needs_iv = True
+    
+    def __init__(self, key, iv=None):
+        if self._needs_iv:
+            if iv is None or len(iv) != 16:
+                raise ValueError("IV must be 16 bytes")
+            iv = bytes(iv)
+        self._cipher = get_cipher(key)
+        self._state = self._initial_state(iv)
+        self._pending = bytearray()
+        self._finalized = False
+    
+    def _initial_state(self, iv):
+        return iv
+    
+    def reset(self, iv=None):
+        """
+        Start a new stream with the same key
+        
+        The prepared AES key schedule and the internal buffer are kept, so
+        one object can process many messages.
+        
+        Args:
+            iv (bytes): Initialization vector for the new stream
+        """
+        if self._needs_iv:
+            if iv is None or len(iv) != 16:
+                raise ValueError("IV must be 16 bytes")
+            iv = bytes(iv)
+        self._state = self._initial_state(iv)
+        self._pending.clear()
+        self._finalized = False
+    
+    def _process(self, data, out):
+        self._state = self._span(self._cipher, data, out, self._state)
+    
+    def output_length(self, data_length):
+        """Number of bytes the next update() with data_length bytes will return"""
+        total = len(self._pending) + data_length
+        usable = total - total % 16
+        # Keep the last block back until finalize() so it can be unpadded
+        if self._padding == 'unpad' and usable == total:
+            usable -= 16
+        return max(usable, 0)
+    
+    def update_into(self, data, output):
+        """
+        Process data and write the completed blocks into output
+        
+        Args:
+            data (bytes-like): Next piece of input
+            output (bytes-like): Writable buffer of at least
+                output_length(len(data)) bytes
+            
+        Returns:
+            int: Number of bytes written to output
+            
+        Raises:
+            ValueError: If the cipher was finalized or output is too small
+        """
+        if self._finalized:
+            raise ValueError("Cipher has already been finalized")
+        data = memoryview(data)
+        usable = self.output_length(len(data))
+        if len(output) < usable:
+            raise ValueError("Output buffer is too small")
+        
+        pending = self._pending
+        if usable == 0:
+            pending += data
+            return 0
+        
+        out = memoryview(output)
+        consumed = 0
+        written = 0
+        if pending:
+            # Complete the carried-over block first (pending holds at most 16 bytes)
+            consumed = 16 - len(pending)
+            pending += data[:consumed]
+            self._process(pending, out[:16])
+            written = 16
+        
+        body = usable - written
+        self._process(data[consumed:consumed + body], out[written:usable])
+        # Reuse the pending buffer for the new remainder
+        pending[:] = data[consumed + body:]
+        return usable
+    
+    def update(self, data):
+        """
+        Process data and return the output for every completed block
+        
+        Args:
+            data (bytes-like): Next piece of input
+            
+        Returns:
+            bytearray: Output (may be empty while a block is being filled)
+        """
+        out = bytearray(self.output_length(len(data)))
+        self.update_into(data, out)
+        return out
+    
+    def finalize(self):
+        """
+        Process the buffered tail and close the cipher
+        
+        Returns:
+            bytearray: Remaining output (padding added or removed as needed)
+            
+        Raises:
+            ValueError: If the cipher was finalized, the ciphertext is not
+                block-aligned, or the padding is invalid
+        """
+        if self._finalized:
+            raise ValueError("Cipher has already been finalized")
+        self._finalized = True
+        
+        tail = self._pending
+        if self._padding == 'pad':
+            with stage('pad'):
+                tail = pkcs7_pad(bytes(tail))
+        elif self._padding == 'unpad' and len(tail) != 16:
+            raise ValueError("Ciphertext length must be a multiple of 16 bytes")
+        
+        out = bytearray(len(tail))
+        if tail:
+            self._process(tail, memoryview(out))
+        self._pending.clear()
+        
+        if self._padding == 'unpad':
+            with stage('unpad'):
+                return pkcs7_unpad(out)
+        return out
+
+class ECBEncryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(_ecb_encrypt_span)
+    _padding = 'pad'
+    _needs_iv = False
+
+class ECBDecryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(_ecb_decrypt_span)
+    _padding = 'unpad'
+    _needs_iv = False
+
+class CBCEncryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(cbc_encrypt_process)
+    _padding = 'pad'
+
+class CBCDecryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(cbc_decrypt_process)
+    _padding = 'unpad'
+
+class CFBEncryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(cfb_encrypt_process)
+
+class CFBDecryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(cfb_decrypt_process)
+
+class OFBEncryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(ofb_process)
+
+class OFBDecryptor(OFBEncryptor):
+    # OFB decryption is identical to encryption
+    __slots__ = ()
+
+class CTREncryptor(ModeCipher):
+    __slots__ = ()
+    _span = staticmethod(ctr_process)
+    
+    def _initial_state(self, iv):
+        return int.from_bytes(iv, 'big')
+
+class CTRDecryptor(CTREncryptor):
+    # CTR decryption is identical to encryption
+    __slots__ = ()
+
+CIPHERS = {
+    ('encrypt', 'ecb'): ECBEncryptor,
+    ('decrypt', 'ecb'): ECBDecryptor,
+    ('encrypt', 'cbc'): CBCEncryptor,
+    ('decrypt', 'cbc'): CBCDecryptor,
+    ('encrypt', 'cfb'): CFBEncryptor,
+    ('decrypt', 'cfb'): CFBDecryptor,
+    ('encrypt', 'ofb'): OFBEncryptor,
+    ('decrypt', 'ofb'): OFBDecryptor,
+    ('encrypt', 'ctr'): CTREncryptor,
+    ('decrypt', 'ctr'): CTRDecryptor,
+}
+
+def new_cipher(operation, mode, key, iv=None):
+    """
+    Create an incremental cipher
+    
+    Args:
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): 'ecb', 'cbc', 'cfb', 'ofb' or 'ctr'
+        key (bytes): AES key
+        iv (bytes): Initialization vector (ignored for ECB)
+        
+    Returns:
+        ModeCipher: Cipher object with update()/finalize()
+        
+    Raises:
+        ValueError: If the operation or mode is unsupported
+    """
+    if operation not in ['encrypt', 'decrypt']:
+        raise ValueError(f"Unsupported operation: {operation}")
+    if (operation, mode) not in CIPHERS:
+        raise ValueError(f"Unsupported mode: {mode}")
+    return CIPHERS[(operation, mode)](key, iv)
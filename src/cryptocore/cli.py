@@ -0,0 +1,111 @@
+import argparse
+import sys
+import os
+from .file_utils import read_manifest, collect_files
+
+# Path that stands for stdin (as input) or stdout (as output)
+STDIO = '-'
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='CryptoCore - Cryptographic Tool')
+    
+    # Crypto operations
+    parser.add_argument('--algorithm', required=True, choices=['aes'], help='Cryptographic algorithm')
+    parser.add_argument('--mode', choices=['ecb', 'cbc', 'cfb', 'ofb', 'ctr'],
+                        help='Mode of operation (read from the header when decrypting a container)')
+    parser.add_argument('--encrypt', action='store_true', help='Encrypt mode')
+    parser.add_argument('--decrypt', action='store_true', help='Decrypt mode')
+    parser.add_argument('--key', help='Encryption key as hexadecimal string (optional for encryption)')
+    parser.add_argument('--input', nargs='+', help="Input file path(s); directories are processed recursively; '-' reads stdin")
+    parser.add_argument('--manifest', help='File listing input paths, one per line')
+    parser.add_argument('--output', help="Output file path (output directory in batch mode); '-' writes stdout")
+    parser.add_argument('--iv', help='Initialization vector as hexadecimal string')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for large files (0 = one per CPU core)')
+    parser.add_argument('--io', choices=['auto', 'buffered', 'mmap'], default='auto',
+                        help='File I/O path (auto memory-maps large files)')
+    parser.add_argument('--format', choices=['raw', 'container'],
+                        help='Encrypted file layout: IV + ciphertext (default when encrypting) or the '
+                             'chunked container; decryption detects it unless given')
+    parser.add_argument('--metrics-file', help='Write Prometheus metrics to this file when done')
+    parser.add_argument('--profile', action='store_true',
+                        help='Report wall/CPU time, bytes, MB/s and allocations per pipeline stage')
+    parser.add_argument('--profile-output', help='Also write a profile to this file (implies --profile)')
+    parser.add_argument('--profile-format', choices=['pstats', 'collapsed'], default='pstats',
+                        help='cProfile dump or collapsed stacks for flamegraphs')
+    parser.add_argument('--profile-memory', action='store_true',
+                        help='Also trace allocated bytes per stage (implies --profile; slows allocation-heavy modes)')
+    
+    args = parser.parse_args(argv)
+    
+    # Validate operation mode
+    if not (args.encrypt or args.decrypt) or (args.encrypt and args.decrypt):
+        parser.error("Exactly one of --encrypt or --decrypt must be specified")
+    
+    if not args.input and not args.manifest:
+        parser.error("At least one --input or a --manifest must be specified")
+    
+    # Validate input files exist
+    paths = list(args.input or [])
+    if args.manifest:
+        if not os.path.isfile(args.manifest):
+            parser.error(f"Manifest file does not exist: {args.manifest}")
+        paths.extend(read_manifest(args.manifest))
+    if STDIO in paths and paths != [STDIO]:
+        parser.error("stdin ('-') must be the only input")
+    for path in paths:
+        if path != STDIO and not os.path.exists(path):
+            parser.error(f"Input file does not exist: {path}")
+    
+    # Several inputs, a directory or a manifest switch to batch mode
+    args.batch = bool(args.manifest) or len(paths) != 1 or os.path.isdir(paths[0])
+    args.inputs = collect_files(paths) if paths != [STDIO] else []
+    if args.batch:
+        args.input = None
+        if args.encrypt and args.iv:
+            parser.error("--iv cannot be reused across files when encrypting in batch mode")
+    else:
+        args.input = paths[0]
+    
+    if args.batch and args.output == STDIO:
+        parser.error("stdout ('-') cannot be the output of a batch")
+    if args.format == 'container' and (args.batch or args.input == STDIO or args.output == STDIO):
+        parser.error("The container format needs a single input file and output file")
+    # Only a container file carries its mode in a header
+    if not args.mode and (args.encrypt or args.batch or args.input == STDIO or args.format == 'raw'):
+        parser.error("--mode is required unless decrypting a container file")
+    # Reading stdin writes stdout unless told otherwise, for shell pipelines
+    if args.input == STDIO and not args.output:
+        args.output = STDIO
+    # Status lines must not mix with data written to stdout
+    status = sys.stderr if args.output == STDIO else sys.stdout
+    
+    if args.jobs < 0:
+        parser.error("--jobs must not be negative")
+    
+    if args.profile_output or args.profile_memory:
+        args.profile = True
+    
+    # ML3: Key validation - optional for encryption, required for decryption
+    if args.decrypt and not args.key:
+        parser.error("--key is mandatory for decryption")
+    
+    if args.encrypt and not args.key:
+        print("[INFO] No key provided. Generating secure random key...", file=status)
+    
+    # Set default output file if not provided
+    if not args.output and not args.batch:
+        if args.encrypt:
+            args.output = args.input + '.enc'
+        else:
+            args.output = args.input + '.dec'
+        print(f"[INFO] Using default output file: {args.output}")
+    
+    return args
+
+def main():
+    """Run the command line tool; kept for callers of cli.main, see main.main"""
+    from .main import main as run_main
+    run_main()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,131 @@
+# client.py
+import os
+import socket
+import threading
+from .protocol import (DEFAULT_SOCKET_PATH, MAX_FRAME_SIZE, DATA_CHUNK_SIZE, FRAME_REQUEST, FRAME_DATA,
+                      FRAME_END, FRAME_ERROR, send_frame, recv_frame, encode_request, peer_uid)
+
+class _Connection:
+    """One socket to the daemon; in_sync is False while a request is open"""
+    
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = bytearray(MAX_FRAME_SIZE)
+        self.in_sync = True
+
+class DaemonClient:
+    """
+    Client for the encryption daemon with a pool of open connections
+    
+    Connections are reused across requests, so a request costs a few
+    socket round trips instead of a process start. Output follows the
+    file format: when encrypting in an IV mode the IV comes first, and
+    when decrypting without an explicit IV it is read from the input head.
+    
+    Every new connection is refused unless the daemon runs as the same
+    user, so keys are never sent to a process that bound the path first.
+    """
+    
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, pool_size=4, timeout=30.0):
+        self.socket_path = socket_path
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._idle = []
+        self._lock = threading.Lock()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+            uid = peer_uid(sock, self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        if uid != os.getuid():
+            sock.close()
+            raise ConnectionError(f"Daemon on {self.socket_path} runs as uid {uid}, not {os.getuid()}")
+        return _Connection(sock)
+    
+    def _release(self, connection):
+        # A stream abandoned halfway leaves the connection out of sync, so it is closed
+        if connection.in_sync:
+            with self._lock:
+                if len(self._idle) < self.pool_size:
+                    self._idle.append(connection)
+                    return
+        connection.sock.close()
+    
+    def close(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.sock.close()
+    
+    def _exchange(self, connection, frame_type, payload, expected):
+        connection.in_sync = False
+        send_frame(connection.sock, frame_type, payload)
+        reply_type, reply = recv_frame(connection.sock, connection.buffer)
+        # An error or end reply closes the request on both sides
+        connection.in_sync = reply_type in (FRAME_ERROR, FRAME_END)
+        if reply_type == FRAME_ERROR:
+            raise ValueError(bytes(reply).decode(errors='replace'))
+        if reply_type != expected:
+            raise ConnectionError("Unexpected reply from daemon")
+        return bytes(reply)
+    
+    def stream(self, operation, mode, key, chunks, iv=None):
+        """
+        Encrypt or decrypt an iterable of chunks through the daemon
+        
+        Only one chunk is in flight at a time, so neither side buffers the
+        whole payload.
+        
+        Args:
+            operation (str): 'encrypt' or 'decrypt'
+            mode (str): Mode of operation
+            key (bytes): AES key
+            chunks (iterable): Input pieces (bytes-like)
+            iv (bytes): Explicit IV (default: generated, or read from the input head)
+        
+        Yields:
+            bytes: Output pieces
+        
+        Raises:
+            ValueError: If the daemon rejects the request or the data
+            ConnectionError: If the connection to the daemon fails
+        """
+        connection = self._acquire()
+        try:
+            head = self._exchange(connection, FRAME_REQUEST, encode_request(operation, mode, key, iv), FRAME_DATA)
+            if head:
+                yield head
+            for chunk in chunks:
+                view = memoryview(chunk)
+                for start in range(0, len(view), DATA_CHUNK_SIZE):
+                    out = self._exchange(connection, FRAME_DATA, view[start:start + DATA_CHUNK_SIZE], FRAME_DATA)
+                    if out:
+                        yield out
+            final = self._exchange(connection, FRAME_END, b'', FRAME_END)
+            if final:
+                yield final
+        finally:
+            self._release(connection)
+    
+    def encrypt(self, data, mode, key, iv=None):
+        """Encrypt data in one call; returns the IV (if any) followed by the ciphertext"""
+        return b''.join(self.stream('encrypt', mode, key, [data], iv))
+    
+    def decrypt(self, data, mode, key, iv=None):
+        """Decrypt data in one call; without iv the IV is taken from the first 16 bytes"""
+        return b''.join(self.stream('decrypt', mode, key, [data], iv))
@@ -0,0 +1,319 @@
+# container.py
+import struct
+from .cipher_cache import get_cipher
+from .ciphers import new_cipher
+from .modes import ecb_process, cbc_decrypt_process, cfb_decrypt_process, ofb_process, ctr_process
+from .file_utils import read_file_chunks, read_file_range, write_file_range, create_file
+from .file_utils import get_file_size, remove_file, staged_output
+from .parallel import run_parallel
+from .csprng import generate_random_bytes
+from .utils import pkcs7_unpad
+
+# Layout of a version 1 container:
+#
+#   header   magic, version, algorithm, mode, chunk size, plaintext length, IV
+#   chunks   ciphertext of every chunk, back to back
+#   index    one entry per chunk: file offset, ciphertext length, chunk IV
+#   trailer  index offset, chunk count, end magic
+#
+# Chunk i holds plaintext bytes [i * chunk_size, (i + 1) * chunk_size) and is
+# decrypted on its own from its index entry, so readers can seek to a chunk
+# or spread chunks over workers. Chunks continue the mode's chain (CBC/CFB
+# start from the preceding ciphertext block, CTR from the following counter),
+# except OFB, whose chunks start from fresh random IVs: continuing its
+# keystream would mean storing keystream blocks in the index.
+MAGIC = b'CCv\x01'
+END_MAGIC = b'CCix'
+VERSION = 1
+
+HEADER = struct.Struct('>4sBBBxIQ16s')
+INDEX_ENTRY = struct.Struct('>QI16s')
+TRAILER = struct.Struct('>QI4s')
+
+ALGORITHMS = {'aes': 1}
+MODES = {'ecb': 1, 'cbc': 2, 'cfb': 3, 'ofb': 4, 'ctr': 5}
+
+# Plaintext bytes per chunk; a multiple of the block size
+CHUNK_SIZE = 1024 * 1024
+
+# Modes whose last chunk carries PKCS#7 padding
+PADDED_MODES = ('ecb', 'cbc')
+
+def _lookup(table, value, what):
+    for name, number in table.items():
+        if number == value:
+            return name
+    raise ValueError(f"Unsupported {what} in container header: {value}")
+
+def is_container(filename):
+    """Check whether a file starts and ends with the container magic numbers"""
+    size = get_file_size(filename)
+    if size < HEADER.size + TRAILER.size:
+        return False
+    head = read_file_range(filename, 0, len(MAGIC))
+    tail = read_file_range(filename, size - len(END_MAGIC), len(END_MAGIC))
+    return head == MAGIC and tail == END_MAGIC
+
+def expected_chunk_lengths(mode, plaintext_length, chunk_size):
+    """Ciphertext length of every chunk of a plaintext_length-byte input"""
+    num_chunks = max(1, -(-plaintext_length // chunk_size))
+    lengths = [chunk_size] * (num_chunks - 1)
+    last = plaintext_length - (num_chunks - 1) * chunk_size
+    lengths.append(last - last % 16 + 16 if mode in PADDED_MODES else last)
+    return lengths
+
+class ContainerReader:
+    """
+    Parsed header and chunk index of a container file
+    
+    Only the header, trailer and index are read on construction; chunk
+    ciphertext is read on demand, so any chunk or plaintext range can be
+    decrypted without scanning the file.
+    
+    Raises:
+        ValueError: If the file is not a container, its version is
+            unsupported, or the header and index are inconsistent
+    """
+    
+    def __init__(self, filename):
+        self.filename = filename
+        file_size = get_file_size(filename)
+        if not is_container(filename):
+            raise ValueError(f"Not a CryptoCore container: {filename}")
+        
+        magic, version, algorithm, mode, chunk_size, plaintext_length, iv = HEADER.unpack(
+            read_file_range(filename, 0, HEADER.size))
+        if version != VERSION:
+            raise ValueError(f"Unsupported container version: {version}")
+        self.version = version
+        self.algorithm = _lookup(ALGORITHMS, algorithm, 'algorithm')
+        self.mode = _lookup(MODES, mode, 'mode')
+        if chunk_size == 0 or chunk_size % 16 != 0:
+            raise ValueError(f"Invalid container chunk size: {chunk_size}")
+        self.chunk_size = chunk_size
+        self.plaintext_length = plaintext_length
+        self.iv = iv if self.mode != 'ecb' else None
+        
+        index_offset, num_chunks, _ = TRAILER.unpack(
+            read_file_range(filename, file_size - TRAILER.size, TRAILER.size))
+        lengths = expected_chunk_lengths(self.mode, plaintext_length, chunk_size)
+        if num_chunks != len(lengths) or index_offset + num_chunks * INDEX_ENTRY.size + TRAILER.size != file_size:
+            raise ValueError("Container index does not match its header")
+        
+        index = read_file_range(filename, index_offset, num_chunks * INDEX_ENTRY.size)
+        self.chunks = list(INDEX_ENTRY.iter_unpack(index))
+        position = HEADER.size
+        for (offset, length, _), expected in zip(self.chunks, lengths):
+            if offset != position or length != expected:
+                raise ValueError("Container index does not match its header")
+            position += length
+        if position != index_offset:
+            raise ValueError("Container index does not match its header")
+    
+    def chunk_task(self, key, index, output_file, out_offset=None):
+        """Task for decrypt_chunk_task writing chunk index into output_file"""
+        offset, length, iv = self.chunks[index]
+        if out_offset is None:
+            out_offset = index * self.chunk_size
+        last = index == len(self.chunks) - 1
+        expected = self.plaintext_length - index * self.chunk_size if last else self.chunk_size
+        return (self.mode, key, self.filename, offset, length, iv, last, expected, output_file, out_offset)
+    
+    def decrypt_chunk(self, key, index):
+        """
+        Decrypt one chunk
+        
+        Args:
+            key (bytes): AES key
+            index (int): Chunk number
+        
+        Returns:
+            bytearray: Plaintext of the chunk
+        """
+        if not 0 <= index < len(self.chunks):
+            raise ValueError(f"Chunk {index} out of range (container has {len(self.chunks)})")
+        offset, length, iv = self.chunks[index]
+        last = index == len(self.chunks) - 1
+        expected = self.plaintext_length - index * self.chunk_size if last else self.chunk_size
+        return decrypt_chunk(self.mode, key, read_file_range(self.filename, offset, length), iv, last, expected)
+    
+    def read(self, key, offset, length):
+        """
+        Decrypt plaintext bytes [offset, offset + length), touching only the chunks they span
+        
+        Returns:
+            bytes: Plaintext (shorter than length at the end of the plaintext)
+        """
+        if offset < 0 or length < 0:
+            raise ValueError("Offset and length must not be negative")
+        end = min(offset + length, self.plaintext_length)
+        parts = []
+        for index in range(offset // self.chunk_size, -(-end // self.chunk_size)):
+            start = index * self.chunk_size
+            chunk = self.decrypt_chunk(key, index)
+            parts.append(chunk[max(offset - start, 0):end - start])
+        return b''.join(parts)
+
+def decrypt_chunk(mode, key, data, iv, last, expected):
+    """
+    Decrypt the ciphertext of one chunk from its index IV
+    
+    Args:
+        mode (str): Cipher mode of the container
+        key (bytes): AES key
+        data (bytes-like): Chunk ciphertext
+        iv (bytes): Chunk IV from the index (counter block for CTR)
+        last (bool): Whether this is the final chunk (padded for ECB/CBC)
+        expected (int): Plaintext length the chunk must decrypt to
+    
+    Returns:
+        bytearray: Chunk plaintext
+    
+    Raises:
+        ValueError: If the ciphertext or its padding is invalid
+    """
+    cipher = get_cipher(key)
+    out = bytearray(len(data))
+    view = memoryview(out)
+    if mode == 'ecb':
+        ecb_process(cipher.decrypt, data, view)
+    elif mode == 'cbc':
+        cbc_decrypt_process(cipher, data, view, iv)
+    elif mode == 'cfb':
+        cfb_decrypt_process(cipher, data, view, iv)
+    elif mode == 'ofb':
+        ofb_process(cipher, data, view, iv)
+    else:
+        ctr_process(cipher, data, view, int.from_bytes(iv, 'big'))
+    view.release()
+    
+    if last and mode in PADDED_MODES:
+        # Padding only lives in the last block
+        tail = pkcs7_unpad(bytes(out[-16:]))
+        del out[len(out) - 16:]
+        out += tail
+    if len(out) != expected:
+        raise ValueError("Chunk does not match the plaintext length in the container header")
+    return out
+
+def decrypt_chunk_task(task):
+    """Decrypt one chunk into the pre-sized output file (runs in a worker process)"""
+    mode, key, input_file, offset, length, iv, last, expected, output_file, out_offset = task
+    plaintext = decrypt_chunk(mode, key, read_file_range(input_file, offset, length), iv, last, expected)
+    write_file_range(output_file, out_offset, plaintext)
+    return len(plaintext)
+
+def chunk_iv(mode, iv, index, chunk_size, previous_block):
+    """IV of chunk index when chunks continue the mode's chain"""
+    if mode == 'ctr':
+        counter = (int.from_bytes(iv, 'big') + index * chunk_size // 16) % (1 << 128)
+        return counter.to_bytes(16, 'big')
+    if mode in ['cbc', 'cfb']:
+        return iv if index == 0 else previous_block
+    if mode == 'ecb':
+        return bytes(16)
+    # OFB chunks restart from a fresh IV
+    return iv if index == 0 else generate_random_bytes(16)
+
+def write_container(input_file, output_file, mode, key, iv=None, chunk_size=CHUNK_SIZE, algorithm='aes'):
+    """
+    Encrypt a file into the container format
+    
+    The input is read one chunk at a time and the output written
+    sequentially: header, chunk ciphertext, then the index and trailer.
+    A partially written output file is removed on failure, and output
+    onto input_file goes through a temporary file (see staged_output).
+    
+    Args:
+        input_file (str): Path to the plaintext
+        output_file (str): Path to the container
+        mode (str): 'ecb', 'cbc', 'cfb', 'ofb' or 'ctr'
+        key (bytes): AES key
+        iv (bytes): IV of the first chunk (ignored for ECB)
+        chunk_size (int): Plaintext bytes per chunk, a multiple of 16
+        algorithm (str): Cipher algorithm recorded in the header
+    
+    Returns:
+        int: Plaintext bytes encrypted
+    
+    Raises:
+        ValueError: If the mode, algorithm or chunk size is unsupported
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unsupported mode: {mode}")
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unsupported algorithm: {algorithm}")
+    if chunk_size <= 0 or chunk_size % 16 != 0:
+        raise ValueError("Chunk size must be a positive multiple of 16 bytes")
+    if mode == 'ecb':
+        iv = None
+    elif iv is None or len(iv) != 16:
+        raise ValueError("IV must be 16 bytes")
+    
+    plaintext_length = get_file_size(input_file)
+    header = HEADER.pack(MAGIC, VERSION, ALGORITHMS[algorithm], MODES[mode], chunk_size,
+                         plaintext_length, iv or bytes(16))
+    cipher = new_cipher('encrypt', mode, key, iv)
+    index = []
+    
+    with staged_output(input_file, output_file) as target:
+        try:
+            with open(target, 'wb') as f:
+                f.write(header)
+                position = len(header)
+                previous_block = iv
+                chunks = read_file_chunks(input_file, chunk_size) if plaintext_length else [b'']
+                for number, chunk in enumerate(chunks):
+                    state = chunk_iv(mode, iv, number, chunk_size, previous_block)
+                    if mode == 'ofb' and number > 0:
+                        cipher.reset(state)
+                    ciphertext = cipher.update(chunk)
+                    if number * chunk_size + len(chunk) == plaintext_length:
+                        ciphertext += cipher.finalize()
+                    f.write(ciphertext)
+                    index.append(INDEX_ENTRY.pack(position, len(ciphertext), state))
+                    position += len(ciphertext)
+                    previous_block = bytes(ciphertext[-16:])
+                
+                f.write(b''.join(index))
+                f.write(TRAILER.pack(position, len(index), END_MAGIC))
+        except Exception:
+            remove_file(target)
+            raise
+    return plaintext_length
+
+def decrypt_container(input_file, output_file, key, jobs=1, mode=None):
+    """
+    Decrypt a container file, spreading its chunks over jobs workers
+    
+    The output is pre-sized to the plaintext length from the header and
+    every chunk is written at its own offset, so chunks can finish in any
+    order. A partially written output file is removed on failure, and
+    output onto input_file goes through a temporary file.
+    
+    Args:
+        input_file (str): Path to the container
+        output_file (str): Path to the plaintext
+        key (bytes): AES key
+        jobs (int): Number of worker processes
+        mode (str): Expected mode, or None to take it from the header
+    
+    Returns:
+        ContainerReader: The parsed container (mode, IV, plaintext length)
+    
+    Raises:
+        ValueError: If the container is invalid, was written in another
+            mode, or does not decrypt under key
+    """
+    reader = ContainerReader(input_file)
+    if mode is not None and mode != reader.mode:
+        raise ValueError(f"Container was encrypted in {reader.mode} mode, not {mode}")
+    with staged_output(input_file, output_file) as target:
+        create_file(target, reader.plaintext_length)
+        try:
+            tasks = [reader.chunk_task(key, index, target) for index in range(len(reader.chunks))]
+            run_parallel(decrypt_chunk_task, tasks, jobs)
+        except Exception:
+            remove_file(target)
+            raise
+    return reader
@@ -0,0 +1,427 @@
+import os
+import sys
+import time
+from .cipher_cache import get_cipher
+from .modes import ecb_encrypt, ecb_process, ctr_process, cbc_decrypt_process, cfb_decrypt_process
+from .file_utils import read_file_chunks, write_file_chunks
+from .file_utils import read_file_range, write_file_range, create_file, truncate_file, get_file_size
+from .file_utils import map_input_file, map_output_file, remove_file, staged_output
+from .stream import transform_chunks, transform_stream
+from .ciphers import new_cipher
+from .container import is_container, write_container, decrypt_container
+from .parallel import should_parallelize, resolve_jobs, split_blocks, run_parallel
+from .csprng import generate_random_bytes, bytes_to_hex
+from .utils import pkcs7_pad, pkcs7_unpad, PaddingError
+from .profiler import stage, profile_iter, add_bytes
+from .metrics import record_operation, record_error
+
+def pkcs7_pad(data, block_size=16):
+    """Pad data using PKCS#7 standard"""
+    padding_length = block_size - (len(data) % block_size)
+    if padding_length == 0:
+        padding_length = block_size
+    padding = bytes([padding_length] * padding_length)
+    return data + padding
+
+def pkcs7_unpad(data):
+    """Remove PKCS#7 padding"""
+    if len(data) == 0:
+        return data
+    padding_length = data[-1]
+    # Validate padding
+    if padding_length == 0 or padding_length > len(data):
+        raise PaddingError("Invalid padding")
+    if data[-padding_length:] != bytes([padding_length] * padding_length):
+        raise PaddingError("Invalid padding")
+    return data[:-padding_length]
+
+SUPPORTED_MODES = ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']
+
+# Size of the chunks streamed through the mode engine
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# I/O paths for file encryption; 'auto' maps inputs of MMAP_THRESHOLD bytes or more
+IO_MODES = ['auto', 'buffered', 'mmap']
+MMAP_THRESHOLD = 64 * 1024 * 1024
+
+# Path that stands for stdin (as input) or stdout (as output)
+STDIO = '-'
+
+# Encrypted file layouts: IV + ciphertext, or the chunked container (see container.py)
+FILE_FORMATS = ['raw', 'container']
+
+# Modes whose segments can be processed independently, per operation
+PARALLEL_MODES = {
+    'encrypt': ('ecb', 'ctr'),
+    'decrypt': ('ecb', 'cbc', 'cfb', 'ctr'),
+}
+
+# Largest segment handed to a single worker task
+SEGMENT_SIZE = 16 * 1024 * 1024
+
+def process_file_segment(task):
+    """Encrypt or decrypt one file segment in place (runs in a worker process)"""
+    operation, mode, key_bytes, state, input_file, in_offset, length, output_file, out_offset = task
+    
+    data = read_file_range(input_file, in_offset, length)
+    cipher = get_cipher(key_bytes)
+    out = bytearray(length)
+    
+    if mode == 'ecb':
+        transform = cipher.encrypt if operation == 'encrypt' else cipher.decrypt
+        ecb_process(transform, data, memoryview(out))
+    elif mode == 'ctr':
+        ctr_process(cipher, data, memoryview(out), state)
+    elif mode == 'cbc' and operation == 'decrypt':
+        cbc_decrypt_process(cipher, data, memoryview(out), state)
+    elif mode == 'cfb' and operation == 'decrypt':
+        cfb_decrypt_process(cipher, data, memoryview(out), state)
+    else:
+        raise ValueError(f"Mode {mode} cannot {operation} segments independently")
+    
+    write_file_range(output_file, out_offset, out)
+    return length
+
+def segment_tasks(operation, mode, key_bytes, iv, input_file, in_start, length, output_file, out_start, jobs):
+    """
+    Split a byte range of input_file into tasks for process_file_segment
+    
+    The range is split into block-aligned segments. Each task carries its
+    own starting state (CTR counter offset, or the preceding ciphertext block
+    for CBC/CFB decryption), so a worker can read its segment and write the
+    result into the pre-sized output file at the matching offset.
+    """
+    parts = max(resolve_jobs(jobs), -(-length // SEGMENT_SIZE))
+    tasks = []
+    
+    for start, end in split_blocks(length, parts):
+        if mode == 'ctr':
+            state = int.from_bytes(iv, 'big') + start // 16
+        elif mode in ['cbc', 'cfb']:
+            state = iv if start == 0 else read_file_range(input_file, in_start + start - 16, 16)
+        else:
+            state = None
+        tasks.append((operation, mode, key_bytes, state, input_file, in_start + start,
+                      end - start, output_file, out_start + start))
+    
+    return tasks
+
+def plan_parallel_file(operation, mode, key_bytes, iv, input_file, output_file, jobs):
+    """
+    Prepare one file for segment-parallel processing
+    
+    The output file is pre-sized (with the IV written in front when
+    encrypting) so segments can be written independently in any order.
+    
+    Args:
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): One of PARALLEL_MODES[operation]
+        key_bytes (bytes): AES key
+        iv (bytes): IV; when decrypting, None reads it from the file head
+        input_file (str): Path to input file
+        output_file (str): Path to output file
+        jobs (int): Number of workers the segments are spread over
+        
+    Returns:
+        tuple: (tasks for process_file_segment, function to call once
+            every task is done)
+    """
+    if mode not in PARALLEL_MODES[operation]:
+        raise ValueError(f"Mode {mode} cannot {operation} segments independently")
+    
+    input_size = get_file_size(input_file)
+    if operation == 'encrypt':
+        header = iv if iv else b''
+        # ECB pads the tail separately, so workers only see full blocks
+        body_length = input_size - input_size % 16 if mode == 'ecb' else input_size
+        output_size = body_length + 16 if mode == 'ecb' else body_length
+        in_start, out_start = 0, len(header)
+        
+        create_file(output_file, len(header) + output_size)
+        write_file_range(output_file, 0, header)
+        
+        def finish():
+            if mode == 'ecb':
+                tail = read_file_range(input_file, body_length, input_size - body_length)
+                write_file_range(output_file, out_start + body_length, ecb_encrypt(tail, key_bytes))
+    else:
+        # IV is prepended to ciphertext unless given explicitly
+        if mode == 'ecb' or iv is not None:
+            in_start = 0
+        elif input_size < 16:
+            raise ValueError("Ciphertext too short to contain IV")
+        else:
+            iv, in_start = read_file_range(input_file, 0, 16), 16
+        body_length = input_size - in_start
+        if mode in ['ecb', 'cbc'] and (body_length == 0 or body_length % 16 != 0):
+            raise ValueError("Ciphertext length must be a multiple of 16 bytes")
+        out_start = 0
+        
+        create_file(output_file, body_length)
+        
+        def finish():
+            if mode in ['ecb', 'cbc']:
+                # Padding only lives in the last block
+                last_block = read_file_range(output_file, body_length - 16, 16)
+                truncate_file(output_file, body_length - 16 + len(pkcs7_unpad(last_block)))
+    
+    tasks = segment_tasks(operation, mode, key_bytes, iv, input_file, in_start, body_length,
+                          output_file, out_start, jobs)
+    return tasks, finish
+
+def use_mmap(io_mode, size):
+    """Check whether a file of size bytes should go through the mmap path"""
+    if io_mode not in IO_MODES:
+        raise ValueError(f"Unsupported I/O mode: {io_mode}")
+    return io_mode == 'mmap' or (io_mode == 'auto' and size >= MMAP_THRESHOLD)
+
+def transform_file_mapped(operation, mode, key_bytes, iv, input_file, offset, output_file, header=b''):
+    """
+    Encrypt or decrypt a file through memory maps
+    
+    The input is mapped read-only and fed to an incremental cipher as
+    zero-copy memoryview slices; the output file is pre-sized and mapped so
+    results are written in place. The output is truncated afterwards if
+    padding removal made it shorter. Output onto input_file goes through a
+    temporary file, since pre-sizing it would discard the mapped input.
+    """
+    body_length = get_file_size(input_file) - offset
+    if operation == 'encrypt' and mode in ['ecb', 'cbc']:
+        output_size = body_length - body_length % 16 + 16
+    else:
+        output_size = body_length
+    output_size += len(header)
+    
+    cipher = new_cipher(operation, mode, key_bytes, iv)
+    with staged_output(input_file, output_file) as output_path:
+        try:
+            # Reads are page faults inside the cipher stage; 'map' covers mapping and the final flush
+            with stage('map'):
+                with map_input_file(input_file) as source, map_output_file(output_path, output_size) as target:
+                    with stage(operation):
+                        written = _transform_mapped_views(cipher, source, target, offset, header)
+        except Exception:
+            remove_file(output_path)
+            raise
+        
+        if written < output_size:
+            truncate_file(output_path, written)
+    add_bytes(operation, body_length)
+
+def _transform_mapped_views(cipher, source, target, offset, header):
+    """Run cipher over source[offset:] into target; slices die with this frame"""
+    target[:len(header)] = header
+    position = len(header)
+    
+    for start in range(offset, len(source), STREAM_CHUNK_SIZE):
+        position += cipher.update_into(source[start:start + STREAM_CHUNK_SIZE], target[position:])
+    
+    final = cipher.finalize()
+    target[position:position + len(final)] = final
+    return position + len(final)
+
+def transform_stdio(operation, mode, key_bytes, iv, input_file, output_file):
+    """
+    Encrypt or decrypt when the input or the output is a standard stream
+    
+    STDIO ('-') as input_file reads stdin and as output_file writes
+    stdout. Nothing seeks, so shell pipelines need no temporary files; see
+    stream.transform_stream for the IV handling. A partially written
+    output file is removed on failure.
+    
+    Returns:
+        int: Input bytes consumed
+    """
+    source = sys.stdin.buffer if input_file == STDIO else open(input_file, 'rb')
+    try:
+        with stage(operation):
+            if output_file == STDIO:
+                consumed = transform_stream(source, sys.stdout.buffer, operation, mode, key_bytes, iv)
+            else:
+                try:
+                    with open(output_file, 'wb') as sink:
+                        consumed = transform_stream(source, sink, operation, mode, key_bytes, iv)
+                except Exception:
+                    remove_file(output_file)
+                    raise
+    finally:
+        if input_file != STDIO:
+            source.close()
+    add_bytes(operation, consumed)
+    return consumed
+
+def encrypt_file(algorithm, mode, key_hex, input_file, output_file, iv_hex=None, jobs=1, io_mode='auto',
+                 file_format='raw'):
+    """Encrypt file with optional key generation (jobs > 1 uses worker processes for ECB/CTR)"""
+    start = time.perf_counter()
+    try:
+        key_hex, iv_hex, num_bytes = _encrypt_file(mode, key_hex, input_file, output_file, iv_hex, jobs, io_mode,
+                                                   file_format)
+    except Exception as e:
+        record_error('encrypt', e)
+        raise
+    record_operation('encrypt', mode, num_bytes, time.perf_counter() - start)
+    return key_hex, iv_hex
+    
+def _encrypt_file(mode, key_hex, input_file, output_file, iv_hex, jobs, io_mode, file_format):
+    if mode not in SUPPORTED_MODES:
+        raise ValueError(f"Unsupported mode: {mode}")
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported file format: {file_format}")
+    if file_format == 'container' and STDIO in (input_file, output_file):
+        raise ValueError("The container format needs file input and output")
+    
+    # ML3: Generate key if not provided
+    if not key_hex:
+        key_bytes = generate_random_bytes(16)  # 128-bit key for AES
+        key_hex = bytes_to_hex(key_bytes)
+        # Status goes to stderr while stdout carries the ciphertext
+        print(f"[INFO] Generated random key: {key_hex}", file=sys.stderr if output_file == STDIO else sys.stdout)
+    else:
+        key_bytes = bytes.fromhex(key_hex)
+    
+    # Generate IV if needed and not provided
+    if mode in ['cbc', 'cfb', 'ofb', 'ctr']:
+        if iv_hex:
+            iv = bytes.fromhex(iv_hex)
+        else:
+            iv = generate_random_bytes(16)
+            iv_hex = bytes_to_hex(iv)
+    else:
+        iv = None
+        iv_hex = None
+    
+    if STDIO in (input_file, output_file):
+        return key_hex, iv_hex, transform_stdio('encrypt', mode, key_bytes, iv, input_file, output_file)
+    
+    if file_format == 'container':
+        with stage('encrypt'):
+            num_bytes = write_container(input_file, output_file, mode, key_bytes, iv)
+        add_bytes('encrypt', num_bytes)
+        return key_hex, iv_hex, num_bytes
+    
+    input_size = get_file_size(input_file)
+    if mode in PARALLEL_MODES['encrypt'] and should_parallelize(input_size, jobs):
+        with staged_output(input_file, output_file) as target:
+            tasks, finish = plan_parallel_file('encrypt', mode, key_bytes, iv, input_file, target, jobs)
+            try:
+                with stage('parallel'):
+                    run_parallel(process_file_segment, tasks, jobs)
+                add_bytes('parallel', input_size)
+                finish()
+            except Exception:
+                remove_file(target)
+                raise
+        return key_hex, iv_hex, input_size
+    
+    header = iv if mode in ['cbc', 'cfb', 'ofb', 'ctr'] else b''
+    if use_mmap(io_mode, input_size):
+        transform_file_mapped('encrypt', mode, key_bytes, iv, input_file, 0, output_file, header)
+        return key_hex, iv_hex, input_size
+    
+    # Stream the input through the mode engine chunk by chunk
+    chunks = profile_iter('read', read_file_chunks(input_file, STREAM_CHUNK_SIZE))
+    output = profile_iter('encrypt', transform_chunks(chunks, 'encrypt', mode, key_bytes, iv))
+    with stage('write'), staged_output(input_file, output_file) as target:
+        written = write_file_chunks(target, output, header)
+    add_bytes('write', written)
+    
+    return key_hex, iv_hex, input_size
+
+def decrypt_file(algorithm, mode, key_hex, input_file, output_file, iv_hex=None, jobs=1, io_mode='auto',
+                 file_format=None):
+    """
+    Decrypt file (key is always required; jobs > 1 uses worker processes for ECB/CBC/CFB/CTR)
+    
+    Container files are detected unless file_format is 'raw'; their mode
+    and IV come from the header, so mode may be None, and their chunks
+    are spread over jobs workers in every mode.
+    """
+    start = time.perf_counter()
+    try:
+        mode, num_bytes = _decrypt_file(mode, key_hex, input_file, output_file, iv_hex, jobs, io_mode, file_format)
+    except Exception as e:
+        record_error('decrypt', e)
+        raise
+    record_operation('decrypt', mode, num_bytes, time.perf_counter() - start)
+    
+def _decrypt_file(mode, key_hex, input_file, output_file, iv_hex, jobs, io_mode, file_format):
+    if mode is not None and mode not in SUPPORTED_MODES:
+        raise ValueError(f"Unsupported mode: {mode}")
+    if file_format is not None and file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported file format: {file_format}")
+    
+    key_bytes = bytes.fromhex(key_hex)
+    
+    if file_format == 'container' or (file_format is None and input_file != STDIO and is_container(input_file)):
+        if STDIO in (input_file, output_file):
+            raise ValueError("The container format needs file input and output")
+        if iv_hex:
+            raise ValueError("Container files carry their IV in the header")
+        with stage('decrypt'):
+            reader = decrypt_container(input_file, output_file, key_bytes, jobs, mode)
+        add_bytes('decrypt', reader.plaintext_length)
+        return reader.mode, get_file_size(input_file)
+    
+    if mode is None:
+        raise ValueError("Mode is required to decrypt a file without a container header")
+    
+    if STDIO in (input_file, output_file):
+        # Without --iv the IV is read from the stream head
+        iv = bytes.fromhex(iv_hex) if iv_hex and mode != 'ecb' else None
+        return mode, transform_stdio('decrypt', mode, key_bytes, iv, input_file, output_file)
+    
+    input_size = get_file_size(input_file)
+    if mode in PARALLEL_MODES['decrypt'] and should_parallelize(input_size, jobs):
+        iv = bytes.fromhex(iv_hex) if iv_hex and mode != 'ecb' else None
+        with staged_output(input_file, output_file) as target:
+            tasks, finish = plan_parallel_file('decrypt', mode, key_bytes, iv, input_file, target, jobs)
+            try:
+                with stage('parallel'):
+                    run_parallel(process_file_segment, tasks, jobs)
+                add_bytes('parallel', input_size)
+                finish()
+            except Exception:
+                remove_file(target)
+                raise
+        return mode, input_size
+    
+    # Extract IV if needed
+    if mode in ['cbc', 'cfb', 'ofb', 'ctr']:
+        if iv_hex:
+            iv = bytes.fromhex(iv_hex)
+            offset = 0
+        else:
+            # IV is prepended to ciphertext
+            if input_size < 16:
+                raise ValueError("Ciphertext too short to contain IV")
+            iv = read_file_range(input_file, 0, 16)
+            offset = 16
+    else:
+        iv = None
+        offset = 0
+    
+    if use_mmap(io_mode, input_size):
+        transform_file_mapped('decrypt', mode, key_bytes, iv, input_file, offset, output_file)
+        return mode, input_size
+    
+    # Stream the ciphertext through the mode engine chunk by chunk
+    chunks = profile_iter('read', read_file_chunks(input_file, STREAM_CHUNK_SIZE, offset))
+    output = profile_iter('decrypt', transform_chunks(chunks, 'decrypt', mode, key_bytes, iv))
+    with stage('write'), staged_output(input_file, output_file) as target:
+        written = write_file_chunks(target, output)
+    add_bytes('write', written)
+    return mode, input_size
+
+def main():
+    """Main function for direct execution; takes the same options as main.py"""
+    from .cli import parse_arguments
+    from .main import run
+    try:
+        return run(parse_arguments())
+    except Exception as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    exit(main())
\ No newline at end of file
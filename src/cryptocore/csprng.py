@@ -0,0 +1,386 @@
+import os
+import threading
+
+# Bytes fetched from the OS per refill of the random pool
+POOL_SIZE = 64 * 1024
+
+# Requests of at least this many bytes go straight to os.urandom()
+POOL_BYPASS_SIZE = 4096
+
+class RandomPool:
+    """
+    Buffer of OS randomness handed out in slices
+    
+    One os.urandom() call refills the whole buffer, so generating many
+    16-byte keys and IVs costs one syscall per POOL_SIZE bytes instead of
+    one per value. Every slice is wiped from the buffer as it is handed
+    out, so no byte is ever returned twice or left behind. The pool is
+    shared by all threads, and after fork() the child discards the
+    inherited buffer (detected by PID) so parent and child never return
+    the same bytes.
+    
+    source(num_bytes) supplies the randomness (os.urandom by default) and
+    must be thread-safe, since large requests bypass the pool and its lock.
+    """
+    
+    def __init__(self, size=POOL_SIZE, bypass_size=POOL_BYPASS_SIZE, source=os.urandom):
+        self.size = size
+        self.source = source
+        self.bypass_size = min(bypass_size, size)
+        self.refills = 0
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._zeros = memoryview(bytes(size))
+        self._position = size
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+    
+    def _discard(self):
+        """Wipe the unread part of the buffer and mark the pool empty"""
+        self._buffer[self._position:] = self._zeros[self._position:]
+        self._position = self.size
+    
+    def _refill(self):
+        self._discard()
+        self._buffer[:] = self.source(self.size)
+        self._pid = os.getpid()
+        self._position = 0
+        self.refills += 1
+    
+    def _after_fork(self):
+        # The parent may have held the lock while forking
+        self._lock = threading.Lock()
+        self._discard()
+        self._pid = os.getpid()
+    
+    def read(self, num_bytes):
+        """
+        Return num_bytes random bytes
+        
+        Raises:
+            OSError: If the random source fails
+        """
+        if num_bytes >= self.bypass_size:
+            return self.source(num_bytes)
+        
+        with self._lock:
+            # A forked child must not hand out bytes its parent may also use
+            if self._position + num_bytes > self.size or self._pid != os.getpid():
+                self._refill()
+            position = self._position
+            end = position + num_bytes
+            data = self._view[position:end].tobytes()
+            self._view[position:end] = self._zeros[:num_bytes]
+            self._position = end
+        return data
+
+_pool = RandomPool()
+
+def generate_random_bytes(num_bytes):
+    """
+    Generates cryptographically secure random bytes from the OS (via a buffered pool)
+    
+    Args:
+        num_bytes (int): Number of bytes to generate
+    
+    Returns:
+        bytes: Random byte string
+    
+    Raises:
+        ValueError: If num_bytes <= 0
+        RuntimeError: If random generation fails
+    """
+    if num_bytes <= 0:
+        raise ValueError("Number of bytes must be positive")
+    
+    try:
+        return _pool.read(num_bytes)
+    except Exception as e:
+        raise RuntimeError(f"Failed to generate random bytes: {str(e)}")
+
+# Bytes fetched from the OS per call when generating many keys
+KEYGEN_BATCH_SIZE = 1024 * 1024
+
+def iter_key_batches(count, key_size=16, batch_size=KEYGEN_BATCH_SIZE):
+    """
+    Generates count keys (or IVs) from the OS in large batches
+    
+    Each yielded batch is one os.urandom() call holding a whole number of
+    keys laid end to end, so tens of thousands of keys cost a handful of
+    syscalls and callers can stream them out without holding all of them.
+    
+    Args:
+        count (int): Number of keys to generate
+        key_size (int): Bytes per key
+        batch_size (int): Upper bound on the bytes fetched per call
+    
+    Yields:
+        bytes: Batch of len(batch) // key_size keys
+    
+    Raises:
+        ValueError: If count or key_size <= 0
+        RuntimeError: If random generation fails
+    """
+    if count <= 0:
+        raise ValueError("Number of keys must be positive")
+    if key_size <= 0:
+        raise ValueError("Key size must be positive")
+    
+    keys_per_batch = max(1, batch_size // key_size)
+    remaining = count
+    while remaining:
+        batch_keys = min(remaining, keys_per_batch)
+        try:
+            batch = os.urandom(batch_keys * key_size)
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate random bytes: {str(e)}")
+        yield batch
+        remaining -= batch_keys
+
+def generate_keys(count, key_size=16):
+    """
+    Generates count independent keys (or IVs) in one call
+    
+    Args:
+        count (int): Number of keys to generate
+        key_size (int): Bytes per key
+    
+    Returns:
+        list: count random byte strings of key_size bytes
+    
+    Raises:
+        ValueError: If count or key_size <= 0
+        RuntimeError: If random generation fails
+    """
+    keys = []
+    for batch in iter_key_batches(count, key_size):
+        keys.extend(batch[i:i + key_size] for i in range(0, len(batch), key_size))
+    return keys
+
+# CTR_DRBG limits (NIST SP 800-90A, Table 3)
+DRBG_MAX_REQUEST = 1 << 16        # 2**19 bits per generate request
+DRBG_RESEED_INTERVAL = 1 << 32    # Generate requests between reseeds (at most 2**48)
+
+# Output buffered for small generate_drbg_bytes() requests
+DRBG_POOL_SIZE = 1024 * 1024
+
+class CtrDrbg:
+    """
+    AES CTR_DRBG from NIST SP 800-90A (no derivation function)
+    
+    Seeded with full-entropy input from os.urandom(). Output is AES-ECB
+    over the counter blocks V + 1, V + 2, ... built in bulk by
+    modes.ctr_counter_blocks, so it runs at bulk AES speed. Larger requests are split into
+    DRBG_MAX_REQUEST-byte generate calls, each followed by the state
+    update that gives backtracking resistance.
+    
+    With prediction_resistance every generate call first reseeds from the
+    entropy source; otherwise a reseed happens after reseed_interval
+    requests. Requests are serialized by an internal lock.
+    """
+    
+    def __init__(self, key_size=32, personalization=b'', prediction_resistance=False,
+                 reseed_interval=DRBG_RESEED_INTERVAL, entropy_source=os.urandom):
+        if key_size not in (16, 24, 32):
+            raise ValueError("Key size must be 16, 24 or 32 bytes")
+        if not 1 <= reseed_interval <= 1 << 48:
+            raise ValueError("Reseed interval must be between 1 and 2**48")
+        # Imported here so users of generate_random_bytes() never load the cipher engine
+        from Crypto.Cipher import AES
+        from .modes import ctr_counter_blocks
+        self._aes = AES
+        self._counter_blocks = ctr_counter_blocks
+        self.key_size = key_size
+        self.seed_length = key_size + 16
+        self.prediction_resistance = prediction_resistance
+        self.reseed_interval = reseed_interval
+        self.reseeds = 0
+        self._entropy_source = entropy_source
+        self._zeros = bytes(DRBG_MAX_REQUEST)
+        
+        self._key = bytes(key_size)
+        self._v = 0
+        self._update(self._xor_seed(self._entropy(), personalization))
+        self._reseed_counter = 1
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+    
+    def _entropy(self):
+        entropy = self._entropy_source(self.seed_length)
+        if len(entropy) != self.seed_length:
+            raise RuntimeError("Entropy source returned too few bytes")
+        return entropy
+    
+    def _xor_seed(self, entropy, data):
+        if len(data) > self.seed_length:
+            raise ValueError(f"Additional input must be at most {self.seed_length} bytes")
+        data = bytes(data).ljust(self.seed_length, b'\0')
+        return (int.from_bytes(entropy, 'big') ^ int.from_bytes(data, 'big')).to_bytes(self.seed_length, 'big')
+    
+    def _update(self, provided_data, temp=None):
+        """
+        CTR_DRBG_Update: derive the next (Key, V)
+        
+        temp may hold the seed_length keystream bytes for V + 1, ... when
+        they were already produced together with the output.
+        """
+        if temp is None:
+            cipher = self._aes.new(self._key, self._aes.MODE_ECB)
+            temp = cipher.encrypt(self._counter_blocks(self._v + 1, self.seed_length // 16))
+        if provided_data is not None:
+            temp = (int.from_bytes(temp, 'big') ^ int.from_bytes(provided_data, 'big')).to_bytes(self.seed_length, 'big')
+        self._key = bytes(temp[:self.key_size])
+        self._v = int.from_bytes(temp[self.key_size:], 'big')
+    
+    def _after_fork(self):
+        # The parent may have held the lock while forking; the PID check
+        # makes the next request reseed
+        self._lock = threading.Lock()
+    
+    def reseed(self, additional_input=b''):
+        """Mix fresh entropy (and optional additional input) into the state"""
+        with self._lock:
+            self._reseed(additional_input)
+    
+    def _reseed(self, additional_input):
+        self._update(self._xor_seed(self._entropy(), additional_input))
+        self._reseed_counter = 1
+        self._pid = os.getpid()
+        self.reseeds += 1
+    
+    def _generate_request(self, output, additional_input):
+        if (self.prediction_resistance or self._reseed_counter > self.reseed_interval
+                or self._pid != os.getpid()):
+            # A forked child reseeds so it never repeats its parent's output
+            self._reseed(additional_input)
+            additional_input = b''
+        additional = None
+        if additional_input:
+            additional = self._xor_seed(bytes(self.seed_length), additional_input)
+            self._update(additional)
+        
+        # Output blocks and the blocks of the following update in one ECB pass
+        length = len(output)
+        full = length - length % 16
+        counters = memoryview(self._counter_blocks(self._v + 1, -(-length // 16) + self.seed_length // 16))
+        cipher = self._aes.new(self._key, self._aes.MODE_ECB)
+        if full:
+            cipher.encrypt(counters[:full], output=output[:full])
+        tail = cipher.encrypt(counters[full:])
+        output[full:] = tail[:length - full]
+        self._update(additional, tail[-self.seed_length:])
+        self._reseed_counter += 1
+    
+    def generate_into(self, buffer, additional_input=b''):
+        """
+        Fill a writable buffer with random bytes
+        
+        Args:
+            buffer (bytes-like): Writable buffer (bytearray, memoryview, mmap)
+            additional_input (bytes): Optional input mixed into every request
+        """
+        view = memoryview(buffer).cast('B')
+        with self._lock:
+            for start in range(0, len(view), DRBG_MAX_REQUEST):
+                self._generate_request(view[start:start + DRBG_MAX_REQUEST], additional_input)
+    
+    def generate(self, num_bytes, additional_input=b''):
+        """
+        Return num_bytes random bytes
+        
+        Raises:
+            ValueError: If num_bytes <= 0 or additional_input is too long
+        """
+        if num_bytes <= 0:
+            raise ValueError("Number of bytes must be positive")
+        out = bytearray(num_bytes)
+        self.generate_into(out, additional_input)
+        return bytes(out)
+
+_drbg = None
+_drbg_pool = None
+_drbg_lock = threading.Lock()
+
+def generate_drbg_bytes(num_bytes):
+    """
+    Generates random bytes from a shared AES-256 CTR_DRBG
+    
+    Much faster than generate_random_bytes() for bulk output such as test
+    corpora or padding fill; small requests are served from a pool the
+    DRBG refills. Keys and IVs should keep using generate_random_bytes().
+    
+    Args:
+        num_bytes (int): Number of bytes to generate
+    
+    Returns:
+        bytes: Random byte string
+    
+    Raises:
+        ValueError: If num_bytes <= 0
+        RuntimeError: If seeding fails
+    """
+    global _drbg, _drbg_pool
+    if num_bytes <= 0:
+        raise ValueError("Number of bytes must be positive")
+    
+    try:
+        if _drbg_pool is None:
+            with _drbg_lock:
+                if _drbg_pool is None:
+                    _drbg = CtrDrbg()
+                    _drbg_pool = RandomPool(DRBG_POOL_SIZE, DRBG_MAX_REQUEST, _drbg.generate)
+        return _drbg_pool.read(num_bytes)
+    except OSError as e:
+        raise RuntimeError(f"Failed to seed random generator: {str(e)}")
+
+def random_pool_stats():
+    """Refill counts of the shared pools ('os' and, once used, 'drbg')"""
+    stats = {'os': _pool.refills}
+    if _drbg_pool is not None:
+        stats['drbg'] = _drbg_pool.refills
+    return stats
+
+def _after_fork_in_child():
+    global _drbg_lock
+    _pool._after_fork()
+    _drbg_lock = threading.Lock()
+    if _drbg_pool is not None:
+        _drbg._after_fork()
+        _drbg_pool._after_fork()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+def bytes_to_hex(byte_string):
+    """Convert bytes to hexadecimal string"""
+    return byte_string.hex()
+
+def hex_to_bytes(hex_string):
+    """Convert hexadecimal string to bytes"""
+    return bytes.fromhex(hex_string)
+
+# Test function for demonstration
+def test_csprng():
+    """Test the CSPRNG functions"""
+    print("Testing CSPRNG...")
+    
+    # Test basic generation
+    random_bytes = generate_random_bytes(16)
+    print(f"Generated 16 bytes: {len(random_bytes)}")
+    
+    # Test conversion
+    hex_string = bytes_to_hex(random_bytes)
+    print(f"Hex representation: {hex_string}")
+    
+    # Test back conversion
+    back_to_bytes = hex_to_bytes(hex_string)
+    print(f"Back to bytes matches: {random_bytes == back_to_bytes}")
+    
+    # Test uniqueness
+    unique_test = set()
+    for i in range(10):
+        unique_test.add(generate_random_bytes(16))
+    print(f"Generated {len(unique_test)} unique random sequences")
+
+if __name__ == "__main__":
+    test_csprng()
\ No newline at end of file
@@ -0,0 +1,184 @@
+# daemon.py
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from .ciphers import new_cipher
+from .csprng import generate_random_bytes
+from .metrics import record_operation, record_error, serve_metrics, parse_address
+from .protocol import (DEFAULT_SOCKET_PATH, MAX_FRAME_SIZE, FRAME_REQUEST, FRAME_DATA, FRAME_END,
+                      FRAME_ERROR, send_frame, recv_frame, decode_request, prepare_socket_dir)
+
+# Modes that store an IV in front of the ciphertext
+IV_MODES = ['cbc', 'cfb', 'ofb', 'ctr']
+
+class BufferPool:
+    """Reusable (receive, output) buffer pairs, one pair per active connection"""
+    
+    def __init__(self, size=MAX_FRAME_SIZE):
+        self.size = size
+        self._idle = []
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return bytearray(self.size), bytearray(self.size + 32)
+    
+    def release(self, buffers):
+        with self._lock:
+            self._idle.append(buffers)
+
+class RequestHandler(socketserver.BaseRequestHandler):
+    """Serve requests on one client connection until it is closed"""
+    
+    def handle(self):
+        buffers = self.server.buffers.acquire()
+        try:
+            while True:
+                frame_type, payload = recv_frame(self.request, buffers[0])
+                if frame_type is None:
+                    return
+                if frame_type != FRAME_REQUEST:
+                    send_frame(self.request, FRAME_ERROR, b"Expected a request frame")
+                    return
+                self._serve_request(payload, buffers)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.server.buffers.release(buffers)
+    
+    def _serve_request(self, payload, buffers):
+        sock = self.request
+        in_buffer, out_buffer = buffers
+        out_view = memoryview(out_buffer)
+        cipher = None
+        operation = 'unknown'
+        start = time.perf_counter()
+        processed = 0
+        
+        try:
+            operation, mode, key, iv = decode_request(payload)
+            head = b''
+            if mode in IV_MODES and operation == 'encrypt':
+                # The IV goes in front of the ciphertext, as in encrypted files
+                iv = iv or generate_random_bytes(16)
+                head = iv
+            # Without an explicit IV, decryption reads it from the stream head
+            pending_iv = bytearray() if mode in IV_MODES and iv is None else None
+            if pending_iv is None:
+                # The AES key schedule comes from the shared cipher cache, keyed by digest
+                cipher = new_cipher(operation, mode, key, iv)
+            send_frame(sock, FRAME_DATA, head)
+            
+            while True:
+                frame_type, data = recv_frame(sock, in_buffer)
+                if frame_type == FRAME_DATA:
+                    processed += len(data)
+                    if cipher is None:
+                        needed = 16 - len(pending_iv)
+                        pending_iv += data[:needed]
+                        data = data[needed:]
+                        if len(pending_iv) == 16:
+                            cipher = new_cipher(operation, mode, key, pending_iv)
+                    written = cipher.update_into(data, out_view) if cipher else 0
+                    send_frame(sock, FRAME_DATA, out_view[:written])
+                elif frame_type == FRAME_END:
+                    if cipher is None:
+                        raise ValueError("Ciphertext too short to contain IV")
+                    send_frame(sock, FRAME_END, cipher.finalize())
+                    record_operation(operation, mode, processed, time.perf_counter() - start)
+                    return
+                elif frame_type is None:
+                    raise ConnectionError("Connection closed in the middle of a request")
+                else:
+                    raise ValueError("Expected a data or end frame")
+        except ValueError as e:
+            record_error(operation, e)
+            send_frame(sock, FRAME_ERROR, str(e).encode())
+
+class CryptoDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix domain socket server holding the buffer pool; prepared keys live in cipher_cache"""
+    daemon_threads = True
+    
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+        self.buffers = BufferPool()
+        if socket_path == DEFAULT_SOCKET_PATH:
+            prepare_socket_dir(os.path.dirname(socket_path))
+        _remove_stale_socket(socket_path)
+        # Keys travel over the socket, so only the owner may connect
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(socket_path, RequestHandler)
+        finally:
+            os.umask(old_umask)
+    
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+def _remove_stale_socket(socket_path):
+    """Remove a socket file left behind by a daemon that is no longer running"""
+    if not os.path.exists(socket_path):
+        return
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except OSError:
+        os.remove(socket_path)
+        return
+    finally:
+        probe.close()
+    raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+def _terminate(signum, frame):
+    # Let SIGTERM unwind serve_forever() like Ctrl-C, so the socket file is removed
+    raise KeyboardInterrupt
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='CryptoCore - encryption daemon')
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH, help='Unix domain socket path')
+    parser.add_argument('--metrics', help='Serve Prometheus metrics over HTTP on host:port, or on a Unix socket path')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    """Run the daemon until interrupted"""
+    args = parse_arguments(argv)
+    try:
+        server = CryptoDaemon(args.socket)
+    except Exception as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return 1
+    
+    metrics_server = None
+    if args.metrics:
+        try:
+            metrics_server = serve_metrics(parse_address(args.metrics))
+        except Exception as e:
+            server.server_close()
+            print(f"[ERROR] Cannot serve metrics: {e}", file=sys.stderr)
+            return 1
+        print(f"[INFO] Serving metrics on {args.metrics}")
+    
+    signal.signal(signal.SIGTERM, _terminate)
+    print(f"[INFO] Listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[INFO] Shutting down")
+    finally:
+        server.server_close()
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+import os
+import mmap
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+def read_file(filename):
+    """
+    Read entire file content as bytes
+    
+    Args:
+        filename (str): Path to file
+        
+    Returns:
+        bytes: File content
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        IOError: If file cannot be read
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+    except Exception as e:
+        raise IOError(f"Error reading file {filename}: {str(e)}")
+
+def write_file(filename, data):
+    """
+    Write data to file
+    
+    Args:
+        filename (str): Path to file
+        data (bytes): Data to write
+        
+    Raises:
+        IOError: If file cannot be written
+    """
+    try:
+        # Create directory if it doesn't exist (only if path contains directories)
+        dir_name = os.path.dirname(filename)
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name, exist_ok=True)
+        
+        with open(filename, 'wb') as f:
+            f.write(data)
+    except Exception as e:
+        raise IOError(f"Error writing file {filename}: {str(e)}")
+
+def read_file_chunks(filename, chunk_size=4096, offset=0):
+    """
+    Read file in chunks (generator)
+    
+    Args:
+        filename (str): Path to file
+        chunk_size (int): Size of each chunk
+        offset (int): Byte offset to start reading at
+        
+    Yields:
+        bytes: File chunks
+    """
+    try:
+        with open(filename, 'rb') as f:
+            f.seek(offset)
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+    except Exception as e:
+        raise IOError(f"Error reading file {filename}: {str(e)}")
+
+def write_file_chunks(filename, chunks, header=b''):
+    """
+    Write a stream of chunks to file
+    
+    The partially written file is removed if producing a chunk fails, so a
+    failed decryption does not leave truncated output behind.
+    
+    Args:
+        filename (str): Path to file
+        chunks (iterable): Chunks (bytes) to write in order
+        header (bytes): Data written before the first chunk
+        
+    Returns:
+        int: Number of bytes written
+        
+    Raises:
+        IOError: If file cannot be written
+    """
+    dir_name = os.path.dirname(filename)
+    if dir_name and not os.path.exists(dir_name):
+        os.makedirs(dir_name, exist_ok=True)
+    
+    written = 0
+    try:
+        with open(filename, 'wb') as f:
+            f.write(header)
+            written += len(header)
+            for chunk in chunks:
+                f.write(chunk)
+                written += len(chunk)
+    except OSError as e:
+        remove_file(filename)
+        raise IOError(f"Error writing file {filename}: {str(e)}")
+    except Exception:
+        remove_file(filename)
+        raise
+    return written
+
+def remove_file(filename):
+    """Remove a file if it exists, ignoring errors"""
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+def same_file(input_file, output_file):
+    """Check whether output_file already exists as input_file (also through links)"""
+    return os.path.exists(output_file) and os.path.samefile(input_file, output_file)
+
+@contextmanager
+def staged_output(input_file, output_file):
+    """
+    Yield the path to write output_file through
+    
+    Writing usually truncates output_file before the input has been read,
+    so when both are the same file the output goes to a temporary file in
+    the same directory, which replaces the input only once writing
+    succeeded. A failed run leaves the input untouched.
+    
+    Args:
+        input_file (str): Path the operation reads
+        output_file (str): Path the operation should produce
+    
+    Yields:
+        str: output_file itself, or the temporary file standing in for it
+    """
+    if not same_file(input_file, output_file):
+        yield output_file
+        return
+    
+    fd, temp_file = tempfile.mkstemp(prefix=f".{os.path.basename(output_file)}.",
+                                     dir=os.path.dirname(os.path.abspath(output_file)))
+    os.close(fd)
+    try:
+        yield temp_file
+        shutil.copymode(output_file, temp_file)
+        os.replace(temp_file, output_file)
+    except BaseException:
+        remove_file(temp_file)
+        raise
+
+def read_file_range(filename, offset, length):
+    """
+    Read length bytes starting at offset
+    
+    Args:
+        filename (str): Path to file
+        offset (int): Byte offset to start reading at
+        length (int): Number of bytes to read
+        
+    Returns:
+        bytes: File content (shorter than length at end of file)
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        IOError: If file cannot be read
+    """
+    try:
+        with open(filename, 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+    except Exception as e:
+        raise IOError(f"Error reading file {filename}: {str(e)}")
+
+def write_file_range(filename, offset, data):
+    """
+    Write data into an existing file at offset, in place
+    
+    Args:
+        filename (str): Path to file
+        offset (int): Byte offset to start writing at
+        data (bytes): Data to write
+        
+    Raises:
+        IOError: If file cannot be written
+    """
+    try:
+        with open(filename, 'r+b') as f:
+            f.seek(offset)
+            f.write(data)
+    except Exception as e:
+        raise IOError(f"Error writing file {filename}: {str(e)}")
+
+def create_file(filename, size):
+    """
+    Create (or truncate) a file and pre-size it to size bytes
+    
+    Args:
+        filename (str): Path to file
+        size (int): File size in bytes
+        
+    Raises:
+        IOError: If file cannot be created
+    """
+    try:
+        dir_name = os.path.dirname(filename)
+        if dir_name and not os.path.exists(dir_name):
+            os.makedirs(dir_name, exist_ok=True)
+        
+        with open(filename, 'wb') as f:
+            f.truncate(size)
+    except Exception as e:
+        raise IOError(f"Error creating file {filename}: {str(e)}")
+
+def truncate_file(filename, size):
+    """Truncate an existing file to size bytes"""
+    try:
+        with open(filename, 'r+b') as f:
+            f.truncate(size)
+    except Exception as e:
+        raise IOError(f"Error truncating file {filename}: {str(e)}")
+
+@contextmanager
+def map_input_file(filename):
+    """
+    Map a file read-only into memory
+    
+    The mapping is exposed as a zero-copy memoryview. Slices taken from it
+    must be released before the context exits.
+    
+    Args:
+        filename (str): Path to file
+        
+    Yields:
+        memoryview: Read-only view of the whole file
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist
+        IOError: If file cannot be mapped
+    """
+    try:
+        f = open(filename, 'rb')
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filename}")
+    
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            yield memoryview(b'')
+            return
+        try:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception as e:
+            raise IOError(f"Error mapping file {filename}: {str(e)}")
+        with mapping:
+            view = memoryview(mapping)
+            try:
+                yield view
+            finally:
+                view.release()
+
+@contextmanager
+def map_output_file(filename, size):
+    """
+    Create a file of size bytes and map it writable into memory
+    
+    The file is pre-sized with ftruncate so results can be written in
+    place. Callers that produce less data than size should truncate the
+    file after the context exits.
+    
+    Args:
+        filename (str): Path to file
+        size (int): File size in bytes
+        
+    Yields:
+        memoryview: Writable view of the whole file
+        
+    Raises:
+        IOError: If file cannot be created or mapped
+    """
+    create_file(filename, size)
+    
+    with open(filename, 'r+b') as f:
+        if size == 0:
+            yield memoryview(bytearray())
+            return
+        try:
+            mapping = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_WRITE)
+        except Exception as e:
+            raise IOError(f"Error mapping file {filename}: {str(e)}")
+        with mapping:
+            view = memoryview(mapping)
+            try:
+                yield view
+            finally:
+                view.release()
+                mapping.flush()
+
+def read_manifest(filename):
+    """
+    Read a manifest of input paths
+    
+    Args:
+        filename (str): Path to manifest; one path per line, blank lines and
+            lines starting with '#' are ignored
+        
+    Returns:
+        list: Paths in manifest order
+    """
+    content = read_file(filename).decode('utf-8')
+    paths = []
+    for line in content.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#'):
+            paths.append(line)
+    return paths
+
+def collect_files(paths):
+    """
+    Expand paths into the list of files to process
+    
+    Directories are walked recursively in sorted order. Each file is
+    returned with a relative name: its path below the directory it was
+    found in, or its base name for files given directly.
+    
+    Args:
+        paths (list): File and directory paths
+        
+    Returns:
+        list: (file_path, relative_name) pairs, without duplicates
+    """
+    files = []
+    seen = set()
+    
+    for path in paths:
+        if os.path.isdir(path):
+            found = []
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    file_path = os.path.join(dir_path, file_name)
+                    found.append((file_path, os.path.relpath(file_path, path)))
+        else:
+            found = [(path, os.path.basename(path))]
+        
+        for file_path, relative_name in found:
+            key = os.path.abspath(file_path)
+            if key not in seen:
+                seen.add(key)
+                files.append((file_path, relative_name))
+    
+    return files
+
+def file_exists(filename):
+    """Check if file exists"""
+    return os.path.exists(filename)
+
+def get_file_size(filename):
+    """Get file size in bytes"""
+    return os.path.getsize(filename)
+
+# Test function
+def test_file_utils():
+    """Test file utility functions"""
+    test_filename = "test_file_utils.txt"
+    test_data = b"Hello, CryptoCore! This is a test."
+    
+    try:
+        # Test write and read
+        write_file(test_filename, test_data)
+        print(f"✓ File written: {test_filename}")
+        
+        # Test read
+        read_back = read_file(test_filename)
+        print(f"✓ File read: {len(read_back)} bytes")
+        
+        # Test chunk reading
+        chunks = list(read_file_chunks(test_filename, chunk_size=10))
+        print(f"✓ Chunk reading: {len(chunks)} chunks")
+        
+        # Test file exists
+        if file_exists(test_filename):
+            print(f"✓ File exists check")
+        
+        # Test file size
+        size = get_file_size(test_filename)
+        print(f"✓ File size: {size} bytes")
+        
+        # Cleanup
+        os.remove(test_filename)
+        print("✓ Test cleanup completed")
+        
+    except Exception as e:
+        print(f"✗ Test failed: {e}")
+
+if __name__ == "__main__":
+    test_file_utils()
\ No newline at end of file
@@ -0,0 +1,89 @@
+# keygen.py
+import argparse
+import os
+import sys
+import time
+from .csprng import iter_key_batches, KEYGEN_BATCH_SIZE
+
+OUTPUT_FORMATS = ['hex', 'raw']
+
+def format_batch(batch, key_size, output_format):
+    """Render a batch of keys as one hex line per key, or pass raw bytes through"""
+    if output_format == 'raw':
+        return batch
+    hex_batch = batch.hex()
+    width = 2 * key_size
+    lines = [hex_batch[i:i + width] for i in range(0, len(hex_batch), width)]
+    return ('\n'.join(lines) + '\n').encode('ascii')
+
+def write_keys(out, count, key_size=16, output_format='hex', batch_size=KEYGEN_BATCH_SIZE):
+    """
+    Generate count keys and write them to a binary stream batch by batch
+    
+    Args:
+        out: Binary file-like object
+        count (int): Number of keys
+        key_size (int): Bytes per key
+        output_format (str): 'hex' (one key per line) or 'raw'
+        batch_size (int): Bytes of randomness fetched per call
+    
+    Returns:
+        int: Bytes written
+    
+    Raises:
+        ValueError: If the format, count or key size is invalid
+        RuntimeError: If random generation fails
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    written = 0
+    for batch in iter_key_batches(count, key_size, batch_size):
+        data = format_batch(batch, key_size, output_format)
+        out.write(data)
+        written += len(data)
+    out.flush()
+    return written
+
+def open_output(path):
+    """Open the output file for writing; readable by the owner only, since it holds keys"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    return os.fdopen(fd, 'wb')
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description='CryptoCore - bulk key/IV generation')
+    parser.add_argument('--count', type=int, default=1, help='Number of keys to generate')
+    parser.add_argument('--size', type=int, default=16, help='Bytes per key (16/24/32 for AES keys, 16 for IVs)')
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='hex', help='Hex lines or raw binary')
+    parser.add_argument('--output', default='-', help="Output file ('-' for stdout)")
+    args = parser.parse_args(argv)
+    if args.count <= 0:
+        parser.error("--count must be positive")
+    if args.size <= 0:
+        parser.error("--size must be positive")
+    return args
+
+def main(argv=None):
+    """Generate keys as requested on the command line"""
+    args = parse_arguments(argv)
+    start = time.perf_counter()
+    try:
+        if args.output == '-':
+            written = write_keys(sys.stdout.buffer, args.count, args.size, args.format)
+        else:
+            with open_output(args.output) as out:
+                written = write_keys(out, args.count, args.size, args.format)
+    except Exception as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+    
+    # Status goes to stderr so it never mixes with keys written to stdout
+    random_bytes = args.count * args.size
+    rate = args.count / elapsed if elapsed > 0 else float('inf')
+    mb_per_s = random_bytes / elapsed / (1024 * 1024) if elapsed > 0 else float('inf')
+    print(f"[SUCCESS] Generated {args.count} keys of {args.size} bytes ({written} bytes written) "
+          f"in {elapsed:.3f}s: {rate:.0f} keys/s, {mb_per_s:.1f} MB/s", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import sys
+
+# Only the argument parser is loaded up front; the cipher engine is
+# imported once an operation actually runs, so --help and usage errors
+# stay cheap.
+from .cli import parse_arguments
+
+def run(args):
+    """Run the operation described by parsed arguments; returns the exit status"""
+    if args.batch:
+        from .batch import run_batch_from_args
+        return run_batch_from_args(args)
+    
+    from .crypto import encrypt_file, decrypt_file, STDIO
+    
+    # Status lines must not mix with data written to stdout
+    status = sys.stderr if args.output == STDIO else sys.stdout
+    
+    if args.encrypt:
+        result = encrypt_file(
+            algorithm=args.algorithm,
+            mode=args.mode,
+            key_hex=args.key,
+            input_file=args.input,
+            output_file=args.output,
+            iv_hex=args.iv,
+            jobs=args.jobs,
+            io_mode=args.io,
+            file_format=args.format or 'raw'
+        )
+        if isinstance(result, tuple) and len(result) == 2:
+            used_key, used_iv = result
+            print(f"[SUCCESS] Encryption completed", file=status)
+            if not args.key:
+                print(f"[IMPORTANT] Generated key: {used_key}", file=status)
+        else:
+            print(f"[SUCCESS] Encryption completed", file=status)
+    
+    elif args.decrypt:
+        decrypt_file(
+            algorithm=args.algorithm,
+            mode=args.mode,
+            key_hex=args.key,
+            input_file=args.input,
+            output_file=args.output,
+            iv_hex=args.iv,
+            jobs=args.jobs,
+            io_mode=args.io,
+            file_format=args.format
+        )
+        print(f"[SUCCESS] Decryption completed", file=status)
+    return 0
+
+def main():
+    if sys.argv[1:2] == ['daemon']:
+        # Long-running mode: serve requests over a Unix domain socket
+        from .daemon import main as daemon_main
+        sys.exit(daemon_main(sys.argv[2:]))
+    if sys.argv[1:2] == ['keygen']:
+        # Bulk key/IV generation for provisioning
+        from .keygen import main as keygen_main
+        sys.exit(keygen_main(sys.argv[2:]))
+    
+    try:
+        args = parse_arguments()
+        
+        try:
+            if args.profile:
+                from .profiler import profile_call
+                status = profile_call(run, args, output=args.profile_output, output_format=args.profile_format,
+                                      track_allocations=args.profile_memory)
+            else:
+                status = run(args)
+        finally:
+            if args.metrics_file:
+                # Written on failure too, so error counters reach the collector
+                from .metrics import write_metrics
+                write_metrics(args.metrics_file)
+    
+    except Exception as e:
+        print(f"[ERROR] {e}", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
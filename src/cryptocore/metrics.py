@@ -0,0 +1,292 @@
+# metrics.py
+import os
+import stat
+import sys
+import threading
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+               for value in labels.values())
+    return '{' + ','.join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + '}'
+
+class Metric:
+    """Base of labelled metrics; children are kept per label-value tuple"""
+    type_name = None
+    
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+    
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"Metric {self.name} takes labels {self.labelnames}")
+        try:
+            return tuple(str(labels[name]) for name in self.labelnames)
+        except KeyError:
+            raise ValueError(f"Metric {self.name} takes labels {self.labelnames}")
+    
+    def samples(self):
+        """Return (name suffix, labels dict, value) tuples for every child"""
+        raise NotImplementedError
+
+class Counter(Metric):
+    """Monotonically increasing count; the name must end in _total"""
+    type_name = 'counter'
+    
+    def __init__(self, name, documentation, labelnames=()):
+        if not name.endswith('_total'):
+            raise ValueError(f"Counter name must end in _total: {name}")
+        super().__init__(name, documentation, labelnames)
+    
+    def inc(self, amount=1, **labels):
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels):
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+    
+    def samples(self):
+        with self._lock:
+            items = list(self._values.items())
+        return [('', dict(zip(self.labelnames, key)), value) for key, value in items]
+
+class Histogram(Metric):
+    """Distribution of observed values over fixed buckets"""
+    type_name = 'histogram'
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+    
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # Per-bucket counts, then sum and count
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+    
+    def count(self, **labels):
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-1] if state else 0
+    
+    def samples(self):
+        with self._lock:
+            items = [(key, list(state)) for key, state in self._values.items()]
+        samples = []
+        for key, state in items:
+            labels = dict(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                samples.append(('_bucket', dict(labels, le=_format_value(float(bound))), cumulative))
+            samples.append(('_sum', labels, state[-2]))
+            samples.append(('_count', labels, state[-1]))
+        return samples
+
+class MetricsRegistry:
+    """
+    Named counters and histograms plus collectors, rendered as Prometheus text
+    
+    counter() and histogram() return the existing metric when the name is
+    already registered, so instrumented code can look metrics up where it
+    needs them. Collectors are callables run at render time that return
+    (name, type, documentation, [(labels dict, value), ...]) tuples; they
+    expose counters the engine already keeps (cipher cache hits, random
+    pool refills) without touching its hot paths.
+    """
+    
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+    
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with another type or labels")
+            return metric
+    
+    def counter(self, name, documentation, labelnames=()):
+        return self._get_or_create(Counter, name, documentation, labelnames)
+    
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+    
+    def register_collector(self, collector):
+        with self._lock:
+            self._collectors.append(collector)
+    
+    def render(self):
+        """Return every metric in the Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        for collector in collectors:
+            for name, type_name, documentation, samples in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {type_name}")
+                for labels, value in samples:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return '\n'.join(lines) + '\n'
+
+def collect_engine_stats():
+    """Collector for the cipher cache and random pool counters of already loaded modules"""
+    families = []
+    cipher_cache = sys.modules.get(f'{__package__}.cipher_cache')
+    if cipher_cache is not None:
+        stats = cipher_cache.cache_stats()
+        for field in ['hits', 'misses', 'evictions']:
+            families.append((f'cryptocore_cipher_cache_{field}_total', 'counter',
+                             f'Cipher cache {field}', [({}, stats[field])]))
+        families.append(('cryptocore_cipher_cache_size', 'gauge', 'Prepared AES objects cached',
+                         [({}, stats['size'])]))
+    csprng = sys.modules.get(f'{__package__}.csprng')
+    if csprng is not None:
+        refills = [({'source': source}, count) for source, count in csprng.random_pool_stats().items()]
+        families.append(('cryptocore_random_pool_refills_total', 'counter',
+                         'Random pool refills', refills))
+    return families
+
+_registry = MetricsRegistry()
+_registry.register_collector(collect_engine_stats)
+
+def get_registry():
+    """Return the registry the engine reports to"""
+    return _registry
+
+def set_registry(registry):
+    """
+    Make registry the one the engine reports to
+    
+    Any object with counter(), histogram() and render() methods works.
+    Register collect_engine_stats on it to keep the cache and random pool
+    counters.
+    
+    Returns:
+        The previous registry
+    """
+    global _registry
+    previous, _registry = _registry, registry
+    return previous
+
+def record_operation(operation, mode, num_bytes, seconds=None):
+    """Count one completed encrypt/decrypt call; seconds feeds the latency histogram"""
+    registry = _registry
+    labels = {'operation': operation, 'mode': mode}
+    registry.counter('cryptocore_operations_total', 'Completed operations',
+                     ('operation', 'mode')).inc(**labels)
+    registry.counter('cryptocore_bytes_total', 'Input bytes processed',
+                     ('operation', 'mode')).inc(num_bytes, **labels)
+    if seconds is not None:
+        registry.histogram('cryptocore_operation_seconds', 'Latency of one operation',
+                           ('operation', 'mode')).observe(seconds, **labels)
+
+def record_error(operation, error):
+    """Count one failed call by exception type (PaddingError, FileNotFoundError, ...)"""
+    _registry.counter('cryptocore_errors_total', 'Failed operations by error type',
+                      ('operation', 'type')).inc(operation=operation, type=type(error).__name__)
+
+def write_metrics(path, registry=None):
+    """
+    Write the registry to path in the Prometheus text format
+    
+    The file is replaced atomically, so a collector (e.g. the node
+    exporter textfile collector) never reads a partial dump.
+    """
+    text = (registry or _registry).render()
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+def parse_address(text):
+    """Parse 'host:port' (or ':port') into a (host, port) tuple; anything else is a socket path"""
+    host, _, port = text.rpartition(':')
+    if port.isdigit() and '/' not in text:
+        return (host or '127.0.0.1', int(port))
+    return text
+
+def serve_metrics(address, registry=None):
+    """
+    Serve the registry from a background thread
+    
+    Args:
+        address: (host, port) for an HTTP endpoint Prometheus can scrape,
+            or a Unix socket path that writes the text dump to every
+            connection and closes it
+        registry: Registry to serve (default: the current one at each request)
+    
+    Returns:
+        The server; call shutdown() and server_close() to stop it
+    """
+    import socketserver
+    
+    def render():
+        return (registry or _registry).render().encode()
+    
+    if isinstance(address, str):
+        class DumpHandler(socketserver.BaseRequestHandler):
+            def handle(self):
+                self.request.sendall(render())
+        
+        # Replace a socket left behind by an earlier run, never a regular file
+        if os.path.exists(address) and stat.S_ISSOCK(os.stat(address).st_mode):
+            os.remove(address)
+        server = socketserver.ThreadingUnixStreamServer(address, DumpHandler)
+    else:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = render()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        server = ThreadingHTTPServer(address, MetricsHandler)
+    
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,367 @@
+from .cipher_cache import get_cipher
+from .utils import pkcs7_pad, pkcs7_unpad
+from .xor import xor_bytes, xor_into
+from .parallel import should_parallelize, resolve_jobs, split_blocks, run_parallel
+
+# ECB Mode
+# Bytes handed to the cipher per bulk ECB call
+ECB_CHUNK_SIZE = 1024 * 1024
+
+def ecb_process(transform, data, out):
+    """
+    Run a bulk ECB transform over data in large chunks
+    
+    Args:
+        transform: Bound encrypt or decrypt method of an ECB cipher object
+        data (bytes-like): Input, a multiple of the block size
+        out (memoryview): Writable buffer of len(data) bytes
+    """
+    data = memoryview(data)
+    
+    for i in range(0, len(data), ECB_CHUNK_SIZE):
+        transform(data[i:i+ECB_CHUNK_SIZE], output=out[i:i+ECB_CHUNK_SIZE])
+
+def ecb_encrypt(plaintext, key):
+    """ECB mode encryption"""
+    cipher = get_cipher(key)
+    plaintext = memoryview(plaintext)
+    # Full blocks are encrypted in place; only the tail is copied for padding
+    full_length = len(plaintext) - len(plaintext) % 16
+    ciphertext = bytearray(full_length + 16)
+    out = memoryview(ciphertext)
+    ecb_process(cipher.encrypt, plaintext[:full_length], out[:full_length])
+    cipher.encrypt(pkcs7_pad(bytes(plaintext[full_length:])), output=out[full_length:])
+    return bytes(ciphertext)
+
+def ecb_decrypt(ciphertext, key):
+    """ECB mode decryption"""
+    cipher = get_cipher(key)
+    plaintext = bytearray(len(ciphertext))
+    ecb_process(cipher.decrypt, ciphertext, memoryview(plaintext))
+    return bytes(pkcs7_unpad(plaintext))
+
+# CBC Mode
+def cbc_encrypt_process(cipher, data, out, prev_block):
+    """
+    Encrypt a CBC span (full blocks only)
+    
+    Returns:
+        bytes: Last ciphertext block of the span
+    """
+    data = memoryview(data)
+    
+    for i in range(0, len(data), 16):
+        block = data[i:i+16]
+        # XOR with previous ciphertext block (or IV for first block)
+        xor_block = xor_bytes(block, prev_block)
+        # Per block, returning bytes is cheaper than encrypting into a view
+        prev_block = cipher.encrypt(xor_block)
+        out[i:i+16] = prev_block
+    
+    return bytes(prev_block)
+
+def cbc_encrypt(plaintext, key, iv):
+    """CBC mode encryption"""
+    cipher = get_cipher(key)
+    padded_plaintext = pkcs7_pad(plaintext)
+    ciphertext = bytearray(len(padded_plaintext))
+    cbc_encrypt_process(cipher, padded_plaintext, memoryview(ciphertext), iv)
+    return bytes(ciphertext)
+
+def cbc_decrypt_process(cipher, data, out, prev_block):
+    """
+    Decrypt a CBC span without walking the chain
+    
+    Every plaintext block is D(C_i) XOR C_{i-1}, so the span is decrypted with
+    bulk ECB calls and XORed against the ciphertext shifted by one block.
+    
+    Args:
+        cipher: AES object in ECB mode
+        data (bytes-like): Ciphertext span, a multiple of the block size
+        out (memoryview): Writable buffer of len(data) bytes
+        prev_block (bytes-like): Ciphertext block preceding the span (or IV)
+    
+    Returns:
+        bytes: Last ciphertext block of the span
+    """
+    data = memoryview(data)
+    
+    for i in range(0, len(data), ECB_CHUNK_SIZE):
+        chunk = data[i:i+ECB_CHUNK_SIZE]
+        span = out[i:i+ECB_CHUNK_SIZE]
+        cipher.decrypt(chunk, output=span)
+        # Ciphertext shifted by one block, with the previous block in front
+        shifted = bytes(prev_block) + bytes(chunk[:-16])
+        xor_into(span, span, shifted)
+        prev_block = chunk[-16:]
+    
+    return bytes(prev_block)
+
+def cbc_decrypt_segment(task):
+    """Decrypt one CBC segment in a worker process"""
+    key, prev_block, data = task
+    cipher = get_cipher(key)
+    out = bytearray(len(data))
+    cbc_decrypt_process(cipher, data, memoryview(out), prev_block)
+    return out
+
+def cbc_decrypt(ciphertext, key, iv, jobs=1):
+    """CBC mode decryption (jobs > 1 splits large inputs across processes)"""
+    ciphertext = memoryview(ciphertext)
+    if len(ciphertext) % 16 != 0:
+        raise ValueError("Ciphertext length must be a multiple of 16 bytes")
+    plaintext = bytearray(len(ciphertext))
+    out = memoryview(plaintext)
+    
+    if should_parallelize(len(ciphertext), jobs):
+        ranges = split_blocks(len(ciphertext), resolve_jobs(jobs))
+        tasks = []
+        for start, end in ranges:
+            prev_block = iv if start == 0 else ciphertext[start-16:start]
+            tasks.append((key, bytes(prev_block), bytes(ciphertext[start:end])))
+        
+        results = run_parallel(cbc_decrypt_segment, tasks, jobs)
+        for (start, end), segment in zip(ranges, results):
+            out[start:end] = segment
+    else:
+        cipher = get_cipher(key)
+        cbc_decrypt_process(cipher, ciphertext, out, iv)
+    
+    return bytes(pkcs7_unpad(plaintext))
+
+# CFB Mode
+def cfb_encrypt_process(cipher, data, out, feedback):
+    """
+    Encrypt a CFB span; only its last block may be partial
+    
+    Returns:
+        bytes: Feedback block for the data following the span
+    """
+    data = memoryview(data)
+    
+    for i in range(0, len(data), 16):
+        block = data[i:i+16]
+        # Encrypt the feedback register
+        encrypted_feedback = cipher.encrypt(feedback)
+        # XOR with plaintext to produce ciphertext, which is the next feedback;
+        # it stays bytes, as encrypting a view of out costs more per block
+        feedback = xor_bytes(block, encrypted_feedback)
+        out[i:i+len(feedback)] = feedback
+    
+    return bytes(feedback)
+
+def cfb_encrypt(plaintext, key, iv):
+    """CFB mode encryption (stream cipher)"""
+    cipher = get_cipher(key)
+    ciphertext = bytearray(len(plaintext))
+    cfb_encrypt_process(cipher, plaintext, memoryview(ciphertext), iv)
+    return bytes(ciphertext)
+
+def cfb_decrypt_process(cipher, data, out, feedback):
+    """
+    Decrypt a CFB span without walking the chain
+    
+    Every keystream block is E(C_{i-1}), so the feedback sequence (the
+    previous block followed by the ciphertext shifted by one block) is
+    encrypted in bulk and XORed against the span.
+    
+    Args:
+        cipher: AES object in ECB mode
+        data (bytes-like): Ciphertext span; only its last block may be partial
+        out (memoryview): Writable buffer of len(data) bytes
+        feedback (bytes-like): Ciphertext block preceding the span (or IV)
+    
+    Returns:
+        bytes: Feedback block for the data following the span
+    """
+    data = memoryview(data)
+    
+    for i in range(0, len(data), ECB_CHUNK_SIZE):
+        chunk = data[i:i+ECB_CHUNK_SIZE]
+        num_blocks = (len(chunk) + 15) // 16
+        feedback_sequence = bytes(feedback) + bytes(chunk[:(num_blocks - 1) * 16])
+        keystream = cipher.encrypt(feedback_sequence)
+        xor_into(out[i:i+ECB_CHUNK_SIZE], chunk, keystream)
+        feedback = chunk[(num_blocks - 1) * 16:num_blocks * 16]
+    
+    return bytes(feedback)
+
+def cfb_decrypt_segment(task):
+    """Decrypt one CFB segment in a worker process"""
+    key, feedback, data = task
+    cipher = get_cipher(key)
+    out = bytearray(len(data))
+    cfb_decrypt_process(cipher, data, memoryview(out), feedback)
+    return out
+
+def cfb_decrypt(ciphertext, key, iv, jobs=1):
+    """CFB mode decryption (stream cipher; jobs > 1 splits large inputs across processes)"""
+    ciphertext = memoryview(ciphertext)
+    plaintext = bytearray(len(ciphertext))
+    out = memoryview(plaintext)
+    
+    if should_parallelize(len(ciphertext), jobs):
+        ranges = split_blocks(len(ciphertext), resolve_jobs(jobs))
+        tasks = []
+        for start, end in ranges:
+            feedback = iv if start == 0 else ciphertext[start-16:start]
+            tasks.append((key, bytes(feedback), bytes(ciphertext[start:end])))
+        
+        results = run_parallel(cfb_decrypt_segment, tasks, jobs)
+        for (start, end), segment in zip(ranges, results):
+            out[start:end] = segment
+    else:
+        cipher = get_cipher(key)
+        cfb_decrypt_process(cipher, ciphertext, out, iv)
+    
+    return bytes(plaintext)
+
+# OFB Mode
+def ofb_process(cipher, data, out, feedback):
+    """
+    XOR an OFB span with its keystream; only its last block may be partial
+    
+    The keystream chain is serial, but each span's keystream is collected
+    first and XORed against the span in one step.
+    
+    Returns:
+        bytes: Feedback register for the data following the span
+    """
+    data = memoryview(data)
+    span = ECB_CHUNK_SIZE
+    
+    for i in range(0, len(data), span):
+        chunk = data[i:i+span]
+        keystream = []
+        for _ in range((len(chunk) + 15) // 16):
+            # Encrypt the feedback register to generate keystream
+            feedback = cipher.encrypt(feedback)
+            keystream.append(feedback)
+        xor_into(out[i:i+span], chunk, b''.join(keystream))
+    
+    return bytes(feedback)
+
+def ofb_encrypt(plaintext, key, iv):
+    """OFB mode encryption (stream cipher)"""
+    cipher = get_cipher(key)
+    ciphertext = bytearray(len(plaintext))
+    ofb_process(cipher, plaintext, memoryview(ciphertext), iv)
+    return bytes(ciphertext)
+
+def ofb_decrypt(ciphertext, key, iv):
+    """OFB mode decryption (stream cipher)"""
+    # OFB decryption is identical to encryption
+    return ofb_encrypt(ciphertext, key, iv)
+
+# CTR Mode
+# Number of counter blocks encrypted per bulk cipher call (64 KB of keystream)
+CTR_SPAN_BLOCKS = 4096
+COUNTER_MODULUS = 1 << 128
+
+# Values of the two low counter bytes for every 16-bit counter value
+COUNTER_WINDOW = 1 << 16
+_COUNTER_HIGH_BYTES = b''.join(bytes([value]) * 256 for value in range(256))
+_COUNTER_LOW_BYTES = bytes(range(256)) * 256
+
+def ctr_counter_blocks(counter, num_blocks):
+    """
+    Build num_blocks consecutive 128-bit big-endian counter blocks
+    
+    Within a run where only the low 16 bits change, the blocks are one
+    repeated prefix with the two low bytes filled in as strided columns,
+    so no per-block Python work is done.
+    """
+    counter %= COUNTER_MODULUS
+    blocks = bytearray(num_blocks * 16)
+    position = 0
+    
+    while position < num_blocks:
+        low = counter & 0xffff
+        run = min(num_blocks - position, COUNTER_WINDOW - low)
+        start, end = position * 16, (position + run) * 16
+        blocks[start:end] = (counter - low).to_bytes(16, 'big') * run
+        blocks[start + 14:end:16] = _COUNTER_HIGH_BYTES[low:low + run]
+        blocks[start + 15:end:16] = _COUNTER_LOW_BYTES[low:low + run]
+        # The counter wraps around modulo 2**128
+        counter = (counter + run) % COUNTER_MODULUS
+        position += run
+    
+    return blocks
+
+def ctr_process(cipher, data, out, counter):
+    """
+    XOR data with the CTR keystream starting at counter
+    
+    The counter blocks for a whole span are encrypted with a single ECB
+    call and XORed against the span in one step.
+    
+    Args:
+        cipher: AES object in ECB mode
+        data (bytes-like): Input span
+        out (memoryview): Writable buffer of len(data) bytes
+        counter (int): Counter value of the first block of data
+    
+    Returns:
+        int: Counter value following the last (possibly partial) block
+    """
+    data = memoryview(data)
+    span = CTR_SPAN_BLOCKS * 16
+    
+    for i in range(0, len(data), span):
+        chunk = data[i:i+span]
+        num_blocks = (len(chunk) + 15) // 16
+        keystream = cipher.encrypt(ctr_counter_blocks(counter, num_blocks))
+        xor_into(out[i:i+span], chunk, keystream)
+        counter += num_blocks
+    
+    return counter
+
+def ctr_encrypt(plaintext, key, iv):
+    """CTR mode encryption (stream cipher)"""
+    cipher = get_cipher(key)
+    ciphertext = bytearray(len(plaintext))
+    ctr_process(cipher, plaintext, memoryview(ciphertext), int.from_bytes(iv, 'big'))
+    return bytes(ciphertext)
+
+def ctr_decrypt(ciphertext, key, iv):
+    """CTR mode decryption (stream cipher)"""
+    # CTR decryption is identical to encryption
+    return ctr_encrypt(ciphertext, key, iv)
+
+# Test function
+def test_modes():
+    """Test all encryption modes"""
+    key = b'\x00' * 16  # Test key
+    iv = b'\x00' * 16   # Test IV
+    test_data = b"Hello, CryptoCore! This is a test message."
+    
+    print("Testing encryption modes...")
+    
+    # Test each mode
+    modes = [
+        ('ECB', ecb_encrypt, ecb_decrypt),
+        ('CBC', cbc_encrypt, cbc_decrypt),
+        ('CFB', cfb_encrypt, cfb_decrypt),
+        ('OFB', ofb_encrypt, ofb_decrypt),
+        ('CTR', ctr_encrypt, ctr_decrypt)
+    ]
+    
+    for mode_name, encrypt_func, decrypt_func in modes:
+        try:
+            if mode_name == 'ECB':
+                encrypted = encrypt_func(test_data, key)
+                decrypted = decrypt_func(encrypted, key)
+            else:
+                encrypted = encrypt_func(test_data, key, iv)
+                decrypted = decrypt_func(encrypted, key, iv)
+            
+            if decrypted == test_data:
+                print(f"✓ {mode_name} mode: PASS")
+            else:
+                print(f"✗ {mode_name} mode: FAIL")
+                
+        except Exception as e:
+            print(f"✗ {mode_name} mode: ERROR - {e}")
+
+if __name__ == "__main__":
+    test_modes()
\ No newline at end of file
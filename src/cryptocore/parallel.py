@@ -0,0 +1,72 @@
+# parallel.py
+import os
+
+# Inputs smaller than this are not worth the cost of starting worker processes
+PARALLEL_THRESHOLD = 4 * 1024 * 1024
+
+def resolve_jobs(jobs):
+    """
+    Resolve the requested number of worker processes
+    
+    Args:
+        jobs (int): Requested workers; 0 or None means one per CPU core
+        
+    Returns:
+        int: Number of workers to use (at least 1)
+    """
+    if not jobs:
+        return os.cpu_count() or 1
+    if jobs < 0:
+        raise ValueError("Number of jobs must not be negative")
+    return jobs
+
+def should_parallelize(length, jobs):
+    """Check whether an input of length bytes should be split across jobs workers"""
+    return resolve_jobs(jobs) > 1 and length >= PARALLEL_THRESHOLD
+
+def split_blocks(length, parts, block_size=16):
+    """
+    Split a byte range into block-aligned segments
+    
+    Args:
+        length (int): Total length in bytes
+        parts (int): Maximum number of segments
+        block_size (int): Alignment of every segment boundary
+        
+    Returns:
+        list: (start, end) pairs covering [0, length); only the last
+            segment may end on a partial block
+    """
+    num_blocks = (length + block_size - 1) // block_size
+    parts = max(1, min(parts, num_blocks))
+    blocks_per_part, extra = divmod(num_blocks, parts)
+    
+    ranges = []
+    start = 0
+    for i in range(parts):
+        count = blocks_per_part + (1 if i < extra else 0)
+        end = min(start + count * block_size, length)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+def run_parallel(worker, tasks, jobs):
+    """
+    Run worker over tasks in a process pool, preserving task order
+    
+    Args:
+        worker: Picklable top-level function taking one task
+        tasks (list): Task arguments
+        jobs (int): Number of worker processes
+        
+    Returns:
+        list: Worker results in task order
+    """
+    jobs = min(resolve_jobs(jobs), len(tasks))
+    if jobs <= 1:
+        return [worker(task) for task in tasks]
+    
+    # Process pools pull in multiprocessing; only pay for it when used
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(worker, tasks))
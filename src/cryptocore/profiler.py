@@ -0,0 +1,323 @@
+# profiler.py
+import os
+import sys
+import time
+
+# Sampling interval of the collapsed-stack profiler (CPU seconds)
+SAMPLE_INTERVAL = 0.001
+
+PROFILE_FORMATS = ['pstats', 'collapsed']
+
+class StageStats:
+    """Totals for one pipeline stage; times and allocations exclude nested stages"""
+    __slots__ = ('name', 'calls', 'wall', 'cpu', 'bytes', 'blocks', 'alloc_net', 'alloc_peak')
+    
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.bytes = 0
+        self.blocks = 0
+        self.alloc_net = 0
+        self.alloc_peak = 0
+    
+    def as_dict(self):
+        mb_per_s = self.bytes / self.wall / (1024 * 1024) if self.wall > 0 else 0.0
+        return {
+            'stage': self.name,
+            'calls': self.calls,
+            'wall_s': self.wall,
+            'cpu_s': self.cpu,
+            'bytes': self.bytes,
+            'mb_per_s': mb_per_s,
+            'blocks': self.blocks,
+            'alloc_net': self.alloc_net,
+            'alloc_peak': self.alloc_peak,
+        }
+
+class _Stage:
+    """Context manager that attributes the time spent inside it to one stage"""
+    __slots__ = ('_profiler', '_name')
+    
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+    
+    def __enter__(self):
+        self._profiler.enter(self._name)
+        return self
+    
+    def __exit__(self, *exc_info):
+        self._profiler.exit()
+        return False
+
+class _NullStage:
+    """Stage used while profiling is off: entering and leaving it does nothing"""
+    __slots__ = ()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+_NULL_STAGE = _NullStage()
+
+class StageProfiler:
+    """
+    Per-stage wall time, CPU time, bytes and allocations of one run
+    
+    Stages nest: while a stage is open, time spent in a stage entered
+    from inside it (a read pulled by the cipher loop, padding done by
+    finalize) is charged to the inner stage only. Every transition
+    charges the elapsed time to the innermost open stage, so the stage
+    totals add up to the profiled wall time.
+    
+    Allocations are always counted as the net change in allocated memory
+    blocks, which costs nothing per allocation. With track_allocations,
+    tracemalloc also records net bytes and the peak growth above the level
+    at which the stage was entered; it hooks every allocation, so it slows
+    allocation-heavy stages (the per-block CBC loop) several times over.
+    """
+    
+    def __init__(self, track_allocations=False):
+        self.track_allocations = track_allocations
+        self.stages = {}
+        self.wall = 0.0
+        self._stack = []
+        self._started_tracing = False
+        self._tracemalloc = None
+        self._start_wall = None
+    
+    def start(self):
+        if self.track_allocations:
+            import tracemalloc
+            self._tracemalloc = tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+        self._start_wall = time.perf_counter()
+        self._mark()
+    
+    def stop(self):
+        self.wall = time.perf_counter() - self._start_wall
+        if self._started_tracing:
+            self._tracemalloc.stop()
+            self._started_tracing = False
+    
+    def _mark(self):
+        self._mark_wall = time.perf_counter()
+        self._mark_cpu = time.process_time()
+        self._mark_blocks = sys.getallocatedblocks()
+        if self._tracemalloc is not None:
+            self._mark_memory = self._tracemalloc.get_traced_memory()[0]
+            # reset_peak() is new in Python 3.9; without it the peak is the
+            # highest level since tracing began, an upper bound for the stage
+            if hasattr(self._tracemalloc, 'reset_peak'):
+                self._tracemalloc.reset_peak()
+    
+    def _charge(self):
+        """Attribute everything since the last transition to the innermost stage"""
+        if self._stack:
+            stats = self._stack[-1]
+            stats.wall += time.perf_counter() - self._mark_wall
+            stats.cpu += time.process_time() - self._mark_cpu
+            stats.blocks += sys.getallocatedblocks() - self._mark_blocks
+            if self._tracemalloc is not None:
+                current, peak = self._tracemalloc.get_traced_memory()
+                stats.alloc_net += current - self._mark_memory
+                stats.alloc_peak = max(stats.alloc_peak, peak - self._mark_memory)
+        self._mark()
+    
+    def enter(self, name):
+        self._charge()
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        stats.calls += 1
+        self._stack.append(stats)
+    
+    def exit(self):
+        self._charge()
+        self._stack.pop()
+    
+    def stage(self, name):
+        return _Stage(self, name)
+    
+    def add_bytes(self, name, num_bytes):
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageStats(name)
+        stats.bytes += num_bytes
+    
+    def wrap_iter(self, name, iterable):
+        """Yield from iterable, charging each step to name and counting the bytes yielded"""
+        iterator = iter(iterable)
+        while True:
+            self.enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self.exit()
+            self.stages[name].bytes += len(item)
+            yield item
+    
+    def report(self):
+        """Stage totals as a list of dicts, in the order stages were first entered"""
+        return [stats.as_dict() for stats in self.stages.values()]
+    
+    def format_report(self):
+        """Report as printable lines"""
+        header = (f"[PROFILE] {'stage':<10} {'calls':>7} {'wall ms':>10} {'cpu ms':>10} "
+                  f"{'MB':>10} {'MB/s':>10} {'blocks':>10}")
+        if self.track_allocations:
+            header += f" {'net KB':>10} {'peak KB':>10}"
+        lines = [header]
+        accounted = 0.0
+        for row in self.report():
+            accounted += row['wall_s']
+            line = (f"[PROFILE] {row['stage']:<10} {row['calls']:>7} {row['wall_s'] * 1000:>10.2f} "
+                    f"{row['cpu_s'] * 1000:>10.2f} {row['bytes'] / (1024 * 1024):>10.2f} "
+                    f"{row['mb_per_s']:>10.1f} {row['blocks']:>10}")
+            if self.track_allocations:
+                line += f" {row['alloc_net'] / 1024:>10.1f} {row['alloc_peak'] / 1024:>10.1f}"
+            lines.append(line)
+        lines.append(f"[PROFILE] {'other':<10} {'':>7} {(self.wall - accounted) * 1000:>10.2f}")
+        lines.append(f"[PROFILE] {'total':<10} {'':>7} {self.wall * 1000:>10.2f}")
+        return lines
+    
+class StackSampler:
+    """
+    Sampling profiler producing collapsed stacks for flamegraph tools
+    
+    A CPU-time interval timer (SIGPROF) interrupts the main thread every
+    interval seconds and the current Python stack is counted. Time spent
+    inside a C call (the AES kernel) is charged to the Python frame that
+    made it. Unix only. Mirrors the enable/disable/dump_stats interface
+    of cProfile.Profile.
+    """
+    
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        import signal
+        if not hasattr(signal, 'setitimer'):
+            raise RuntimeError("Collapsed-stack profiling requires signal.setitimer (Unix)")
+        self._signal = signal
+        self.interval = interval
+        self.samples = {}
+        self._previous = None
+    
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        key = ';'.join(reversed(stack))
+        self.samples[key] = self.samples.get(key, 0) + 1
+    
+    def enable(self):
+        self._previous = self._signal.signal(self._signal.SIGPROF, self._sample)
+        self._signal.setitimer(self._signal.ITIMER_PROF, self.interval, self.interval)
+    
+    def disable(self):
+        self._signal.setitimer(self._signal.ITIMER_PROF, 0)
+        self._signal.signal(self._signal.SIGPROF, self._previous or self._signal.SIG_DFL)
+    
+    def dump_stats(self, path):
+        with open(path, 'w') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+_active = None
+
+def stage(name):
+    """Context manager charging its body to stage name (does nothing unless profiling)"""
+    if _active is None:
+        return _NULL_STAGE
+    return _active.stage(name)
+
+def profile_iter(name, iterable):
+    """Charge each step of iterable to stage name; returns iterable unchanged unless profiling"""
+    if _active is None:
+        return iterable
+    return _active.wrap_iter(name, iterable)
+
+def add_bytes(name, num_bytes):
+    """Count num_bytes as processed by stage name (does nothing unless profiling)"""
+    if _active is not None:
+        _active.add_bytes(name, num_bytes)
+
+def start_profiling(track_allocations=False):
+    """
+    Start collecting stage statistics for this process
+    
+    Returns:
+        StageProfiler: The profiler now receiving stages
+    
+    Raises:
+        RuntimeError: If a profile is already running
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("A profile is already running")
+    profiler = StageProfiler(track_allocations)
+    profiler.start()
+    _active = profiler
+    return profiler
+
+def stop_profiling():
+    """Stop the running profile and return its StageProfiler"""
+    global _active
+    profiler, _active = _active, None
+    if profiler is not None:
+        profiler.stop()
+    return profiler
+
+def profile_call(function, *args, output=None, output_format='pstats', track_allocations=False):
+    """
+    Run function(*args) with stage profiling and print the per-stage report
+    
+    Args:
+        function: Callable to profile
+        *args: Its arguments
+        output (str): Optional path for a cProfile dump or collapsed stacks
+        output_format (str): 'pstats' (load with pstats/snakeviz) or
+            'collapsed' (one 'frame;frame;... count' line per stack, for
+            flamegraph.pl and speedscope)
+        track_allocations (bool): Also measure allocated bytes with tracemalloc
+    
+    Returns:
+        Whatever function returns
+    
+    Raises:
+        ValueError: If output_format is unknown
+        RuntimeError: If a profile is already running
+    """
+    if output_format not in PROFILE_FORMATS:
+        raise ValueError(f"Unsupported profile format: {output_format}")
+    
+    tracer = None
+    if output and output_format == 'pstats':
+        import cProfile
+        tracer = cProfile.Profile()
+    elif output:
+        tracer = StackSampler()
+    
+    profiler = start_profiling(track_allocations)
+    if tracer is not None:
+        tracer.enable()
+    try:
+        return function(*args)
+    finally:
+        if tracer is not None:
+            tracer.disable()
+        stop_profiling()
+        
+        for line in profiler.format_report():
+            print(line, file=sys.stderr)
+        if tracer is not None:
+            tracer.dump_stats(output)
+            print(f"[INFO] Profile written to {output}", file=sys.stderr)
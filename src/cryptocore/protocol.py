@@ -0,0 +1,146 @@
+# protocol.py
+import json
+import os
+import socket
+import stat
+import struct
+import tempfile
+
+def default_socket_dir():
+    """Per-user socket directory: $XDG_RUNTIME_DIR, else cryptocore-<uid> in the temp directory"""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return runtime_dir
+    return os.path.join(tempfile.gettempdir(), f'cryptocore-{os.getuid()}')
+
+# Default path of the daemon's Unix domain socket. Keys travel over it, so it
+# lives in a directory only its user can enter, never directly in /tmp where
+# another user could bind the path first.
+DEFAULT_SOCKET_PATH = os.path.join(default_socket_dir(), 'cryptocore.sock')
+
+# Every frame is a 1-byte type and a 4-byte big-endian payload length, then the payload
+FRAME_HEADER = struct.Struct('>cI')
+MAX_FRAME_SIZE = 1024 * 1024
+
+# struct ucred returned by SO_PEERCRED: pid, uid, gid
+PEER_CREDENTIALS = struct.Struct('3i')
+
+# Largest data frame a client sends; replies may be one carried-over block longer
+DATA_CHUNK_SIZE = 256 * 1024
+
+# Frame types. A request is one REQUEST frame, any number of DATA frames and
+# an END frame; the daemon answers every frame with exactly one frame.
+FRAME_REQUEST = b'R'  # JSON header: operation, mode, key and optional iv (hex)
+FRAME_DATA = b'D'     # Stream bytes; the reply to REQUEST carries the IV header
+FRAME_END = b'E'      # End of input; the reply carries the final output
+FRAME_ERROR = b'X'    # UTF-8 message; ends the current request
+
+OPERATIONS = ['encrypt', 'decrypt']
+MODES = ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']
+
+def prepare_socket_dir(directory):
+    """
+    Create directory with mode 0700 if missing and check that it is private
+    
+    Raises:
+        RuntimeError: If the path is not a directory, belongs to another
+            user, or can be entered by other users
+    """
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.lstat(directory)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid() or info.st_mode & 0o077:
+        raise RuntimeError(f"Socket directory {directory} must be a directory owned by this user with mode 0700")
+
+def peer_uid(sock, socket_path):
+    """User id of the process on the other end of a connected Unix socket"""
+    if hasattr(socket, 'SO_PEERCRED'):
+        credentials = sock.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, PEER_CREDENTIALS.size)
+        return PEER_CREDENTIALS.unpack(credentials)[1]
+    # Without peer credentials (macOS, BSD) fall back to the owner of the socket file
+    return os.stat(socket_path).st_uid
+
+def send_frame(sock, frame_type, payload=b''):
+    """Send one frame over a connected socket"""
+    if len(payload) > MAX_FRAME_SIZE:
+        raise ValueError(f"Frame of {len(payload)} bytes exceeds {MAX_FRAME_SIZE} bytes")
+    header = FRAME_HEADER.pack(frame_type, len(payload))
+    if len(payload) <= 4096:
+        sock.sendall(header + bytes(payload))
+    else:
+        sock.sendall(header)
+        sock.sendall(payload)
+
+def _recv_into(sock, view):
+    """Fill view from sock; returns False on EOF before the first byte"""
+    received = 0
+    while received < len(view):
+        count = sock.recv_into(view[received:])
+        if not count:
+            if received == 0:
+                return False
+            raise ConnectionError("Connection closed in the middle of a frame")
+        received += count
+    return True
+
+def recv_frame(sock, buffer):
+    """
+    Receive one frame into a reusable buffer
+    
+    Args:
+        sock: Connected socket
+        buffer (bytearray): At least MAX_FRAME_SIZE bytes
+    
+    Returns:
+        tuple: (frame type, memoryview of the payload inside buffer), or
+            (None, None) if the peer closed the connection between frames
+    
+    Raises:
+        ConnectionError: If the connection closes mid-frame or the frame is malformed
+    """
+    header = bytearray(FRAME_HEADER.size)
+    if not _recv_into(sock, memoryview(header)):
+        return None, None
+    
+    frame_type, length = FRAME_HEADER.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ConnectionError(f"Frame of {length} bytes exceeds {MAX_FRAME_SIZE} bytes")
+    
+    payload = memoryview(buffer)[:length]
+    if length and not _recv_into(sock, payload):
+        raise ConnectionError("Connection closed in the middle of a frame")
+    return frame_type, payload
+
+def encode_request(operation, mode, key, iv=None):
+    """Build the payload of a REQUEST frame"""
+    request = {'operation': operation, 'mode': mode, 'key': bytes(key).hex()}
+    if iv is not None:
+        request['iv'] = bytes(iv).hex()
+    return json.dumps(request).encode()
+
+def decode_request(payload):
+    """
+    Parse and validate the payload of a REQUEST frame
+    
+    Returns:
+        tuple: (operation, mode, key bytes, iv bytes or None)
+    
+    Raises:
+        ValueError: If the request is malformed
+    """
+    try:
+        request = json.loads(bytes(payload))
+        operation, mode = request['operation'], request['mode']
+        key = bytes.fromhex(request['key'])
+        iv = bytes.fromhex(request['iv']) if request.get('iv') else None
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Malformed request: {e}")
+    
+    if operation not in OPERATIONS:
+        raise ValueError(f"Unsupported operation: {operation}")
+    if mode not in MODES:
+        raise ValueError(f"Unsupported mode: {mode}")
+    if len(key) not in (16, 24, 32):
+        raise ValueError("Key must be 16, 24 or 32 bytes")
+    if iv is not None and len(iv) != 16:
+        raise ValueError("IV must be 16 bytes")
+    return operation, mode, key, iv
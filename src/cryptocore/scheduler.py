@@ -0,0 +1,195 @@
+# scheduler.py
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from .batch import BatchProcessor, BatchSummary, IV_MODES, batch_outputs
+from .crypto import PARALLEL_MODES, SEGMENT_SIZE, plan_parallel_file, process_file_segment
+from .csprng import generate_random_bytes
+from .file_utils import get_file_size, remove_file
+from .parallel import resolve_jobs
+from .metrics import record_operation, record_error
+
+# Files smaller than this are packed together into shared tasks
+SMALL_FILE_SIZE = 1024 * 1024
+
+# Input bytes a packed task collects before a new one is started
+PACK_SIZE = 8 * 1024 * 1024
+
+# Files of at least this size are split into segments when the mode allows it
+SPLIT_SIZE = 2 * SEGMENT_SIZE
+
+class SplitFile:
+    """A file processed as independent segments, finished once all are done"""
+    
+    def __init__(self, input_file, output_file, size, finish, remaining):
+        self.input_file = input_file
+        self.output_file = output_file
+        self.size = size
+        self.finish = finish
+        self.remaining = remaining
+        self.error = None
+
+def process_file_group(task):
+    """
+    Encrypt or decrypt a group of whole files (runs in a worker process)
+    
+    Returns:
+        list: (input_file, bytes processed, exception or None) per file
+    """
+    operation, mode, key, iv, files = task
+    processor = BatchProcessor(operation, mode, key, iv)
+    results = []
+    
+    for input_file, output_file in files:
+        try:
+            results.append((input_file, processor.process(input_file, output_file), None))
+        except Exception as e:
+            results.append((input_file, 0, e))
+    return results
+
+def pack_files(entries, small_size=SMALL_FILE_SIZE, pack_size=PACK_SIZE):
+    """
+    Group whole files into tasks
+    
+    Files of small_size bytes or more get a task of their own; smaller ones
+    are packed together until a task holds pack_size bytes.
+    
+    Args:
+        entries (list): (size, input_file, output_file) tuples, largest first
+    
+    Returns:
+        list: (total size, [(input_file, output_file), ...]) per task
+    """
+    groups = []
+    pack, pack_bytes = [], 0
+    
+    for size, input_file, output_file in entries:
+        if size >= small_size:
+            groups.append((size, [(input_file, output_file)]))
+            continue
+        pack.append((input_file, output_file))
+        pack_bytes += size
+        if pack_bytes >= pack_size:
+            groups.append((pack_bytes, pack))
+            pack, pack_bytes = [], 0
+    
+    if pack:
+        groups.append((pack_bytes, pack))
+    return groups
+
+def run_scheduled(operation, mode, key, inputs, output_dir=None, iv=None, jobs=0,
+                  split_size=SPLIT_SIZE, small_size=SMALL_FILE_SIZE, pack_size=PACK_SIZE):
+    """
+    Encrypt or decrypt a list of files across a pool of worker processes
+    
+    Work is ordered largest first so no long task is left running alone at
+    the end. Small files are packed into shared tasks to amortize dispatch
+    cost, and files of split_size bytes or more are split into segments
+    when the mode can process segments independently (ECB/CTR, and CBC/CFB
+    decryption). Failures are recorded and do not stop the run.
+    
+    Args:
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): Mode of operation
+        key (bytes): AES key shared by every file
+        inputs (list): (file_path, relative_name) pairs
+        output_dir (str): Output directory (default: next to each input)
+        iv (bytes): IV for decryption when it is not stored in the files
+        jobs (int): Worker processes (0 = one per CPU core)
+    
+    Returns:
+        BatchSummary: Totals and failures
+    
+    Raises:
+        ValueError: If two inputs map to the same output path
+    """
+    pairs = batch_outputs(inputs, output_dir, operation)
+    jobs = resolve_jobs(jobs)
+    summary = BatchSummary(operation)
+    start = time.perf_counter()
+    
+    entries = []
+    for input_file, output_file in pairs:
+        try:
+            entries.append((get_file_size(input_file), input_file, output_file))
+        except Exception as e:
+            summary.failures.append((input_file, str(e)))
+            record_error(operation, e)
+    entries.sort(key=lambda entry: entry[0], reverse=True)
+    
+    # (weight, worker, task, SplitFile or None)
+    work = []
+    whole = []
+    for size, input_file, output_file in entries:
+        if mode not in PARALLEL_MODES[operation] or size < split_size:
+            whole.append((size, input_file, output_file))
+            continue
+        # Every encrypted file gets its own IV under the shared key
+        file_iv = generate_random_bytes(16) if operation == 'encrypt' and mode in IV_MODES else iv
+        try:
+            tasks, finish = plan_parallel_file(operation, mode, key, file_iv, input_file, output_file, jobs)
+        except Exception as e:
+            remove_file(output_file)
+            summary.failures.append((input_file, str(e)))
+            record_error(operation, e)
+            continue
+        split = SplitFile(input_file, output_file, size, finish, len(tasks))
+        for task in tasks:
+            work.append((task[6], process_file_segment, task, split))
+    
+    for size, files in pack_files(whole, small_size, pack_size):
+        work.append((size, process_file_group, (operation, mode, key, iv, files), None))
+    work.sort(key=lambda item: item[0], reverse=True)
+    
+    for item, result, error in _execute(work, jobs):
+        split = item[3]
+        if split is None:
+            if error is not None:
+                # The whole group was lost, e.g. with a crashed worker
+                result = [(input_file, 0, error) for input_file, _ in item[2][4]]
+            # Latency is not recorded: workers process whole groups of files
+            for input_file, processed, file_error in result:
+                if file_error is None:
+                    summary.bytes += processed
+                    summary.files += 1
+                    record_operation(operation, mode, processed)
+                else:
+                    summary.failures.append((input_file, str(file_error)))
+                    record_error(operation, file_error)
+            continue
+        
+        split.remaining -= 1
+        if error is not None and split.error is None:
+            split.error = error
+        if split.remaining:
+            continue
+        try:
+            if split.error is not None:
+                raise split.error
+            split.finish()
+            summary.bytes += split.size
+            summary.files += 1
+            record_operation(operation, mode, split.size)
+        except Exception as e:
+            remove_file(split.output_file)
+            summary.failures.append((split.input_file, str(e)))
+            record_error(operation, e)
+    
+    summary.seconds = time.perf_counter() - start
+    return summary
+
+def _execute(work, jobs):
+    """Run work items in order, yielding (item, result, exception) as they complete"""
+    if jobs <= 1 or len(work) <= 1:
+        for item in work:
+            try:
+                yield item, item[1](item[2]), None
+            except Exception as e:
+                yield item, None, e
+        return
+    
+    with ProcessPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        # The pool hands out tasks in submission order, so the largest start first
+        futures = {pool.submit(item[1], item[2]): item for item in work}
+        for future in as_completed(futures):
+            error = future.exception()
+            yield futures[future], None if error else future.result(), error
@@ -0,0 +1,116 @@
+# stream.py
+from .ciphers import new_cipher
+from .csprng import generate_random_bytes
+
+# Modes that store an IV in front of the ciphertext
+IV_MODES = ['cbc', 'cfb', 'ofb', 'ctr']
+
+# Largest read taken from a stream; pipe reads return as soon as any data is available
+PIPE_CHUNK_SIZE = 64 * 1024
+
+def transform_chunks(chunks, operation, mode, key, iv=None):
+    """
+    Encrypt or decrypt a stream of chunks
+    
+    Chaining state (the CBC previous block, the CFB/OFB feedback register,
+    the CTR counter) is carried from one chunk to the next by an incremental
+    cipher from ciphers.py, so the output is identical to the one-shot mode
+    functions. Padding is added or removed on the last block only. Memory
+    use is bounded by the chunk size.
+    
+    Args:
+        chunks (iterable): Input chunks (bytes-like) of any size
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): 'ecb', 'cbc', 'cfb', 'ofb' or 'ctr'
+        key (bytes): AES key
+        iv (bytes): Initialization vector (ignored for ECB)
+        
+    Yields:
+        bytearray: Output chunks
+        
+    Raises:
+        ValueError: If the mode is unsupported, or the ciphertext is not
+            block-aligned or has invalid padding
+    """
+    cipher = new_cipher(operation, mode, key, iv)
+    
+    for chunk in chunks:
+        out = cipher.update(chunk)
+        if out:
+            yield out
+    
+    out = cipher.finalize()
+    if out:
+        yield out
+
+def read_exact(source, size):
+    """Read size bytes from a binary stream, fewer only at end of stream"""
+    data = b''
+    while len(data) < size:
+        piece = source.read(size - len(data))
+        if not piece:
+            break
+        data += piece
+    return data
+
+def transform_stream(source, sink, operation, mode, key, iv=None, chunk_size=PIPE_CHUNK_SIZE):
+    """
+    Encrypt or decrypt a binary stream into another without seeking
+    
+    Works on pipes and sockets (stdin/stdout): on encryption the IV is
+    written and flushed before any input is read, and on decryption
+    without an IV it is read from the stream head, as in encrypted files.
+    Every read returns as soon as some input is available (readinto1) and
+    its output is flushed straight away, so the first bytes leave after
+    one read rather than one full chunk. Memory use is two chunk buffers.
+    
+    Args:
+        source: Binary stream to read (readinto1 or readinto)
+        sink: Binary stream to write (write and flush)
+        operation (str): 'encrypt' or 'decrypt'
+        mode (str): 'ecb', 'cbc', 'cfb', 'ofb' or 'ctr'
+        key (bytes): AES key
+        iv (bytes): IV; generated when encrypting without one
+        chunk_size (int): Largest read
+        
+    Returns:
+        int: Input bytes consumed (including an IV read from the head)
+        
+    Raises:
+        ValueError: If the mode is unsupported, or the ciphertext is
+            truncated or has invalid padding
+    """
+    consumed = 0
+    if mode not in IV_MODES:
+        iv = None
+    elif operation == 'encrypt':
+        iv = iv or generate_random_bytes(16)
+        sink.write(iv)
+        sink.flush()
+    elif iv is None:
+        iv = read_exact(source, 16)
+        consumed = len(iv)
+        if consumed < 16:
+            raise ValueError("Ciphertext too short to contain IV")
+    cipher = new_cipher(operation, mode, key, iv)
+    
+    in_buffer = bytearray(chunk_size)
+    # update_into may also flush up to one carried-over block
+    out_buffer = bytearray(chunk_size + 32)
+    in_view = memoryview(in_buffer)
+    out_view = memoryview(out_buffer)
+    readinto = getattr(source, 'readinto1', None) or source.readinto
+    
+    while True:
+        count = readinto(in_buffer)
+        if not count:
+            break
+        consumed += count
+        written = cipher.update_into(in_view[:count], out_view)
+        if written:
+            sink.write(out_view[:written])
+            sink.flush()
+    
+    sink.write(cipher.finalize())
+    sink.flush()
+    return consumed
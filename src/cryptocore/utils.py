@@ -1,4 +1,7 @@
 # utils.py
+class PaddingError(ValueError):
+    """Raised when PKCS#7 padding is invalid (wrong key, IV or corrupted ciphertext)"""
+
 def pkcs7_pad(data, block_size=16):
     """Pad data using PKCS#7 standard"""
     padding_length = block_size - (len(data) % block_size)
@@ -10,7 +13,7 @@ def pkcs7_unpad(data):
     padding_length = data[-1]
     # Validate padding
     if padding_length == 0 or padding_length > len(data):
-        raise ValueError("Invalid padding")
+        raise PaddingError("Invalid padding")
     if data[-padding_length:] != bytes([padding_length] * padding_length):
-        raise ValueError("Invalid padding")
+        raise PaddingError("Invalid padding")
     return data[:-padding_length]
\ No newline at end of file
@@ -0,0 +1,41 @@
+# xor.py
+def xor_bytes(data, keystream):
+    """
+    XOR data with keystream using whole-integer arithmetic
+    
+    The operands are converted to Python integers so the XOR runs once over
+    the whole span in C instead of once per byte. Works for single blocks
+    and for multi-block spans alike.
+    
+    Args:
+        data (bytes-like): Data to XOR
+        keystream (bytes-like): Keystream, at least as long as data. Any
+            extra bytes are ignored, which handles the partial final block
+            of the stream modes.
+        
+    Returns:
+        bytes: data XOR keystream, same length as data
+        
+    Raises:
+        ValueError: If keystream is shorter than data
+    """
+    length = len(data)
+    if len(keystream) < length:
+        raise ValueError("Keystream is shorter than data")
+    if length == 0:
+        return b''
+    
+    a = int.from_bytes(data, 'little')
+    b = int.from_bytes(keystream[:length], 'little')
+    return (a ^ b).to_bytes(length, 'little')
+
+def xor_into(out, data, keystream):
+    """
+    XOR data with keystream and store the result in out
+    
+    Args:
+        out (memoryview): Writable buffer of len(data) bytes
+        data (bytes-like): Data to XOR
+        keystream (bytes-like): Keystream, at least as long as data
+    """
+    out[:len(data)] = xor_bytes(data, keystream)
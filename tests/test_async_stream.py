@@ -0,0 +1,99 @@
+import sys
+import os
+import asyncio
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.async_stream import encrypt_stream, decrypt_stream
+from cryptocore.modes import cbc_encrypt, ctr_encrypt
+
+KEY = bytes.fromhex("00112233445566778899aabbccddeeff")
+IV = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+
+class CollectingWriter:
+    """StreamWriter stand-in that records writes and drain() calls"""
+    
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+    
+    def write(self, data):
+        self.data += data
+    
+    async def drain(self):
+        self.drains += 1
+        await asyncio.sleep(0)
+
+def reader_for(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+async def roundtrip(data, mode, chunk_size):
+    encrypted = CollectingWriter()
+    await encrypt_stream(reader_for(data), encrypted, mode, KEY, chunk_size=chunk_size)
+    decrypted = CollectingWriter()
+    await decrypt_stream(reader_for(bytes(encrypted.data)), decrypted, mode, KEY, chunk_size=chunk_size)
+    return bytes(decrypted.data)
+
+def test_async_roundtrip_all_modes():
+    async def check():
+        for mode in ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']:
+            for data in [b"", b"short", os.urandom(16), os.urandom(100003)]:
+                for chunk_size in [1000, 40000]:
+                    assert await roundtrip(data, mode, chunk_size) == data, (mode, len(data), chunk_size)
+    
+    asyncio.run(check())
+    print("Async roundtrip test passed")
+
+def test_async_matches_mode_functions():
+    async def check():
+        data = os.urandom(70001)
+        writer = CollectingWriter()
+        iv = await encrypt_stream(reader_for(data), writer, 'cbc', KEY, IV, chunk_size=20000)
+        assert iv == IV
+        assert bytes(writer.data) == IV + cbc_encrypt(data, KEY, IV)
+        # Data is drained chunk by chunk, not buffered until the end
+        assert writer.drains > 3
+        
+        writer = CollectingWriter()
+        await decrypt_stream(reader_for(ctr_encrypt(data, KEY, IV)), writer, 'ctr', KEY, IV, chunk_size=20000)
+        assert bytes(writer.data) == data
+    
+    asyncio.run(check())
+    print("Async vs mode functions test passed")
+
+def test_async_concurrent_streams():
+    async def check():
+        payloads = [os.urandom(50000 + i) for i in range(16)]
+        results = await asyncio.gather(*(roundtrip(data, 'ctr', 20000) for data in payloads))
+        assert results == payloads
+    
+    asyncio.run(check())
+    print("Async concurrent streams test passed")
+
+def test_async_errors():
+    async def check():
+        for data, mode in [(b"short", 'cbc'), (os.urandom(20), 'cbc'), (os.urandom(33), 'ecb')]:
+            try:
+                await decrypt_stream(reader_for(data), CollectingWriter(), mode, KEY)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+    
+    asyncio.run(check())
+    print("Async error handling test passed")
+
+def run_all_tests():
+    print("Starting async stream tests")
+    
+    test_async_roundtrip_all_modes()
+    test_async_matches_mode_functions()
+    test_async_concurrent_streams()
+    test_async_errors()
+    
+    print("All async stream tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,142 @@
+import sys
+import os
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.batch import run_batch
+from cryptocore.cli import parse_arguments
+from cryptocore.file_utils import collect_files, read_file, write_file
+
+KEY = bytes.fromhex("00112233445566778899aabbccddeeff")
+
+def make_tree(root):
+    contents = {
+        'a.txt': b"first file",
+        'b.bin': os.urandom(5000),
+        os.path.join('sub', 'c.txt'): b"",
+        os.path.join('sub', 'deeper', 'd.txt'): os.urandom(33),
+    }
+    for name, data in contents.items():
+        write_file(os.path.join(root, name), data)
+    return contents
+
+def test_batch_roundtrip_all_modes():
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, 'in')
+        contents = make_tree(source)
+        
+        for mode in ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']:
+            encrypted_dir = os.path.join(workdir, mode, 'enc')
+            decrypted_dir = os.path.join(workdir, mode, 'dec')
+            
+            summary = run_batch('encrypt', mode, KEY, collect_files([source]), encrypted_dir)
+            assert summary.files == len(contents) and not summary.failures
+            
+            summary = run_batch('decrypt', mode, KEY, collect_files([encrypted_dir]), decrypted_dir)
+            assert summary.files == len(contents) and not summary.failures
+            
+            for name, data in contents.items():
+                assert read_file(os.path.join(decrypted_dir, name + '.enc.dec')) == data, (mode, name)
+        
+        print("Batch roundtrip test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def test_batch_uses_fresh_iv_per_file():
+    workdir = tempfile.mkdtemp()
+    try:
+        for name in ['one', 'two']:
+            write_file(os.path.join(workdir, 'in', name), b"same content")
+        
+        run_batch('encrypt', 'ctr', KEY, collect_files([os.path.join(workdir, 'in')]), os.path.join(workdir, 'out'))
+        first = read_file(os.path.join(workdir, 'out', 'one.enc'))
+        second = read_file(os.path.join(workdir, 'out', 'two.enc'))
+        assert first[:16] != second[:16]
+        print("Batch fresh IV test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def test_batch_records_failures():
+    workdir = tempfile.mkdtemp()
+    try:
+        good = os.path.join(workdir, 'good.enc')
+        bad = os.path.join(workdir, 'bad.enc')
+        summary = run_batch('encrypt', 'cbc', KEY, [(os.path.join(workdir, 'missing'), 'missing')], workdir)
+        assert summary.files == 0 and len(summary.failures) == 1
+        
+        write_file(bad, os.urandom(20))
+        write_file(os.path.join(workdir, 'plain'), b"payload")
+        run_batch('encrypt', 'cbc', KEY, [(os.path.join(workdir, 'plain'), 'good')], workdir)
+        
+        summary = run_batch('decrypt', 'cbc', KEY, [(good, 'good'), (bad, 'bad')], os.path.join(workdir, 'out'))
+        assert summary.files == 1
+        assert [path for path, _ in summary.failures] == [bad]
+        assert not os.path.exists(os.path.join(workdir, 'out', 'bad.dec'))
+        print("Batch failure recording test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def test_cli_batch_detection():
+    workdir = tempfile.mkdtemp()
+    try:
+        make_tree(workdir)
+        single = os.path.join(workdir, 'a.txt')
+        manifest = os.path.join(workdir, 'manifest.txt')
+        write_file(manifest, f"# inputs\n{single}\n\n{os.path.join(workdir, 'sub')}\n".encode())
+        base = ['--algorithm', 'aes', '--mode', 'ctr', '--encrypt', '--key', KEY.hex()]
+        
+        args = parse_arguments(base + ['--input', single])
+        assert not args.batch and args.input == single
+        
+        args = parse_arguments(base + ['--input', workdir])
+        assert args.batch and len(args.inputs) == 5
+        
+        args = parse_arguments(base + ['--manifest', manifest])
+        assert args.batch and [name for _, name in args.inputs] == ['a.txt', 'c.txt', os.path.join('deeper', 'd.txt')]
+        print("CLI batch detection test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def test_batch_refuses_clashing_outputs():
+    from cryptocore.scheduler import run_scheduled
+    workdir = tempfile.mkdtemp()
+    try:
+        first, second = os.path.join(workdir, 'a', 'x.txt'), os.path.join(workdir, 'b', 'x.txt')
+        write_file(first, b"first")
+        write_file(second, b"second")
+        output_dir = os.path.join(workdir, 'out')
+        
+        # Both files are named x.txt relative to where they were found
+        for paths in [[first, second], [os.path.join(workdir, 'a'), os.path.join(workdir, 'b')]]:
+            inputs = collect_files(paths)
+            for run in [run_batch, lambda *args: run_scheduled(*args, jobs=2)]:
+                try:
+                    run('encrypt', 'ctr', KEY, inputs, output_dir)
+                    assert False, "Expected ValueError"
+                except ValueError:
+                    pass
+                assert not os.path.exists(output_dir)
+        
+        # Next to the inputs the outputs stay apart
+        summary = run_batch('encrypt', 'ctr', KEY, collect_files([first, second]))
+        assert summary.files == 2 and not summary.failures
+        print("Clashing batch outputs test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def run_all_tests():
+    print("Starting batch tests")
+    
+    test_batch_roundtrip_all_modes()
+    test_batch_uses_fresh_iv_per_file()
+    test_batch_records_failures()
+    test_cli_batch_detection()
+    test_batch_refuses_clashing_outputs()
+    
+    print("All batch tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,103 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.runner import run_case, build_cases, compare_results
+from benchmarks.scaling import check_scaling
+from benchmarks.milestones import discover_engines, engine_modules, measure_engine, compare_engines
+
+def test_run_case_reports_metrics():
+    for target, io_mode in [('memory', None), ('file', 'buffered'), ('file', 'mmap')]:
+        case = {'target': target, 'io': io_mode, 'mode': 'cbc', 'operation': 'decrypt',
+                'size': 4096, 'repeat': 1}
+        result = run_case(case)
+        
+        assert result['seconds'] > 0
+        assert result['mb_per_s'] > 0
+        assert result['block_latency_us'] > 0
+    
+    print("Benchmark case metrics test passed")
+
+def test_build_cases_matrix():
+    cases = build_cases(['ecb', 'ctr'], ['encrypt', 'decrypt'], ['memory', 'file'], [16, 1024], 3)
+    
+    # memory: 2 modes x 2 operations x 2 sizes; file: the same for each I/O path
+    assert len(cases) == 8 + 16
+    print("Benchmark matrix test passed")
+
+def test_compare_results_threshold():
+    baseline = [{'target': 'memory', 'io': None, 'mode': 'ctr', 'operation': 'encrypt',
+                 'size': 16, 'mb_per_s': 100.0}]
+    slower = [dict(baseline[0], mb_per_s=85.0)]
+    
+    assert compare_results(baseline, slower, 0.2)[0][4]
+    assert not compare_results(baseline, slower, 0.1)[0][4]
+    print("Benchmark comparison test passed")
+
+def test_check_scaling_flags_quadratic_growth():
+    # Timings are synthetic; the scaling run itself is `python -m benchmarks.scaling`
+    linear = [(size, size * 1e-8) for size in [1024, 64 * 1024, 4 * 1024 * 1024]]
+    quadratic = [(size, size * size * 1e-14) for size in [1024, 64 * 1024, 4 * 1024 * 1024]]
+    
+    assert check_scaling(linear, tolerance=3.0, min_size=1024)[0]
+    passed, ratio = check_scaling(quadratic, tolerance=3.0, min_size=1024)
+    assert not passed and ratio > 3.0
+    # Sizes below min_size are only reported
+    assert check_scaling(quadratic, tolerance=3.0, min_size=4 * 1024 * 1024) == (True, 1.0)
+    print("Scaling check test passed")
+
+def test_milestone_engines_load_in_isolation():
+    available = discover_engines()
+    names = [name for name, _ in available]
+    assert names[-1] == 'src' and 'ml1' in names
+    
+    module_names = engine_modules([directory for _, directory in available])
+    modes_before = sys.modules.get('modes')
+    milestones = [(name, directory) for name, directory in available if name != 'src']
+    
+    result = measure_engine('ml1', dict(available)['ml1'], milestones[1:], module_names, 1024, 1)
+    
+    assert result['error'] is None, result['error']
+    assert 'ecb encrypt' in result['throughput']
+    # The file workload decrypted back to its input (errors are recorded, not raised)
+    assert 'file decrypt' in result['throughput'] and 'file decrypt' in result['spread']
+    # ml1 never shipped utils.py, so it is borrowed from a later milestone
+    assert 'utils' in result['borrowed']
+    assert sys.modules.get('modes') is modes_before
+    print("Milestone isolation test passed")
+
+def test_compare_engines_flags_regression():
+    results = [
+        {'name': 'old', 'throughput': {'ctr encrypt': 100.0}},
+        {'name': 'new', 'throughput': {'ctr encrypt': 50.0}},
+    ]
+    
+    rows, passed = compare_engines(results, 0.1)
+    assert not passed
+    assert rows[0][3] == ['base', 'FAIL']
+    
+    _, passed = compare_engines(results, 0.6)
+    assert passed
+    
+    # A loss within the spread of the runs is noise, not a regression
+    results[0]['spread'] = {'ctr encrypt': 0.3}
+    results[1]['spread'] = {'ctr encrypt': 0.25}
+    rows, passed = compare_engines(results, 0.1)
+    assert passed and rows[0][3] == ['base', 'NOISE']
+    print("Milestone regression check test passed")
+
+def run_all_tests():
+    print("Starting benchmark tests")
+    
+    test_run_case_reports_metrics()
+    test_build_cases_matrix()
+    test_compare_results_threshold()
+    test_check_scaling_flags_quadratic_growth()
+    test_milestone_engines_load_in_isolation()
+    test_compare_engines_flags_regression()
+    
+    print("All benchmark tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
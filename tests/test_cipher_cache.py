@@ -0,0 +1,95 @@
+import sys
+import os
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Crypto.Cipher import AES
+from cryptocore.cipher_cache import CipherCache, get_cipher, cache_stats
+from cryptocore.modes import ctr_encrypt, ctr_decrypt
+
+KEY = bytes.fromhex("00112233445566778899aabbccddeeff")
+IV = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+
+def test_cache_hits_and_misses():
+    cache = CipherCache(max_size=4)
+    first = cache.get(KEY)
+    assert cache.get(bytearray(KEY)) is first
+    assert first.encrypt(bytes(16)) == AES.new(KEY, AES.MODE_ECB).encrypt(bytes(16))
+    
+    stats = cache.stats()
+    assert stats['hits'] == 1 and stats['misses'] == 1 and stats['size'] == 1
+    print("Cache hit/miss test passed")
+
+def test_cache_evicts_least_recently_used():
+    cache = CipherCache(max_size=2)
+    keys = [bytes([i]) * 16 for i in range(3)]
+    first = cache.get(keys[0])
+    cache.get(keys[1])
+    cache.get(keys[0])
+    cache.get(keys[2])
+    
+    stats = cache.stats()
+    assert stats['size'] == 2 and stats['evictions'] == 1
+    assert cache.get(keys[0]) is first
+    cache.get(keys[1])
+    assert cache.stats()['misses'] == 4
+    
+    cache.clear()
+    assert cache.stats()['size'] == 0
+    print("Cache eviction test passed")
+
+def test_cache_does_not_hold_raw_keys():
+    cache = CipherCache()
+    cache.get(KEY)
+    assert KEY not in cache._entries
+    assert all(KEY not in digest for digest in cache._entries)
+    print("Cache key storage test passed")
+
+def test_cache_thread_safety():
+    cache = CipherCache(max_size=3)
+    keys = [bytes([i]) * 16 for i in range(5)]
+    expected = {key: AES.new(key, AES.MODE_ECB).encrypt(bytes(16)) for key in keys}
+    errors = []
+    
+    def worker(offset):
+        try:
+            for i in range(500):
+                key = keys[(i + offset) % len(keys)]
+                assert cache.get(key).encrypt(bytes(16)) == expected[key]
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert not errors, errors
+    stats = cache.stats()
+    assert stats['hits'] + stats['misses'] == 2000 and stats['size'] <= 3
+    print("Cache thread safety test passed")
+
+def test_mode_functions_use_shared_cache():
+    before = cache_stats()
+    for _ in range(10):
+        assert ctr_decrypt(ctr_encrypt(b"record", KEY, IV), KEY, IV) == b"record"
+    after = cache_stats()
+    assert after['hits'] - before['hits'] >= 19
+    assert get_cipher(KEY) is get_cipher(KEY)
+    print("Mode functions cache test passed")
+
+def run_all_tests():
+    print("Starting cipher cache tests")
+    
+    test_cache_hits_and_misses()
+    test_cache_evicts_least_recently_used()
+    test_cache_does_not_hold_raw_keys()
+    test_cache_thread_safety()
+    test_mode_functions_use_shared_cache()
+    
+    print("All cipher cache tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
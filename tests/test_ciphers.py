@@ -0,0 +1,104 @@
+import sys
+import os
+import random
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.modes import *
+from cryptocore.ciphers import new_cipher, CBCEncryptor, CTRDecryptor, ECBDecryptor
+
+KEY = b'\x0f' * 16
+IV = bytes(range(16, 32))
+
+ONE_SHOT = {
+    'ecb': lambda data: ecb_encrypt(data, KEY),
+    'cbc': lambda data: cbc_encrypt(data, KEY, IV),
+    'cfb': lambda data: cfb_encrypt(data, KEY, IV),
+    'ofb': lambda data: ofb_encrypt(data, KEY, IV),
+    'ctr': lambda data: ctr_encrypt(data, KEY, IV),
+}
+
+def feed(cipher, data, seed):
+    rng = random.Random(seed)
+    output = bytearray()
+    position = 0
+    while position < len(data):
+        size = rng.choice([0, 1, 5, 16, 17, 48, 300])
+        output += cipher.update(data[position:position + size])
+        position += size
+    output += cipher.finalize()
+    return bytes(output)
+
+def test_incremental_matches_one_shot():
+    for length in [0, 1, 15, 16, 17, 64, 1000, 4099]:
+        test_data = os.urandom(length)
+        for mode, encrypt in ONE_SHOT.items():
+            encrypted = feed(new_cipher('encrypt', mode, KEY, IV), test_data, length)
+            assert encrypted == encrypt(test_data), (mode, length)
+            
+            decrypted = feed(new_cipher('decrypt', mode, KEY, IV), encrypted, length + 1)
+            assert decrypted == test_data, (mode, length)
+    
+    print("Incremental ciphers match one-shot modes")
+
+def test_update_into_reuses_buffer():
+    test_data = os.urandom(1000)
+    cipher = CBCEncryptor(KEY, IV)
+    buffer = bytearray(256)
+    output = bytearray()
+    
+    for i in range(0, len(test_data), 100):
+        written = cipher.update_into(test_data[i:i+100], buffer)
+        output += buffer[:written]
+    output += cipher.finalize()
+    
+    assert bytes(output) == cbc_encrypt(test_data, KEY, IV)
+    print("update_into buffer reuse test passed")
+
+def test_decryptor_holds_back_last_block():
+    encrypted = ecb_encrypt(b"One block", KEY)
+    cipher = ECBDecryptor(KEY)
+    
+    # The final block must not be released before finalize() removes padding
+    assert cipher.update(encrypted) == b''
+    assert cipher.finalize() == b"One block"
+    print("Decryptor hold-back test passed")
+
+def test_cipher_lifecycle_errors():
+    cipher = CTRDecryptor(KEY, IV)
+    cipher.update(b'abc')
+    cipher.finalize()
+    
+    for call in [lambda: cipher.update(b'x'), cipher.finalize]:
+        try:
+            call()
+            assert False, "Finalized cipher should reject further use"
+        except ValueError:
+            pass
+    
+    try:
+        CBCEncryptor(KEY, b'short')
+        assert False, "Short IV should be rejected"
+    except ValueError:
+        pass
+    
+    try:
+        cipher.extra = 1
+        assert False, "Cipher objects should use __slots__"
+    except AttributeError:
+        pass
+    
+    print("Cipher lifecycle test passed")
+
+def run_all_tests():
+    print("Starting incremental cipher tests")
+    
+    test_incremental_matches_one_shot()
+    test_update_into_reuses_buffer()
+    test_decryptor_holds_back_last_block()
+    test_cipher_lifecycle_errors()
+    
+    print("All incremental cipher tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
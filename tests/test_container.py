@@ -0,0 +1,177 @@
+import sys
+import os
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.container import ContainerReader, write_container, decrypt_container, is_container, HEADER
+from cryptocore.crypto import encrypt_file, decrypt_file
+from cryptocore import cli, crypto
+from cryptocore.modes import ecb_encrypt, cbc_encrypt, cfb_encrypt, ctr_encrypt
+from cryptocore.utils import PaddingError
+
+KEY = bytes(range(16))
+IV = b'\xff' * 16
+MODES = ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']
+
+# Chained modes keep the raw ciphertext as the container body
+RAW = {
+    'ecb': lambda data: ecb_encrypt(data, KEY),
+    'cbc': lambda data: cbc_encrypt(data, KEY, IV),
+    'cfb': lambda data: cfb_encrypt(data, KEY, IV),
+    'ctr': lambda data: ctr_encrypt(data, KEY, IV),
+}
+
+def test_container_roundtrip():
+    workdir = tempfile.mkdtemp()
+    try:
+        plain, packed, out = (os.path.join(workdir, name) for name in ['plain', 'packed', 'out'])
+        for length in [0, 1, 16, 1023, 1024, 1025, 5000]:
+            data = os.urandom(length)
+            with open(plain, 'wb') as f:
+                f.write(data)
+            for mode in MODES:
+                assert write_container(plain, packed, mode, KEY, IV, chunk_size=1024) == length
+                assert is_container(packed)
+                reader = decrypt_container(packed, out, KEY)
+                assert reader.mode == mode and reader.plaintext_length == length
+                assert len(reader.chunks) == max(1, -(-length // 1024))
+                with open(out, 'rb') as f:
+                    assert f.read() == data, (mode, length)
+                
+                if mode in RAW:
+                    with open(packed, 'rb') as f:
+                        body = f.read()[HEADER.size:reader.chunks[-1][0] + reader.chunks[-1][1]]
+                    assert body == RAW[mode](data), (mode, length)
+    finally:
+        shutil.rmtree(workdir)
+    print("Container roundtrip test passed")
+
+def test_container_random_access():
+    workdir = tempfile.mkdtemp()
+    try:
+        plain, packed = os.path.join(workdir, 'plain'), os.path.join(workdir, 'packed')
+        data = os.urandom(10000)
+        with open(plain, 'wb') as f:
+            f.write(data)
+        for mode in MODES:
+            write_container(plain, packed, mode, KEY, IV, chunk_size=512)
+            reader = ContainerReader(packed)
+            assert reader.decrypt_chunk(KEY, 7) == data[7 * 512:8 * 512]
+            assert reader.decrypt_chunk(KEY, len(reader.chunks) - 1) == data[19 * 512:]
+            for offset, length in [(0, 1), (500, 30), (1000, 4000), (9990, 100), (20000, 5)]:
+                assert reader.read(KEY, offset, length) == data[offset:offset + length], (mode, offset)
+    finally:
+        shutil.rmtree(workdir)
+    print("Container random access test passed")
+
+def test_container_rejects_damage():
+    workdir = tempfile.mkdtemp()
+    try:
+        plain, packed, out = (os.path.join(workdir, name) for name in ['plain', 'packed', 'out'])
+        with open(plain, 'wb') as f:
+            f.write(os.urandom(3000))
+        write_container(plain, packed, 'cbc', KEY, IV, chunk_size=1024)
+        
+        # Wrong key fails on the padding and leaves no output behind
+        try:
+            decrypt_container(packed, out, b'\x00' * 16)
+            assert False, "Expected PaddingError"
+        except PaddingError:
+            pass
+        assert not os.path.exists(out)
+        
+        try:
+            decrypt_container(packed, out, KEY, mode='ctr')
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+        
+        with open(packed, 'rb') as f:
+            original = f.read()
+        # Version byte, then the index offset in the trailer
+        for position in [4, len(original) - 9]:
+            damaged = bytearray(original)
+            damaged[position] ^= 1
+            with open(packed, 'wb') as f:
+                f.write(damaged)
+            try:
+                ContainerReader(packed)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+    finally:
+        shutil.rmtree(workdir)
+    print("Container damage test passed")
+
+def test_decrypt_file_detects_format():
+    workdir = tempfile.mkdtemp()
+    key_hex = KEY.hex()
+    try:
+        plain = os.path.join(workdir, 'plain')
+        data = os.urandom(70000)
+        with open(plain, 'wb') as f:
+            f.write(data)
+        for mode in MODES:
+            for file_format in ['raw', 'container']:
+                packed = os.path.join(workdir, f'{mode}.{file_format}')
+                out = packed + '.dec'
+                encrypt_file('aes', mode, key_hex, plain, packed, file_format=file_format)
+                assert is_container(packed) == (file_format == 'container')
+                
+                # Containers need no mode; raw files still do
+                decrypt_file('aes', mode if file_format == 'raw' else None, key_hex, packed, out, jobs=2)
+                with open(out, 'rb') as f:
+                    assert f.read() == data, (mode, file_format)
+        
+        try:
+            decrypt_file('aes', None, key_hex, os.path.join(workdir, 'ctr.raw'), os.path.join(workdir, 'x'))
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    finally:
+        shutil.rmtree(workdir)
+    print("Format detection test passed")
+
+def test_legacy_entry_points_pass_format():
+    workdir = tempfile.mkdtemp()
+    saved_argv = sys.argv
+    try:
+        plain, packed, out = (os.path.join(workdir, name) for name in ['plain', 'packed', 'out'])
+        data = os.urandom(5000)
+        with open(plain, 'wb') as f:
+            f.write(data)
+        base = ['cryptocore', '--algorithm', 'aes', '--key', KEY.hex()]
+        
+        # crypto.main and cli.main take the same options as main.py
+        sys.argv = base + ['--mode', 'cbc', '--encrypt', '--input', plain, '--output', packed, '--format', 'container']
+        assert crypto.main() == 0
+        assert is_container(packed)
+        
+        sys.argv = base + ['--decrypt', '--input', packed, '--output', out]
+        try:
+            cli.main()
+            assert False, "Expected SystemExit"
+        except SystemExit as e:
+            assert e.code == 0
+        with open(out, 'rb') as f:
+            assert f.read() == data
+    finally:
+        sys.argv = saved_argv
+        shutil.rmtree(workdir)
+    print("Legacy entry point test passed")
+
+def run_all_tests():
+    print("Starting container tests")
+    
+    test_container_roundtrip()
+    test_container_random_access()
+    test_container_rejects_damage()
+    test_decrypt_file_detects_format()
+    test_legacy_entry_points_pass_format()
+    
+    print("All container tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -4,8 +4,8 @@ import tempfile
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from crypto import encrypt_file, decrypt_file
-from file_utils import write_file, read_file
+from cryptocore.crypto import encrypt_file, decrypt_file
+from cryptocore.file_utils import write_file, read_file
 
 def test_encrypt_decrypt_roundtrip():
     test_content = b"Hello, CryptoCore! This is a test message for encryption."
@@ -141,12 +141,198 @@ def test_different_modes():
                 if os.path.exists(file_path):
                     os.unlink(file_path)
 
+def test_parallel_jobs_match_serial():
+    from cryptocore.parallel import PARALLEL_THRESHOLD
+    test_content = os.urandom(PARALLEL_THRESHOLD + 1234)
+    test_key = "00112233445566778899aabbccddeeff"
+    test_iv = "ffeeddccbbaa99887766554433221100"
+    
+    with tempfile.NamedTemporaryFile(delete=False, mode='wb', suffix='.bin') as f:
+        input_file = f.name
+        f.write(test_content)
+    
+    paths = []
+    try:
+        for mode in ['ecb', 'cbc', 'cfb', 'ctr']:
+            serial_file = f"{input_file}.{mode}.serial"
+            parallel_file = f"{input_file}.{mode}.parallel"
+            decrypted_file = f"{input_file}.{mode}.dec"
+            paths.extend([serial_file, parallel_file, decrypted_file])
+            
+            encrypt_file('aes', mode, test_key, input_file, serial_file, iv_hex=test_iv)
+            encrypt_file('aes', mode, test_key, input_file, parallel_file, iv_hex=test_iv, jobs=3)
+            assert read_file(parallel_file) == read_file(serial_file)
+            
+            decrypt_file('aes', mode, test_key, parallel_file, decrypted_file, jobs=3)
+            assert read_file(decrypted_file) == test_content
+            
+            print(f"{mode.upper()} parallel jobs test passed")
+    finally:
+        for file_path in [input_file] + paths:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+
+def test_streaming_memory_is_bounded():
+    import tracemalloc
+    from cryptocore.crypto import STREAM_CHUNK_SIZE
+    test_content = os.urandom(STREAM_CHUNK_SIZE * 4 + 5)
+    test_key = "00112233445566778899aabbccddeeff"
+    
+    with tempfile.NamedTemporaryFile(delete=False, mode='wb', suffix='.bin') as f:
+        input_file = f.name
+        f.write(test_content)
+    
+    encrypted_file = input_file + '.enc'
+    decrypted_file = input_file + '.dec'
+    try:
+        for mode in ['ecb', 'ctr']:
+            tracemalloc.start()
+            encrypt_file('aes', mode, test_key, input_file, encrypted_file)
+            decrypt_file('aes', mode, test_key, encrypted_file, decrypted_file)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            assert read_file(decrypted_file) == test_content
+            # A few chunk-sized buffers, never the whole file
+            assert peak < STREAM_CHUNK_SIZE * 6, f"{mode} peak memory {peak} bytes"
+            print(f"{mode.upper()} streaming peak memory: {peak} bytes")
+    finally:
+        for file_path in [input_file, encrypted_file, decrypted_file]:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+
+def test_failed_decryption_leaves_no_output():
+    test_key = "00112233445566778899aabbccddeeff"
+    
+    with tempfile.NamedTemporaryFile(delete=False, mode='wb', suffix='.bin') as f:
+        input_file = f.name
+        f.write(os.urandom(40))
+    
+    decrypted_file = input_file + '.dec'
+    try:
+        try:
+            decrypt_file('aes', 'ecb', test_key, input_file, decrypted_file)
+            assert False, "Unaligned ciphertext should be rejected"
+        except ValueError:
+            pass
+        assert not os.path.exists(decrypted_file)
+        print("Failed decryption cleanup test passed")
+    finally:
+        for file_path in [input_file, decrypted_file]:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+
+def test_parallel_wrong_key_leaves_no_output():
+    from cryptocore.parallel import PARALLEL_THRESHOLD
+    from cryptocore.utils import PaddingError
+    test_key = "00112233445566778899aabbccddeeff"
+    wrong_key = "ffeeddccbbaa99887766554433221100"
+    
+    with tempfile.NamedTemporaryFile(delete=False, mode='wb', suffix='.bin') as f:
+        input_file = f.name
+        f.write(bytes(PARALLEL_THRESHOLD + 1234))
+    
+    encrypted_file = input_file + '.enc'
+    decrypted_file = input_file + '.dec'
+    try:
+        for mode in ['ecb', 'cbc']:
+            encrypt_file('aes', mode, test_key, input_file, encrypted_file, iv_hex=test_key)
+            try:
+                decrypt_file('aes', mode, wrong_key, encrypted_file, decrypted_file, jobs=3)
+                assert False, "Wrong key should fail on the padding"
+            except PaddingError:
+                pass
+            assert not os.path.exists(decrypted_file)
+        print("Parallel wrong key cleanup test passed")
+    finally:
+        for file_path in [input_file, encrypted_file, decrypted_file]:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+
+def test_mmap_io_matches_buffered():
+    test_key = "00112233445566778899aabbccddeeff"
+    test_iv = "000102030405060708090a0b0c0d0e0f"
+    
+    for length in [0, 5, 16, 100000]:
+        test_content = os.urandom(length)
+        with tempfile.NamedTemporaryFile(delete=False, mode='wb', suffix='.bin') as f:
+            input_file = f.name
+            f.write(test_content)
+        
+        buffered_file = input_file + '.buffered'
+        mapped_file = input_file + '.mapped'
+        decrypted_file = input_file + '.dec'
+        try:
+            for mode in ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']:
+                encrypt_file('aes', mode, test_key, input_file, buffered_file, iv_hex=test_iv, io_mode='buffered')
+                encrypt_file('aes', mode, test_key, input_file, mapped_file, iv_hex=test_iv, io_mode='mmap')
+                assert read_file(mapped_file) == read_file(buffered_file), (mode, length)
+                
+                decrypt_file('aes', mode, test_key, mapped_file, decrypted_file, io_mode='mmap')
+                assert read_file(decrypted_file) == test_content, (mode, length)
+        finally:
+            for file_path in [input_file, buffered_file, mapped_file, decrypted_file]:
+                if os.path.exists(file_path):
+                    os.unlink(file_path)
+    
+    print("mmap I/O test passed")
+
+def check_in_place_roundtrip(length, modes, **options):
+    """Encrypt a file onto itself and decrypt it back onto itself"""
+    from cryptocore.utils import PaddingError
+    test_key = "00112233445566778899aabbccddeeff"
+    wrong_key = "ffeeddccbbaa99887766554433221100"
+    test_content = os.urandom(length)
+    
+    with tempfile.NamedTemporaryFile(delete=False, mode='wb', suffix='.bin') as f:
+        file_path = f.name
+    try:
+        for mode in modes:
+            write_file(file_path, test_content)
+            encrypt_file('aes', mode, test_key, file_path, file_path, **options)
+            assert read_file(file_path) != test_content, mode
+            
+            # A failed decryption leaves the ciphertext in place
+            if mode in ['ecb', 'cbc']:
+                ciphertext = read_file(file_path)
+                try:
+                    decrypt_file('aes', mode, wrong_key, file_path, file_path, **options)
+                    assert False, "Wrong key should fail on the padding"
+                except PaddingError:
+                    pass
+                assert read_file(file_path) == ciphertext, mode
+            
+            decrypt_file('aes', mode, test_key, file_path, file_path, **options)
+            assert read_file(file_path) == test_content, mode
+        # Only the file itself is left behind, no temporary files
+        directory = os.path.dirname(file_path)
+        assert not [name for name in os.listdir(directory) if name.startswith('.' + os.path.basename(file_path))]
+    finally:
+        if os.path.exists(file_path):
+            os.unlink(file_path)
+
+def test_in_place_encryption():
+    from cryptocore.parallel import PARALLEL_THRESHOLD
+    check_in_place_roundtrip(5000, ['ecb', 'cbc', 'cfb', 'ofb', 'ctr'], io_mode='buffered')
+    check_in_place_roundtrip(5000, ['ecb', 'cbc', 'cfb', 'ofb', 'ctr'], io_mode='mmap')
+    # Segment-parallel runs pre-size the output before reading the input
+    check_in_place_roundtrip(PARALLEL_THRESHOLD + 1234, ['ecb', 'ctr'], jobs=2)
+    # So does the container format, in both directions
+    check_in_place_roundtrip(5000, ['cbc', 'ctr'], file_format='container')
+    print("In-place encryption test passed")
+
 def run_all_tests():
     print("Starting crypto tests")
     
     test_encrypt_decrypt_roundtrip()
     test_auto_key_generation() 
     test_different_modes()
+    test_parallel_jobs_match_serial()
+    test_streaming_memory_is_bounded()
+    test_failed_decryption_leaves_no_output()
+    test_parallel_wrong_key_leaves_no_output()
+    test_mmap_io_matches_buffered()
+    test_in_place_encryption()
     
     print("All crypto tests passed successfully")
 
@@ -1,8 +1,8 @@
 import sys
 import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from src.csprng import generate_random_bytes, bytes_to_hex
+from cryptocore.csprng import generate_random_bytes, bytes_to_hex, RandomPool, CtrDrbg, generate_drbg_bytes
 
 def test_key_uniqueness():
     """Test that generated keys are unique"""
@@ -54,9 +54,127 @@ def test_nist_preparation():
     
     print(f"✓ Generated {bytes_written} bytes for NIST testing in '{output_file}'")
 
+def test_pool_wipes_consumed_bytes():
+    """Test that the pool hands out each byte once and zeroes it"""
+    pool = RandomPool(size=256, bypass_size=64)
+    values = [pool.read(16) for _ in range(40)]
+    
+    assert len(set(values)) == len(values)
+    assert pool.refills == 3
+    # Everything up to the read position has been wiped
+    assert pool._buffer[:pool._position] == bytes(pool._position)
+    assert len(pool.read(100)) == 100 and pool.refills == 3
+    
+    try:
+        generate_random_bytes(0)
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    print("✓ Random pool wipes consumed bytes")
+
+def test_pool_reseeds_after_fork():
+    """Test that a forked child does not reuse the parent's buffered bytes"""
+    if not hasattr(os, 'fork'):
+        return
+    pool = RandomPool(size=1024)
+    pool.read(16)
+    
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, pool.read(16) + bytes([pool.refills]))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    child = os.read(read_fd, 17)
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+    
+    assert child[16] == 2, "Child should refill instead of using inherited bytes"
+    assert child[:16] != pool.read(16)
+    print("✓ Random pool reseeds after fork")
+
+def test_pool_thread_safety():
+    """Test that concurrent readers never receive the same bytes"""
+    import threading
+    pool = RandomPool(size=4096)
+    results = []
+    
+    def worker():
+        results.extend(pool.read(16) for _ in range(500))
+    
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(set(results)) == 2000
+    print("✓ Random pool is thread-safe")
+
+def test_ctr_drbg_known_answer():
+    """Test CTR_DRBG against a NIST CAVP vector (AES-128, no df, no prediction resistance)"""
+    entropy = iter([
+        bytes.fromhex("ed1e7f21ef66ea5d8e2a85b9337245445b71d6393a4eecb0e63c193d0f72f9a9"),
+        bytes.fromhex("303fb519f0a4e17d6df0b6426aa0ecb2a36079bd48be47ad2a8dbfe48da3efad"),
+    ])
+    drbg = CtrDrbg(key_size=16, entropy_source=lambda n: next(entropy))
+    drbg.reseed()
+    drbg.generate(64)
+    
+    expected = ("f80111d08e874672f32f42997133a5210f7a9375e22cea70587f9cfafebe0f6a"
+                "6aa2eb68e7dd9164536d53fa020fcab20f54caddfab7d6d91e5ffec1dfd8deaa")
+    assert drbg.generate(64).hex() == expected
+    print("✓ CTR_DRBG matches the NIST known answer")
+
+def test_ctr_drbg_reseeding():
+    """Test reseed interval, prediction resistance and input validation"""
+    drbg = CtrDrbg(reseed_interval=2)
+    for _ in range(5):
+        drbg.generate(16)
+    assert drbg.reseeds == 2
+    
+    drbg = CtrDrbg(prediction_resistance=True)
+    drbg.generate(16)
+    drbg.generate(200000)
+    # Every internal request (at most 64 KB) reseeds first
+    assert drbg.reseeds == 1 + 4
+    
+    for bad in [lambda: CtrDrbg(key_size=20), lambda: drbg.generate(0),
+                lambda: drbg.generate(16, b"x" * 49)]:
+        try:
+            bad()
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    print("✓ CTR_DRBG reseeding works")
+
+def test_ctr_drbg_output():
+    """Test that DRBG output is unique, fills buffers and has balanced bits"""
+    drbg = CtrDrbg()
+    buffer = bytearray(100003)
+    drbg.generate_into(buffer)
+    assert buffer.count(0) < 1000
+    
+    values = {generate_drbg_bytes(16) for _ in range(1000)}
+    assert len(values) == 1000
+    assert len(generate_drbg_bytes(200000)) == 200000
+    
+    data = generate_drbg_bytes(100000)
+    ones = sum(bin(byte).count('1') for byte in data) / (len(data) * 8)
+    assert 0.49 < ones < 0.51, f"Poor bit distribution: {ones}"
+    print("✓ CTR_DRBG output looks random")
+
 if __name__ == "__main__":
     print("Testing CSPRNG...")
     test_key_uniqueness()
     test_randomness_basic()
     test_nist_preparation()
+    test_pool_wipes_consumed_bytes()
+    test_pool_reseeds_after_fork()
+    test_pool_thread_safety()
+    test_ctr_drbg_known_answer()
+    test_ctr_drbg_reseeding()
+    test_ctr_drbg_output()
     print("All CSPRNG tests passed! ✓")
\ No newline at end of file
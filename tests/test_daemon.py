@@ -0,0 +1,164 @@
+import sys
+import os
+import tempfile
+import shutil
+import threading
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.daemon import CryptoDaemon
+from cryptocore.client import DaemonClient
+from cryptocore.crypto import encrypt_file
+from cryptocore.file_utils import read_file, write_file
+from cryptocore.modes import cbc_encrypt, ctr_encrypt
+from cryptocore.protocol import DEFAULT_SOCKET_PATH, prepare_socket_dir, peer_uid
+
+KEY = bytes.fromhex("00112233445566778899aabbccddeeff")
+IV = bytes.fromhex("000102030405060708090a0b0c0d0e0f")
+
+class RunningDaemon:
+    """Daemon serving on a temporary socket in a background thread"""
+    
+    def __enter__(self):
+        self.workdir = tempfile.mkdtemp()
+        self.server = CryptoDaemon(os.path.join(self.workdir, 'daemon.sock'))
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.server
+    
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.workdir)
+
+def test_daemon_roundtrip_all_modes():
+    with RunningDaemon() as server, DaemonClient(server.socket_path) as client:
+        for mode in ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']:
+            for data in [b"", b"short", os.urandom(16), os.urandom(300001)]:
+                ciphertext = client.encrypt(data, mode, KEY)
+                assert client.decrypt(ciphertext, mode, KEY) == data, (mode, len(data))
+    print("Daemon roundtrip test passed")
+
+def test_daemon_matches_mode_functions():
+    with RunningDaemon() as server, DaemonClient(server.socket_path) as client:
+        data = os.urandom(5000)
+        assert client.encrypt(data, 'cbc', KEY, IV) == IV + cbc_encrypt(data, KEY, IV)
+        assert client.decrypt(ctr_encrypt(data, KEY, IV), 'ctr', KEY, IV) == data
+    print("Daemon vs mode functions test passed")
+
+def test_daemon_streams_chunks():
+    with RunningDaemon() as server, DaemonClient(server.socket_path) as client:
+        workdir = tempfile.mkdtemp()
+        try:
+            source = os.path.join(workdir, 'plain.bin')
+            encrypted = os.path.join(workdir, 'plain.enc')
+            data = os.urandom(1000003)
+            write_file(source, data)
+            encrypt_file('aes', 'cfb', KEY.hex(), source, encrypted)
+            
+            # Odd-sized chunks, IV split across the first two chunks
+            ciphertext = read_file(encrypted)
+            chunks = [ciphertext[:7], ciphertext[7:70000], ciphertext[70000:]]
+            pieces = list(client.stream('decrypt', 'cfb', KEY, iter(chunks)))
+            assert len(pieces) > 2
+            assert b''.join(pieces) == data
+        finally:
+            shutil.rmtree(workdir)
+    print("Daemon streaming test passed")
+
+def test_daemon_errors_keep_connection_usable():
+    with RunningDaemon() as server, DaemonClient(server.socket_path, pool_size=1) as client:
+        for bad in [lambda: client.decrypt(os.urandom(20), 'cbc', KEY),
+                    lambda: client.decrypt(b"short", 'ctr', KEY),
+                    lambda: client.encrypt(b"data", 'cbc', b"short key")]:
+            try:
+                bad()
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+        
+        assert len(client._idle) == 1
+        assert client.decrypt(client.encrypt(b"still works", 'ctr', KEY), 'ctr', KEY) == b"still works"
+        assert len(client._idle) == 1
+    print("Daemon error handling test passed")
+
+def test_daemon_concurrent_clients():
+    with RunningDaemon() as server, DaemonClient(server.socket_path, pool_size=4) as client:
+        errors = []
+        
+        def worker():
+            try:
+                for _ in range(20):
+                    data = os.urandom(3000)
+                    assert client.decrypt(client.encrypt(data, 'ctr', KEY), 'ctr', KEY) == data
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert not errors, errors
+    print("Daemon concurrent clients test passed")
+
+def test_daemon_reuses_cached_key_schedule():
+    from cryptocore.cipher_cache import cache_stats
+    with RunningDaemon() as server, DaemonClient(server.socket_path) as client:
+        client.encrypt(b"warm up", 'cbc', KEY)
+        hits = cache_stats()['hits']
+        for _ in range(5):
+            client.encrypt(b"again", 'cbc', KEY)
+        assert cache_stats()['hits'] >= hits + 5
+    print("Daemon cipher cache test passed")
+
+def test_socket_directory_is_private():
+    # The default socket never sits directly in the shared temp directory
+    assert os.path.dirname(DEFAULT_SOCKET_PATH) != tempfile.gettempdir()
+    
+    workdir = tempfile.mkdtemp()
+    try:
+        socket_dir = os.path.join(workdir, 'run')
+        prepare_socket_dir(socket_dir)
+        assert os.stat(socket_dir).st_mode & 0o777 == 0o700
+        
+        os.chmod(socket_dir, 0o755)
+        try:
+            prepare_socket_dir(socket_dir)
+            assert False, "Expected RuntimeError"
+        except RuntimeError:
+            pass
+    finally:
+        shutil.rmtree(workdir)
+    print("Socket directory test passed")
+
+def test_client_checks_daemon_user():
+    import socket
+    left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        assert peer_uid(left, None) == os.getuid()
+    finally:
+        left.close()
+        right.close()
+    
+    with RunningDaemon() as server, DaemonClient(server.socket_path) as client:
+        assert client.decrypt(client.encrypt(b"same user", 'ctr', KEY), 'ctr', KEY) == b"same user"
+    print("Daemon user check test passed")
+
+def run_all_tests():
+    print("Starting daemon tests")
+    
+    test_daemon_roundtrip_all_modes()
+    test_daemon_matches_mode_functions()
+    test_daemon_streams_chunks()
+    test_daemon_errors_keep_connection_usable()
+    test_daemon_concurrent_clients()
+    test_daemon_reuses_cached_key_schedule()
+    test_socket_directory_is_private()
+    test_client_checks_daemon_user()
+    
+    print("All daemon tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
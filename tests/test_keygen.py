@@ -0,0 +1,80 @@
+import sys
+import os
+import io
+import stat
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.csprng import generate_keys, iter_key_batches
+from cryptocore.keygen import write_keys, main as keygen_main
+
+def test_generate_keys():
+    keys = generate_keys(1000, 32)
+    assert len(keys) == 1000
+    assert all(len(key) == 32 for key in keys)
+    assert len(set(keys)) == 1000
+    
+    for bad in [(0, 16), (5, 0)]:
+        try:
+            generate_keys(*bad)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    print("Generate keys test passed")
+
+def test_key_batches():
+    # 100 keys of 16 bytes in batches of at most 3 keys (50 bytes // 16)
+    batches = list(iter_key_batches(100, 16, batch_size=50))
+    assert len(batches) == 34
+    assert all(len(batch) % 16 == 0 and len(batch) <= 48 for batch in batches)
+    assert sum(len(batch) for batch in batches) == 1600
+    print("Key batches test passed")
+
+def test_write_keys_formats():
+    out = io.BytesIO()
+    written = write_keys(out, 500, 24, 'hex', batch_size=1000)
+    lines = out.getvalue().decode('ascii').splitlines()
+    assert written == len(out.getvalue()) == 500 * 49
+    assert len(lines) == 500 and len(set(lines)) == 500
+    assert all(len(bytes.fromhex(line)) == 24 for line in lines)
+    
+    out = io.BytesIO()
+    assert write_keys(out, 500, 16, 'raw', batch_size=1000) == 8000
+    assert len(out.getvalue()) == 8000
+    
+    try:
+        write_keys(io.BytesIO(), 1, 16, 'base64')
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    print("Write keys formats test passed")
+
+def test_keygen_command():
+    workdir = tempfile.mkdtemp()
+    try:
+        output = os.path.join(workdir, 'keys.txt')
+        assert keygen_main(['--count', '2000', '--size', '32', '--output', output]) == 0
+        with open(output) as f:
+            lines = f.read().splitlines()
+        assert len(lines) == 2000 and len(set(lines)) == 2000
+        assert all(len(line) == 64 for line in lines)
+        # Key files are private to the owner
+        assert stat.S_IMODE(os.stat(output).st_mode) == 0o600
+    finally:
+        shutil.rmtree(workdir)
+    print("Keygen command test passed")
+
+def run_all_tests():
+    print("Starting keygen tests")
+    
+    test_generate_keys()
+    test_key_batches()
+    test_write_keys_formats()
+    test_keygen_command()
+    
+    print("All keygen tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
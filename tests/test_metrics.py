@@ -0,0 +1,184 @@
+import sys
+import os
+import socket
+import tempfile
+import shutil
+import urllib.request
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.metrics import (MetricsRegistry, collect_engine_stats, set_registry, write_metrics,
+                     serve_metrics, parse_address)
+from cryptocore.crypto import encrypt_file, decrypt_file
+from cryptocore.batch import run_batch
+from cryptocore.file_utils import write_file
+from cryptocore.utils import PaddingError, pkcs7_unpad
+
+KEY_HEX = "00112233445566778899aabbccddeeff"
+WRONG_KEY_HEX = "ffeeddccbbaa99887766554433221100"
+
+class FreshRegistry:
+    """Route engine metrics to a new registry for the duration of a test"""
+    
+    def __enter__(self):
+        self.registry = MetricsRegistry()
+        self.registry.register_collector(collect_engine_stats)
+        self.previous = set_registry(self.registry)
+        return self.registry
+    
+    def __exit__(self, *exc_info):
+        set_registry(self.previous)
+
+def test_registry_rendering():
+    registry = MetricsRegistry()
+    requests = registry.counter('demo_requests_total', 'Requests', ('path',))
+    requests.inc(path='/a')
+    requests.inc(2, path='/a"b')
+    assert registry.counter('demo_requests_total', 'Requests', ('path',)) is requests
+    latency = registry.histogram('demo_seconds', 'Latency', buckets=(0.1, 1.0))
+    for value in [0.05, 0.5, 5.0]:
+        latency.observe(value)
+    
+    text = registry.render()
+    assert '# TYPE demo_requests_total counter' in text
+    assert 'demo_requests_total{path="/a"} 1' in text
+    assert 'demo_requests_total{path="/a\\"b"} 2' in text
+    assert 'demo_seconds_bucket{le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{le="1"} 2' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 3' in text
+    assert 'demo_seconds_count 3' in text
+    assert text.endswith('\n')
+    
+    for bad in [lambda: requests.inc(), lambda: requests.inc(-1, path='/a'),
+                lambda: registry.histogram('demo_requests_total', 'Clash', ('path',)),
+                lambda: registry.counter('demo_requests', 'No suffix')]:
+        try:
+            bad()
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    print("Registry rendering test passed")
+
+def test_engine_instrumentation():
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, 'plain.bin')
+        encrypted = os.path.join(workdir, 'plain.enc')
+        decrypted = os.path.join(workdir, 'plain.dec')
+        write_file(source, os.urandom(5000))
+        
+        with FreshRegistry() as registry:
+            encrypt_file('aes', 'cbc', KEY_HEX, source, encrypted)
+            decrypt_file('aes', 'cbc', KEY_HEX, encrypted, decrypted)
+            try:
+                decrypt_file('aes', 'cbc', WRONG_KEY_HEX, encrypted, decrypted)
+                assert False, "Expected ValueError"
+            except ValueError:
+                pass
+            try:
+                decrypt_file('aes', 'cbc', KEY_HEX, os.path.join(workdir, 'missing'), decrypted)
+                assert False, "Expected an error"
+            except Exception:
+                pass
+            
+            bytes_total = registry.counter('cryptocore_bytes_total', '', ('operation', 'mode'))
+            assert bytes_total.value(operation='encrypt', mode='cbc') == 5000
+            assert bytes_total.value(operation='decrypt', mode='cbc') == 5024
+            latency = registry.histogram('cryptocore_operation_seconds', '', ('operation', 'mode'))
+            assert latency.count(operation='encrypt', mode='cbc') == 1
+            errors = registry.counter('cryptocore_errors_total', '', ('operation', 'type'))
+            assert errors.value(operation='decrypt', type='PaddingError') == 1
+            assert errors.value(operation='decrypt', type='FileNotFoundError') == 1
+            
+            text = registry.render()
+            assert 'cryptocore_cipher_cache_hits_total' in text
+            assert 'cryptocore_random_pool_refills_total{source="os"}' in text
+    finally:
+        shutil.rmtree(workdir)
+    print("Engine instrumentation test passed")
+
+def test_batch_instrumentation():
+    workdir = tempfile.mkdtemp()
+    try:
+        inputs = []
+        for i in range(3):
+            path = os.path.join(workdir, f'file{i}.bin')
+            write_file(path, os.urandom(1000 + i))
+            inputs.append((path, f'file{i}.bin'))
+        inputs.append((os.path.join(workdir, 'missing.bin'), 'missing.bin'))
+        
+        with FreshRegistry() as registry:
+            summary = run_batch('encrypt', 'ctr', bytes.fromhex(KEY_HEX), inputs, os.path.join(workdir, 'out'))
+            assert summary.files == 3 and len(summary.failures) == 1
+            operations = registry.counter('cryptocore_operations_total', '', ('operation', 'mode'))
+            assert operations.value(operation='encrypt', mode='ctr') == 3
+            errors = registry.counter('cryptocore_errors_total', '', ('operation', 'type'))
+            assert errors.value(operation='encrypt', type='FileNotFoundError') == 1
+    finally:
+        shutil.rmtree(workdir)
+    print("Batch instrumentation test passed")
+
+def test_padding_error_type():
+    try:
+        pkcs7_unpad(bytes(16))
+        assert False, "Expected PaddingError"
+    except PaddingError as e:
+        assert isinstance(e, ValueError)
+    print("Padding error type test passed")
+
+def test_metrics_outputs():
+    workdir = tempfile.mkdtemp()
+    registry = MetricsRegistry()
+    registry.counter('demo_total', 'Demo').inc(5)
+    try:
+        path = os.path.join(workdir, 'cryptocore.prom')
+        write_metrics(path, registry)
+        with open(path) as f:
+            assert 'demo_total 5' in f.read()
+        assert os.listdir(workdir) == ['cryptocore.prom']
+        
+        socket_path = os.path.join(workdir, 'metrics.sock')
+        assert parse_address(socket_path) == socket_path
+        assert parse_address('localhost:9100') == ('localhost', 9100)
+        server = serve_metrics(socket_path, registry)
+        try:
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            client.connect(socket_path)
+            data = b''
+            while True:
+                piece = client.recv(4096)
+                if not piece:
+                    break
+                data += piece
+            client.close()
+            assert b'demo_total 5' in data
+        finally:
+            server.shutdown()
+            server.server_close()
+        
+        server = serve_metrics(('127.0.0.1', 0), registry)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url, timeout=10) as response:
+                assert response.headers['Content-Type'].startswith('text/plain')
+                assert b'demo_total 5' in response.read()
+        finally:
+            server.shutdown()
+            server.server_close()
+    finally:
+        shutil.rmtree(workdir)
+    print("Metrics outputs test passed")
+
+def run_all_tests():
+    print("Starting metrics tests")
+    
+    test_registry_rendering()
+    test_engine_instrumentation()
+    test_batch_instrumentation()
+    test_padding_error_type()
+    test_metrics_outputs()
+    
+    print("All metrics tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
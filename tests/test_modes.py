@@ -3,7 +3,8 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from modes import *
+from cryptocore.modes import *
+from cryptocore.parallel import PARALLEL_THRESHOLD
 
 def test_ecb_mode():
     key = b'\x00' * 16
@@ -17,6 +18,26 @@ def test_ecb_mode():
     
     print("ECB mode test passed")
 
+def per_block_ecb_encrypt(plaintext, key):
+    from Crypto.Cipher import AES
+    from cryptocore.utils import pkcs7_pad
+    cipher = AES.new(key, AES.MODE_ECB)
+    padded = pkcs7_pad(plaintext)
+    out = bytearray(len(padded))
+    for i in range(0, len(padded), 16):
+        out[i:i+16] = cipher.encrypt(padded[i:i+16])
+    return bytes(out)
+
+def test_ecb_bulk_matches_per_block():
+    key = b'\x08' * 16
+    # Crosses a bulk chunk boundary
+    test_data = os.urandom(ECB_CHUNK_SIZE + 100)
+    
+    encrypted = ecb_encrypt(test_data, key)
+    assert encrypted == per_block_ecb_encrypt(test_data, key)
+    assert ecb_decrypt(encrypted, key) == test_data
+    print("ECB bulk path test passed")
+
 def test_cbc_mode():
     key = b'\x01' * 16
     iv = b'\xff' * 16
@@ -28,6 +49,26 @@ def test_cbc_mode():
     assert decrypted == test_data
     print("CBC mode test passed")
 
+def test_cbc_bulk_decrypt():
+    key = b'\x0a' * 16
+    iv = os.urandom(16)
+    # Crosses a bulk chunk boundary
+    test_data = os.urandom(ECB_CHUNK_SIZE * 2 + 5)
+    
+    encrypted = cbc_encrypt(test_data, key, iv)
+    assert cbc_decrypt(encrypted, key, iv) == test_data
+    print("CBC bulk decryption test passed")
+
+def test_cbc_parallel_decrypt():
+    key = b'\x0b' * 16
+    iv = os.urandom(16)
+    test_data = os.urandom(PARALLEL_THRESHOLD + 1000)
+    
+    encrypted = cbc_encrypt(test_data, key, iv)
+    assert cbc_decrypt(encrypted, key, iv, jobs=3) == test_data
+    assert cbc_decrypt(encrypted, key, iv, jobs=3) == cbc_decrypt(encrypted, key, iv)
+    print("CBC parallel decryption test passed")
+
 def test_cfb_mode():
     key = b'\x02' * 16
     iv = b'\xfe' * 16
@@ -40,6 +81,27 @@ def test_cfb_mode():
     assert len(encrypted) == len(test_data)
     print("CFB mode test passed")
 
+def test_cfb_bulk_decrypt():
+    key = b'\x0c' * 16
+    iv = os.urandom(16)
+    
+    # Partial final blocks and chunk boundaries must match cfb_encrypt
+    for length in [1, 16, 33, ECB_CHUNK_SIZE, ECB_CHUNK_SIZE + 7]:
+        test_data = os.urandom(length)
+        encrypted = cfb_encrypt(test_data, key, iv)
+        assert cfb_decrypt(encrypted, key, iv) == test_data
+    
+    print("CFB bulk decryption test passed")
+
+def test_cfb_parallel_decrypt():
+    key = b'\x0d' * 16
+    iv = os.urandom(16)
+    test_data = os.urandom(PARALLEL_THRESHOLD + 1001)
+    
+    encrypted = cfb_encrypt(test_data, key, iv)
+    assert cfb_decrypt(encrypted, key, iv, jobs=3) == test_data
+    print("CFB parallel decryption test passed")
+
 def test_ofb_mode():
     key = b'\x03' * 16
     iv = b'\xfd' * 16
@@ -64,6 +126,38 @@ def test_ctr_mode():
     assert len(encrypted) == len(test_data)
     print("CTR mode test passed")
 
+def reference_ctr(data, key, iv):
+    from Crypto.Cipher import AES
+    cipher = AES.new(key, AES.MODE_ECB)
+    counter = int.from_bytes(iv, 'big')
+    result = b''
+    for i in range(0, len(data), 16):
+        value = (counter + i // 16) % (1 << 128)
+        keystream = cipher.encrypt(value.to_bytes(16, 'big'))
+        result += bytes(a ^ b for a, b in zip(data[i:i+16], keystream))
+    return result
+
+def test_ctr_bulk_keystream():
+    key = b'\x06' * 16
+    iv = b'\x00' * 15 + b'\x07'
+    # Spans several bulk keystream calls and ends on a partial block
+    test_data = os.urandom(CTR_SPAN_BLOCKS * 16 * 2 + 37)
+    
+    encrypted = ctr_encrypt(test_data, key, iv)
+    assert encrypted == reference_ctr(test_data, key, iv)
+    assert ctr_decrypt(encrypted, key, iv) == test_data
+    print("CTR bulk keystream test passed")
+
+def test_ctr_counter_wraps():
+    key = b'\x07' * 16
+    iv = b'\xff' * 16
+    test_data = b"Counter wraps around after the first block"
+    
+    encrypted = ctr_encrypt(test_data, key, iv)
+    assert encrypted == reference_ctr(test_data, key, iv)
+    assert ctr_decrypt(encrypted, key, iv) == test_data
+    print("CTR counter wrap test passed")
+
 def test_modes_with_different_lengths():
     key = b'\x05' * 16
     iv = b'\xfb' * 16
@@ -101,10 +195,17 @@ def run_all_tests():
     print("Starting mode tests")
     
     test_ecb_mode()
+    test_ecb_bulk_matches_per_block()
     test_cbc_mode()
+    test_cbc_bulk_decrypt()
+    test_cbc_parallel_decrypt()
     test_cfb_mode()
+    test_cfb_bulk_decrypt()
+    test_cfb_parallel_decrypt()
     test_ofb_mode()
     test_ctr_mode()
+    test_ctr_bulk_keystream()
+    test_ctr_counter_wraps()
     test_modes_with_different_lengths()
     
     print("All mode tests passed successfully")
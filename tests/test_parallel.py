@@ -0,0 +1,46 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.parallel import split_blocks, resolve_jobs, run_parallel
+
+def square(value):
+    return value * value
+
+def test_split_blocks_alignment():
+    for length in [1, 15, 16, 17, 160, 1000, 4096 + 3]:
+        for parts in [1, 2, 3, 7, 64]:
+            ranges = split_blocks(length, parts)
+            assert ranges[0][0] == 0
+            assert ranges[-1][1] == length
+            for (start, end), (next_start, _) in zip(ranges, ranges[1:]):
+                assert end == next_start
+                assert end % 16 == 0
+            assert len(ranges) <= parts
+    
+    print("Block-aligned split test passed")
+
+def test_resolve_jobs():
+    assert resolve_jobs(4) == 4
+    assert resolve_jobs(0) >= 1
+    assert resolve_jobs(None) >= 1
+    print("Job count resolution test passed")
+
+def test_run_parallel_preserves_order():
+    tasks = list(range(20))
+    assert run_parallel(square, tasks, 3) == [value * value for value in tasks]
+    assert run_parallel(square, tasks, 1) == [value * value for value in tasks]
+    print("Parallel run order test passed")
+
+def run_all_tests():
+    print("Starting parallel tests")
+    
+    test_split_blocks_alignment()
+    test_resolve_jobs()
+    test_run_parallel_preserves_order()
+    
+    print("All parallel tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,108 @@
+import sys
+import os
+import io
+import pstats
+import tempfile
+import shutil
+import contextlib
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.profiler import profile_call, profile_iter, stage, start_profiling, stop_profiling
+from cryptocore.crypto import encrypt_file, decrypt_file
+from cryptocore.file_utils import read_file, write_file
+
+KEY_HEX = "00112233445566778899aabbccddeeff"
+
+def profiled(function, *args, **kwargs):
+    """Run profile_call with its report captured; returns (result, report lines)"""
+    report = io.StringIO()
+    with contextlib.redirect_stderr(report):
+        result = profile_call(function, *args, **kwargs)
+    return result, report.getvalue().splitlines()
+
+def test_disabled_profiler_is_passthrough():
+    chunks = [b"a", b"b"]
+    assert profile_iter('read', chunks) is chunks
+    assert stage('read') is stage('write')
+    with stage('read'):
+        pass
+    print("Disabled profiler test passed")
+
+def test_stage_report():
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, 'plain.bin')
+        encrypted = os.path.join(workdir, 'plain.enc')
+        decrypted = os.path.join(workdir, 'plain.dec')
+        data = os.urandom(300001)
+        write_file(source, data)
+        
+        started = start_profiling(track_allocations=True)
+        try:
+            encrypt_file('aes', 'cbc', KEY_HEX, source, encrypted, io_mode='buffered')
+            decrypt_file('aes', 'cbc', KEY_HEX, encrypted, decrypted, io_mode='buffered')
+        finally:
+            stopped = stop_profiling()
+        
+        assert stopped is started
+        assert read_file(decrypted) == data
+        stages = {row['stage']: row for row in stopped.report()}
+        for name in ['read', 'encrypt', 'decrypt', 'pad', 'unpad', 'write']:
+            assert stages[name]['calls'] >= 1, name
+        assert stages['encrypt']['bytes'] == len(data) - len(data) % 16 + 16
+        assert stages['write']['bytes'] == 2 * len(data) + 32 - len(data) % 16
+        # Exclusive stage times never exceed the profiled wall time
+        assert sum(row['wall_s'] for row in stages.values()) <= stopped.wall
+        lines = stopped.format_report()
+        assert any(line.startswith("[PROFILE] encrypt") for line in lines)
+        assert "peak KB" in lines[0]
+    finally:
+        shutil.rmtree(workdir)
+    print("Stage report test passed")
+
+def test_profile_outputs():
+    workdir = tempfile.mkdtemp()
+    try:
+        def work():
+            total = 0
+            for _ in range(200000):
+                total += 1
+            return total
+        
+        stats_file = os.path.join(workdir, 'run.pstats')
+        result, lines = profiled(work, output=stats_file)
+        assert result == 200000
+        assert lines[0].startswith("[PROFILE] stage") and lines[-1].startswith("[INFO] Profile written")
+        names = [function for _, _, function in pstats.Stats(stats_file).stats]
+        assert 'work' in names
+        
+        folded = os.path.join(workdir, 'run.folded')
+        profiled(lambda: sum(i * i for i in range(3000000)), output=folded, output_format='collapsed')
+        with open(folded) as f:
+            lines = f.read().splitlines()
+        assert lines
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            assert int(count) > 0 and 'profiler.py:profile_call' in stack
+        
+        try:
+            profile_call(work, output_format='svg')
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    finally:
+        shutil.rmtree(workdir)
+    print("Profile outputs test passed")
+
+def run_all_tests():
+    print("Starting profiler tests")
+    
+    test_disabled_profiler_is_passthrough()
+    test_stage_report()
+    test_profile_outputs()
+    
+    print("All profiler tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
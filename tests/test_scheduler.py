@@ -0,0 +1,108 @@
+import sys
+import os
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.scheduler import run_scheduled, pack_files
+from cryptocore.batch import run_batch
+from cryptocore.file_utils import collect_files, read_file, write_file
+
+KEY = bytes.fromhex("00112233445566778899aabbccddeeff")
+
+def make_tree(root):
+    contents = {
+        'huge.bin': os.urandom(70000),
+        'large.bin': os.urandom(20001),
+        os.path.join('small', 'a.txt'): b"tiny",
+        os.path.join('small', 'b.txt'): os.urandom(300),
+        os.path.join('small', 'c.txt'): b"",
+        os.path.join('small', 'd.txt'): os.urandom(1000),
+    }
+    for name, data in contents.items():
+        write_file(os.path.join(root, name), data)
+    return contents
+
+def test_pack_files():
+    entries = [(5000, 'big', 'big.enc'), (400, 'a', 'a.enc'), (300, 'b', 'b.enc'),
+               (200, 'c', 'c.enc'), (0, 'd', 'd.enc')]
+    groups = pack_files(entries, small_size=1000, pack_size=600)
+    
+    assert groups == [
+        (5000, [('big', 'big.enc')]),
+        (700, [('a', 'a.enc'), ('b', 'b.enc')]),
+        (200, [('c', 'c.enc'), ('d', 'd.enc')]),
+    ]
+    print("Pack files test passed")
+
+def test_scheduled_roundtrip_all_modes():
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, 'in')
+        contents = make_tree(source)
+        # Small thresholds so the huge file is split and small files are packed
+        limits = dict(split_size=50000, small_size=2000, pack_size=1024)
+        
+        for mode in ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']:
+            encrypted_dir = os.path.join(workdir, mode, 'enc')
+            decrypted_dir = os.path.join(workdir, mode, 'dec')
+            
+            summary = run_scheduled('encrypt', mode, KEY, collect_files([source]), encrypted_dir, jobs=2, **limits)
+            assert summary.files == len(contents) and not summary.failures, summary.failures
+            
+            summary = run_scheduled('decrypt', mode, KEY, collect_files([encrypted_dir]), decrypted_dir, jobs=2, **limits)
+            assert summary.files == len(contents) and not summary.failures, summary.failures
+            
+            for name, data in contents.items():
+                assert read_file(os.path.join(decrypted_dir, name + '.enc.dec')) == data, (mode, name)
+        
+        print("Scheduled roundtrip test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def test_scheduled_matches_serial_batch():
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, 'in')
+        contents = make_tree(source)
+        run_batch('encrypt', 'ecb', KEY, collect_files([source]), os.path.join(workdir, 'serial'))
+        run_scheduled('encrypt', 'ecb', KEY, collect_files([source]), os.path.join(workdir, 'scheduled'),
+                      jobs=2, split_size=50000)
+        
+        for name in contents:
+            assert (read_file(os.path.join(workdir, 'serial', name + '.enc')) ==
+                    read_file(os.path.join(workdir, 'scheduled', name + '.enc'))), name
+        print("Scheduled vs serial batch test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def test_scheduled_records_failures():
+    workdir = tempfile.mkdtemp()
+    try:
+        bad_split = os.path.join(workdir, 'bad_split.enc')
+        bad_small = os.path.join(workdir, 'bad_small.enc')
+        write_file(bad_split, os.urandom(60001))
+        write_file(bad_small, os.urandom(40))
+        inputs = [(bad_split, 'bad_split'), (bad_small, 'bad_small'), (os.path.join(workdir, 'missing'), 'missing')]
+        
+        summary = run_scheduled('decrypt', 'cbc', KEY, inputs, os.path.join(workdir, 'out'), jobs=2, split_size=50000)
+        assert summary.files == 0
+        assert sorted(path for path, _ in summary.failures) == sorted(path for path, _ in inputs)
+        assert not os.listdir(os.path.join(workdir, 'out'))
+        print("Scheduled failure recording test passed")
+    finally:
+        shutil.rmtree(workdir)
+
+def run_all_tests():
+    print("Starting scheduler tests")
+    
+    test_pack_files()
+    test_scheduled_roundtrip_all_modes()
+    test_scheduled_matches_serial_batch()
+    test_scheduled_records_failures()
+    
+    print("All scheduler tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
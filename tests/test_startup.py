@@ -0,0 +1,44 @@
+import sys
+import os
+import subprocess
+
+SRC = os.path.join(os.path.dirname(__file__), '..', 'src')
+MAIN = os.path.join(SRC, 'main.py')
+
+def loaded_modules(statement):
+    """Modules present in a fresh interpreter after running statement with src on sys.path"""
+    code = f"import sys; sys.path.insert(0, {SRC!r}); {statement}; print(' '.join(sys.modules))"
+    completed = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return set(completed.stdout.split())
+
+def test_cli_startup_is_lazy():
+    modules = loaded_modules("import cryptocore.main")
+    for heavy in ['cryptocore.crypto', 'cryptocore.modes', 'cryptocore.cipher_cache', 'Crypto',
+                  'multiprocessing', 'concurrent.futures']:
+        assert heavy not in modules, heavy
+    print("Lazy CLI startup test passed")
+
+def test_engine_skips_process_pools():
+    modules = loaded_modules("import cryptocore.crypto")
+    assert 'cryptocore.crypto' in modules and 'Crypto.Cipher.AES' in modules
+    assert 'multiprocessing' not in modules and 'concurrent.futures' not in modules
+    print("Engine import test passed")
+
+def test_help_and_usage_errors():
+    completed = subprocess.run([sys.executable, MAIN, '--help'], capture_output=True, text=True)
+    assert completed.returncode == 0 and 'usage:' in completed.stdout
+    completed = subprocess.run([sys.executable, MAIN], capture_output=True, text=True)
+    assert completed.returncode == 2 and 'required' in completed.stderr
+    print("Help and usage error test passed")
+
+def run_all_tests():
+    print("Starting startup tests")
+    
+    test_cli_startup_is_lazy()
+    test_engine_skips_process_pools()
+    test_help_and_usage_errors()
+    
+    print("All startup tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,99 @@
+import sys
+import os
+import subprocess
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.cli import parse_arguments
+
+MAIN = os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py')
+KEY_HEX = "00112233445566778899aabbccddeeff"
+
+def cryptocore(*args, data=b''):
+    return subprocess.run([sys.executable, MAIN, '--algorithm', 'aes', '--key', KEY_HEX] + list(args),
+                          input=data, capture_output=True)
+
+def test_pipeline_roundtrip():
+    data = os.urandom(300001)
+    for mode in ['ecb', 'cbc', 'cfb', 'ofb', 'ctr']:
+        encrypted = cryptocore('--mode', mode, '--encrypt', '--input', '-', data=data)
+        assert encrypted.returncode == 0, encrypted.stderr
+        # Status lines go to stderr, so stdout is pure ciphertext
+        assert b'[SUCCESS]' in encrypted.stderr
+        decrypted = cryptocore('--mode', mode, '--decrypt', '--input', '-', data=encrypted.stdout)
+        assert decrypted.returncode == 0, decrypted.stderr
+        assert decrypted.stdout == data, mode
+    print("Pipeline roundtrip test passed")
+
+def test_files_and_pipes_interoperate():
+    workdir = tempfile.mkdtemp()
+    try:
+        source = os.path.join(workdir, 'plain.bin')
+        encrypted = os.path.join(workdir, 'plain.enc')
+        data = os.urandom(70000)
+        with open(source, 'wb') as f:
+            f.write(data)
+        
+        # File written by the file path, decrypted from stdin
+        assert cryptocore('--mode', 'cbc', '--encrypt', '--input', source, '--output', encrypted).returncode == 0
+        with open(encrypted, 'rb') as f:
+            ciphertext = f.read()
+        assert cryptocore('--mode', 'cbc', '--decrypt', '--input', '-', data=ciphertext).stdout == data
+        
+        # Stream written to stdout from a file, decrypted by the file path
+        piped = cryptocore('--mode', 'cbc', '--encrypt', '--input', source, '--output', '-')
+        with open(encrypted, 'wb') as f:
+            f.write(piped.stdout)
+        decrypted = os.path.join(workdir, 'plain.dec')
+        assert cryptocore('--mode', 'cbc', '--decrypt', '--input', encrypted, '--output', decrypted).returncode == 0
+        with open(decrypted, 'rb') as f:
+            assert f.read() == data
+        
+        # A failed decryption from stdin leaves no output file behind
+        failed = cryptocore('--mode', 'cbc', '--decrypt', '--input', '-', '--output', decrypted, data=os.urandom(40))
+        assert failed.returncode == 1 and not os.path.exists(decrypted)
+    finally:
+        shutil.rmtree(workdir)
+    print("Files and pipes interoperate test passed")
+
+def test_first_bytes_before_end_of_input():
+    process = subprocess.Popen([sys.executable, MAIN, '--algorithm', 'aes', '--key', KEY_HEX, '--mode', 'ctr',
+                                '--encrypt', '--input', '-'],
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    try:
+        process.stdin.write(b'x' * 64)
+        process.stdin.flush()
+        # IV and the first whole blocks arrive while stdin is still open
+        first = process.stdout.read(80)
+        assert len(first) == 80
+    finally:
+        process.stdin.close()
+        process.wait(timeout=30)
+    print("Time to first byte test passed")
+
+def test_cli_stdio_arguments():
+    args = parse_arguments(['--algorithm', 'aes', '--mode', 'ctr', '--decrypt', '--key', KEY_HEX, '--input', '-'])
+    assert args.input == '-' and args.output == '-' and not args.batch
+    
+    for argv in [['--input', '-', __file__], ['--input', os.path.dirname(__file__), '--output', '-']]:
+        try:
+            parse_arguments(['--algorithm', 'aes', '--mode', 'ctr', '--encrypt'] + argv)
+            assert False, "Expected a usage error"
+        except SystemExit:
+            pass
+    print("CLI stdio arguments test passed")
+
+def run_all_tests():
+    print("Starting stdio tests")
+    
+    test_pipeline_roundtrip()
+    test_files_and_pipes_interoperate()
+    test_first_bytes_before_end_of_input()
+    test_cli_stdio_arguments()
+    
+    print("All stdio tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
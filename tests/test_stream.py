@@ -0,0 +1,101 @@
+import sys
+import os
+import io
+import random
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.modes import *
+from cryptocore.stream import transform_chunks, transform_stream
+
+KEY = b'\x0e' * 16
+IV = bytes(range(16))
+
+ONE_SHOT = {
+    'ecb': (lambda data: ecb_encrypt(data, KEY), lambda data: ecb_decrypt(data, KEY)),
+    'cbc': (lambda data: cbc_encrypt(data, KEY, IV), lambda data: cbc_decrypt(data, KEY, IV)),
+    'cfb': (lambda data: cfb_encrypt(data, KEY, IV), lambda data: cfb_decrypt(data, KEY, IV)),
+    'ofb': (lambda data: ofb_encrypt(data, KEY, IV), lambda data: ofb_decrypt(data, KEY, IV)),
+    'ctr': (lambda data: ctr_encrypt(data, KEY, IV), lambda data: ctr_decrypt(data, KEY, IV)),
+}
+
+def random_chunks(data, seed):
+    rng = random.Random(seed)
+    position = 0
+    while position < len(data):
+        size = rng.choice([1, 7, 16, 31, 64, 1000])
+        yield data[position:position + size]
+        position += size
+
+def test_stream_matches_one_shot():
+    for length in [0, 1, 15, 16, 17, 100, 5000]:
+        test_data = os.urandom(length)
+        for mode, (encrypt, decrypt) in ONE_SHOT.items():
+            encrypted = b''.join(transform_chunks(random_chunks(test_data, length), 'encrypt', mode, KEY, IV))
+            assert encrypted == encrypt(test_data), (mode, length)
+            
+            decrypted = b''.join(transform_chunks(random_chunks(encrypted, length + 1), 'decrypt', mode, KEY, IV))
+            assert decrypted == test_data, (mode, length)
+    
+    print("Streaming matches one-shot modes")
+
+def test_stream_rejects_bad_ciphertext():
+    for mode in ['ecb', 'cbc']:
+        for bad in [b'', os.urandom(17)]:
+            try:
+                b''.join(transform_chunks([bad], 'decrypt', mode, KEY, IV))
+                assert False, "Unaligned ciphertext should be rejected"
+            except ValueError:
+                pass
+    
+    print("Streaming rejects unaligned ciphertext")
+
+def test_stream_unsupported_mode():
+    try:
+        b''.join(transform_chunks([b'data'], 'encrypt', 'xts', KEY, IV))
+        assert False, "Unsupported mode should be rejected"
+    except ValueError:
+        pass
+    
+    print("Streaming rejects unsupported modes")
+
+def test_transform_stream_matches_one_shot():
+    for length in [0, 15, 16, 5000]:
+        test_data = os.urandom(length)
+        for mode, (encrypt, decrypt) in ONE_SHOT.items():
+            sink = io.BytesIO()
+            assert transform_stream(io.BytesIO(test_data), sink, 'encrypt', mode, KEY, IV, chunk_size=1000) == length
+            head = IV if mode != 'ecb' else b''
+            assert sink.getvalue() == head + encrypt(test_data), (mode, length)
+            
+            # The IV is read from the stream head when none is given
+            decrypted = io.BytesIO()
+            consumed = transform_stream(io.BytesIO(sink.getvalue()), decrypted, 'decrypt', mode, KEY, chunk_size=999)
+            assert consumed == len(sink.getvalue())
+            assert decrypted.getvalue() == test_data, (mode, length)
+    
+    print("Stream objects match one-shot modes")
+
+def test_transform_stream_truncated_iv():
+    for data in [b'', b'short']:
+        try:
+            transform_stream(io.BytesIO(data), io.BytesIO(), 'decrypt', 'ctr', KEY)
+            assert False, "Expected ValueError"
+        except ValueError:
+            pass
+    
+    print("Stream objects reject a truncated IV")
+
+def run_all_tests():
+    print("Starting stream tests")
+    
+    test_stream_matches_one_shot()
+    test_stream_rejects_bad_ciphertext()
+    test_stream_unsupported_mode()
+    test_transform_stream_matches_one_shot()
+    test_transform_stream_truncated_iv()
+    
+    print("All stream tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,69 @@
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from cryptocore.xor import xor_bytes, xor_into
+
+def reference_xor(a, b):
+    return bytes(x ^ y for x, y in zip(a, b))
+
+def test_xor_single_block():
+    a = bytes(range(16))
+    b = b'\xaa' * 16
+    
+    assert xor_bytes(a, b) == reference_xor(a, b)
+    print("Single block XOR test passed")
+
+def test_xor_multi_block_span():
+    a = os.urandom(16 * 1000)
+    b = os.urandom(16 * 1000)
+    
+    assert xor_bytes(a, b) == reference_xor(a, b)
+    assert xor_bytes(memoryview(a), memoryview(b)) == reference_xor(a, b)
+    print("Multi-block span XOR test passed")
+
+def test_xor_partial_tail():
+    keystream = os.urandom(16)
+    
+    for length in [0, 1, 7, 15]:
+        data = os.urandom(length)
+        result = xor_bytes(data, keystream)
+        assert len(result) == length
+        assert result == reference_xor(data, keystream)
+    
+    # Leading zero bytes must survive the integer round trip
+    assert xor_bytes(b'\x00\x00\x01', b'\x00\x00\x00') == b'\x00\x00\x01'
+    print("Partial tail XOR test passed")
+
+def test_xor_into_buffer():
+    data = os.urandom(20)
+    keystream = os.urandom(32)
+    out = bytearray(24)
+    
+    xor_into(memoryview(out)[4:], data, keystream)
+    assert bytes(out[4:]) == reference_xor(data, keystream)
+    assert out[:4] == bytearray(4)
+    print("XOR into buffer test passed")
+
+def test_xor_short_keystream():
+    try:
+        xor_bytes(b'abc', b'ab')
+        assert False, "Short keystream should be rejected"
+    except ValueError:
+        pass
+    print("Short keystream test passed")
+
+def run_all_tests():
+    print("Starting XOR tests")
+    
+    test_xor_single_block()
+    test_xor_multi_block_span()
+    test_xor_partial_tail()
+    test_xor_into_buffer()
+    test_xor_short_keystream()
+    
+    print("All XOR tests passed successfully")
+
+if __name__ == "__main__":
+    run_all_tests()